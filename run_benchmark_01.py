@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks for Task 1
+"""
+
+from tasks import benchmark_linked_list
+
+
+if __name__ == "__main__":
+    benchmark_linked_list()
@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks for Task 3
+"""
+
+from tasks import benchmark_shortest_paths
+
+
+if __name__ == "__main__":
+    benchmark_shortest_paths()
@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks for Task 4
+"""
+
+from tasks import benchmark_heap_tree
+
+
+if __name__ == "__main__":
+    benchmark_heap_tree()
@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmarks for Task 5
+"""
+
+from tasks import benchmark_tree_traversals
+
+
+if __name__ == "__main__":
+    benchmark_tree_traversals()
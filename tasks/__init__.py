@@ -5,10 +5,14 @@ __author__ = 'Roman'
 
 
 from tasks.task_01 import test_linked_list_operations
+from tasks.task_01 import benchmark_cli as benchmark_linked_list
 from tasks.task_02 import cli as test_draw_pythagoras_tree
-from tasks.task_03 import test_dijkstra_heap
+from tasks.task_03 import cli as test_dijkstra_heap
+from tasks.task_03 import benchmark_cli as benchmark_shortest_paths
 from tasks.task_04 import cli as test_heap_visualization
+from tasks.task_04 import benchmark_cli as benchmark_heap_tree
 from tasks.task_05 import cli as test_tree_bfs_dfs_visualization
+from tasks.task_05 import benchmark_cli as benchmark_tree_traversals
 from tasks.task_06 import cli as test_algorithms
 from tasks.task_07 import cli as test_monte_carlo_dices
 
@@ -20,4 +24,8 @@ __all__ = [
     'test_tree_bfs_dfs_visualization',
     'test_algorithms',
     'test_monte_carlo_dices',
+    'benchmark_linked_list',
+    'benchmark_shortest_paths',
+    'benchmark_heap_tree',
+    'benchmark_tree_traversals',
 ]
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+"""
+Timing helper and command line runner shared by the benchmarks of the tasks
+"""
+
+import argparse
+import gc
+import time
+from typing import Any, Callable
+
+
+def timed(func: Callable[[], Any]) -> tuple[Any, float]:
+    """
+    Returns the result of the call and the elapsed time in seconds (garbage collector paused, as in timeit)
+
+    :param func: Function without arguments (Callable, mandatory)
+    :return: Result and elapsed time (Tuple)
+    """
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+    finally:
+        gc.enable()
+    return result, elapsed
+
+
+def run_benchmark_cli(
+        description: str,
+        benchmarks: dict[str, Callable[..., None]],
+        *flags: str,
+        dest: str,
+        default: int,
+        help_text: str,
+) -> None:
+    """
+    Command line of the benchmarks of a task: -b/--benchmark selects one of them (all by default)
+    and the integer option given by flags is passed to every benchmark as the dest keyword argument.
+
+    :param description: Description of the command (String, mandatory)
+    :param benchmarks: Benchmarks by name (Dictionary, mandatory)
+    :param flags: Flags of the size option, e.g. "-n", "--size" (Strings, mandatory)
+    :param dest: Keyword argument of the benchmarks which receives the option (String, mandatory)
+    :param default: Default value of the option (Integer, mandatory)
+    :param help_text: Help of the option (String, mandatory)
+    """
+    try:
+        parser = argparse.ArgumentParser(description=description, epilog="Good bye!")
+        parser.add_argument(
+            "-b", "--benchmark", choices=[*benchmarks, "all"], default="all", help="Benchmark to run (default all)"
+        )
+        parser.add_argument(
+            *flags, dest=dest, metavar=flags[-1].lstrip("-").upper(), type=int, default=default, help=help_text
+        )
+
+        args = parser.parse_args()
+
+        for name, benchmark in benchmarks.items():
+            if args.benchmark in (name, "all"):
+                benchmark(**{dest: getattr(args, dest)})
+    except Exception as e:
+        print(e)
+
+    exit(0)
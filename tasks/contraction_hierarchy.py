@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+
+"""
+Contraction hierarchies for repeated point-to-point shortest path queries on static graphs
+"""
+
+import heapq
+import pickle
+from typing import Any, Optional
+
+import networkx as nx
+
+
+class ContractionHierarchy:
+    """
+    Preprocessed graph (see build_contraction_hierarchy): the vertex ranks and two "upward" graphs as lists of
+    (vertex id, weight) arcs per vertex. The forward graph holds the arcs u -> x with rank[x] > rank[u],
+    the backward graph holds the arcs x -> u with rank[x] > rank[u] stored at u; both include the shortcuts.
+    A shortcut u -> x replaces the path u -> middle -> x, so the paths are unpacked with the middle vertices.
+    The structure consists of lists and dictionaries only and is serialized with pickle (see save and load).
+    """
+
+    def __init__(
+            self,
+            labels: list[Any],
+            rank: list[int],
+            forward: list[list[tuple[int, float]]],
+            backward: list[list[tuple[int, float]]],
+            middles: dict[tuple[int, int], int],
+            directed: bool,
+    ) -> None:
+        self.labels = labels
+        self.node_ids = {label: i for i, label in enumerate(labels)}
+        self.rank = rank
+        self.forward = forward
+        self.backward = backward
+        self.middles = middles
+        self.directed = directed
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def __repr__(self) -> str:
+        kind = "directed" if self.directed else "undirected"
+        arcs = sum(map(len, self.forward)) + sum(map(len, self.backward))
+        return (f"{self.__class__.__name__}({len(self.labels)} vertices, {arcs} upward arcs, "
+                f"{len(self.middles)} shortcuts, {kind})")
+
+    def __getstate__(self) -> dict[str, Any]:
+        # node_ids is rebuilt on loading
+        state = self.__dict__.copy()
+        del state["node_ids"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.node_ids = {label: i for i, label in enumerate(self.labels)}
+
+    def save(self, path: str) -> None:
+        """
+        Save the preprocessed structure to a file (pickle)
+
+        :param path: File name (String, mandatory)
+        """
+        with open(path, "wb") as file:
+            pickle.dump(self, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str) -> "ContractionHierarchy":
+        """
+        Load the structure saved by save (only from trusted files: it is pickle)
+
+        :param path: File name (String, mandatory)
+        :return: Preprocessed graph (ContractionHierarchy)
+        """
+        with open(path, "rb") as file:
+            hierarchy = pickle.load(file)
+        if not isinstance(hierarchy, cls):
+            raise ValueError(f"The file {path} does not contain a {cls.__name__}")
+        return hierarchy
+
+    def distance(self, source: Any, target: Any, stats: Optional[dict[str, int]] = None) -> float:
+        """
+        Shortest distance from source to target
+
+        :param source: Start vertex (Any value, mandatory)
+        :param target: Finish vertex (Any value, mandatory)
+        :param stats: Receives the number of settled vertices under the "settled" key (Dictionary, optional)
+        :return: Distance, inf if the target is unreachable (Float)
+        """
+        return self._search(source, target, stats)[0]
+
+    def shortest_path(self, source: Any, target: Any, stats: Optional[dict[str, int]] = None) -> tuple[float, list]:
+        """
+        Shortest path from source to target with the shortcuts unpacked
+
+        :param source: Start vertex (Any value, mandatory)
+        :param target: Finish vertex (Any value, mandatory)
+        :param stats: Receives the number of settled vertices under the "settled" key (Dictionary, optional)
+        :return: Distance and path from source to target, (inf, []) if the target is unreachable (Tuple)
+        """
+        best, meeting, predecessors = self._search(source, target, stats)
+        if meeting is None:
+            return best, []
+
+        # Arcs of the upward path source -> meeting and of the downward path meeting -> target
+        arcs = []
+        node = meeting
+        while node in predecessors[0]:
+            arcs.append((predecessors[0][node], node))
+            node = predecessors[0][node]
+        arcs.reverse()
+        node = meeting
+        while node in predecessors[1]:
+            arcs.append((node, predecessors[1][node]))
+            node = predecessors[1][node]
+
+        # Unpack the shortcuts
+        path = [self.node_ids[source]]
+        stack = arcs[::-1]
+        while stack:
+            tail, head = stack.pop()
+            middle = self.middles.get((tail, head))
+            if middle is None:
+                path.append(head)
+            else:
+                stack.append((middle, head))
+                stack.append((tail, middle))
+        return best, [self.labels[node] for node in path]
+
+    def _search(
+            self,
+            source: Any,
+            target: Any,
+            stats: Optional[dict[str, int]],
+    ) -> tuple[float, Optional[int], tuple[dict[int, int], dict[int, int]]]:
+        """
+        Bidirectional Dijkstra’s algorithm on the upward graphs.
+        Returns the distance, the meeting vertex and the predecessors of both searches.
+        """
+        for node in (source, target):
+            if node not in self.node_ids:
+                raise ValueError(f"The vertex {node!r} is not in the graph")
+        source_id, target_id = self.node_ids[source], self.node_ids[target]
+
+        arcs = (self.forward, self.backward)
+        distances: tuple[dict[int, float], dict[int, float]] = ({source_id: 0.0}, {target_id: 0.0})
+        predecessors: tuple[dict[int, int], dict[int, int]] = ({}, {})
+        heaps: tuple[list[tuple[float, int]], list[tuple[float, int]]] = ([(0.0, source_id)], [(0.0, target_id)])
+        best = 0.0 if source_id == target_id else float("inf")
+        meeting = source_id if source_id == target_id else None
+        settled = 0
+
+        # The searches run until both minimums are not less than the best distance (the upward searches
+        # do not meet in the order of the distance, so the other direction may still improve it)
+        infinity = float("inf")
+        while True:
+            forward_minimum = heaps[0][0][0] if heaps[0] else infinity
+            backward_minimum = heaps[1][0][0] if heaps[1] else infinity
+            if forward_minimum >= best and backward_minimum >= best:
+                break
+            side = 0 if forward_minimum <= backward_minimum else 1
+
+            side_distances, side_predecessors, heap = distances[side], predecessors[side], heaps[side]
+            current_distance, current_node = heapq.heappop(heap)
+            if current_distance > side_distances[current_node]:
+                # Outdated record
+                continue
+            settled += 1
+
+            other = distances[1 - side].get(current_node)
+            if other is not None and current_distance + other < best:
+                best = current_distance + other
+                meeting = current_node
+
+            # Stall-on-demand: the vertex is reached shorter through a higher vertex (an arc of the other
+            # upward graph leads here from it), so its distance is not final and its arcs are not relaxed
+            stalled = False
+            for neighbor_node, weight in arcs[1 - side][current_node]:
+                if side_distances.get(neighbor_node, infinity) + weight < current_distance:
+                    stalled = True
+                    break
+            if stalled:
+                continue
+
+            for neighbor_node, weight in arcs[side][current_node]:
+                distance = current_distance + weight
+                if distance < side_distances.get(neighbor_node, infinity):
+                    side_distances[neighbor_node] = distance
+                    side_predecessors[neighbor_node] = current_node
+                    heapq.heappush(heap, (distance, neighbor_node))
+
+        if stats is not None:
+            stats["settled"] = settled
+        return best, meeting, predecessors
+
+
+def build_contraction_hierarchy(
+        graph: nx.Graph | nx.DiGraph | nx.MultiGraph | nx.MultiDiGraph,
+        settled_limit: int = 64,
+) -> ContractionHierarchy:
+    """
+    Contract the vertices one by one in the order of the edge difference (shortcuts added minus arcs removed,
+    plus the number of already contracted neighbours and the hierarchy level, updated lazily).
+    Contracting v adds a shortcut u -> x for every pair of its remaining neighbours unless a witness search
+    from u (Dijkstra’s algorithm without v, at most settled_limit settled vertices) finds a path
+    not longer than u -> v -> x.
+    The witness search limit affects only the number of shortcuts, not the correctness of the distances.
+
+    :param graph: Graph, weights must be non-negative (nx.Graph | nx.DiGraph | nx.MultiGraph | nx.MultiDiGraph,
+        mandatory)
+    :param settled_limit: Maximal number of settled vertices of a witness search (Integer, optional)
+    :return: Preprocessed graph (ContractionHierarchy)
+    """
+    labels = list(graph.nodes)
+    node_ids = {label: i for i, label in enumerate(labels)}
+    nodes_number = len(labels)
+    directed = graph.is_directed()
+
+    # Remaining graph: outgoing and incoming arcs (the minimal weight among parallel edges)
+    outgoing: list[dict[int, float]] = [{} for _ in range(nodes_number)]
+    incoming: list[dict[int, float]] = [{} for _ in range(nodes_number)]
+
+    def _add_arc_(tail: int, head: int, weight: float) -> bool:
+        if weight < outgoing[tail].get(head, float("inf")):
+            outgoing[tail][head] = weight
+            incoming[head][tail] = weight
+            return True
+        return False
+
+    for u, v, weight in graph.edges(data="weight", default=1):
+        weight = float(weight)
+        if weight < 0:
+            raise ValueError("A negative edge weight was found — Dijkstra’s algorithm is not valid")
+        if u == v:
+            continue
+        _add_arc_(node_ids[u], node_ids[v], weight)
+        if not directed:
+            _add_arc_(node_ids[v], node_ids[u], weight)
+
+    def _witness_distances_(source: int, avoided: int, limit: float, targets: set[int]) -> dict[int, float]:
+        # Dijkstra’s algorithm in the remaining graph without the avoided vertex, stopped at the limit
+        distances = {source: 0.0}
+        heap = [(0.0, source)]
+        settled = 0
+        targets = set(targets)
+        while heap and targets and settled < settled_limit:
+            current_distance, current_node = heapq.heappop(heap)
+            if current_distance > distances[current_node]:
+                continue
+            if current_distance > limit:
+                break
+            settled += 1
+            targets.discard(current_node)
+            for neighbor_node, weight in outgoing[current_node].items():
+                if neighbor_node == avoided:
+                    continue
+                distance = current_distance + weight
+                if distance < distances.get(neighbor_node, float("inf")):
+                    distances[neighbor_node] = distance
+                    heapq.heappush(heap, (distance, neighbor_node))
+        return distances
+
+    def _shortcuts_(node: int) -> list[tuple[int, int, float]]:
+        # Shortcuts needed to contract the vertex
+        shortcuts = []
+        for u, weight_in in incoming[node].items():
+            paths = {x: weight_in + weight_out for x, weight_out in outgoing[node].items() if x != u}
+            if not paths:
+                continue
+            witnesses = _witness_distances_(u, node, max(paths.values()), set(paths))
+            for x, weight in paths.items():
+                if witnesses.get(x, float("inf")) > weight:
+                    shortcuts.append((u, x, weight))
+        return shortcuts
+
+    contracted_neighbors = [0] * nodes_number
+    levels = [0] * nodes_number
+
+    def _priority_(node: int, shortcuts: list[tuple[int, int, float]]) -> int:
+        removed = len(incoming[node]) + len(outgoing[node])
+        return len(shortcuts) - removed + contracted_neighbors[node] + levels[node]
+
+    heap = [(_priority_(node, _shortcuts_(node)), node) for node in range(nodes_number)]
+    heapq.heapify(heap)
+
+    rank = [0] * nodes_number
+    upward_forward: list[dict[int, float]] = [{} for _ in range(nodes_number)]
+    upward_backward: list[dict[int, float]] = [{} for _ in range(nodes_number)]
+    middles: dict[tuple[int, int], int] = {}
+    order = 0
+    while heap:
+        _, node = heapq.heappop(heap)
+
+        # Lazy update: the priority may have grown since the vertex was pushed
+        shortcuts = _shortcuts_(node)
+        priority = _priority_(node, shortcuts)
+        if heap and priority > heap[0][0]:
+            heapq.heappush(heap, (priority, node))
+            continue
+
+        rank[node] = order
+        order += 1
+
+        # All remaining neighbours are contracted later, so their arcs go upward
+        upward_forward[node] = dict(outgoing[node])
+        upward_backward[node] = dict(incoming[node])
+
+        for u, x, weight in shortcuts:
+            if _add_arc_(u, x, weight):
+                middles[u, x] = node
+
+        for neighbor_node in incoming[node]:
+            del outgoing[neighbor_node][node]
+        for neighbor_node in outgoing[node]:
+            del incoming[neighbor_node][node]
+        for neighbor_node in incoming[node].keys() | outgoing[node].keys():
+            contracted_neighbors[neighbor_node] += 1
+            levels[neighbor_node] = max(levels[neighbor_node], levels[node] + 1)
+        outgoing[node] = {}
+        incoming[node] = {}
+
+    forward = [list(arcs.items()) for arcs in upward_forward]
+    backward = [list(arcs.items()) for arcs in upward_backward]
+    return ContractionHierarchy(labels, rank, forward, backward, middles, directed)
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+"""
+Interactive or headless (rendering straight to a file) figures for the plotting entry points
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+
+# Output file formats, chosen by the file extension
+OUTPUT_FORMATS = ("png", "svg", "pdf")
+
+
+def output_format(output: str) -> str:
+    """
+    File format of the output file by its extension.
+
+    :param output: Output file name (String, mandatory)
+    :return: Format name from OUTPUT_FORMATS (String)
+    """
+    extension = os.path.splitext(output)[1].lstrip(".").lower()
+    if extension not in OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output file '{output}', expected one of: {', '.join(OUTPUT_FORMATS)}")
+    return extension
+
+
+def output_name(output: str, suffix: str) -> str:
+    """
+    Output file name with a suffix before the extension, for a series of images ("tree.png" -> "tree_bfs.png").
+
+    :param output: Output file name (String, mandatory)
+    :param suffix: Suffix (String, mandatory)
+    :return: File name (String)
+    """
+    stem, extension = os.path.splitext(output)
+    return f"{stem}_{suffix}{extension}"
+
+
+def offscreen_figure(figsize: Optional[tuple[float, float]] = None) -> Figure:
+    """
+    Figure attached to a non-interactive Agg canvas: no pyplot state, no display and no GUI backend required.
+
+    :param figsize: Width and height in inches, by default from rcParams (Tuple, optional)
+    :return: Figure (Figure)
+    """
+    figure = Figure(figsize=figsize)
+    FigureCanvasAgg(figure)
+    return figure
+
+
+@contextmanager
+def figure_output(
+        figsize: Optional[tuple[float, float]] = None,
+        output: Optional[str] = None,
+        block: bool = True,
+        figure: Optional[Figure] = None,
+) -> Iterator[Figure]:
+    """
+    Figure to draw in. Without output it is a new pyplot figure shown on exit; with output the figure is
+    off-screen (the given one is cleared and reused) and is saved to the file on exit, printing the render time.
+
+    :param figsize: Width and height in inches, by default from rcParams (Tuple, optional)
+    :param output: Output file name, the format is taken from the extension (String, optional)
+    :param block: Block on plt.show until the window is closed (Boolean, optional)
+    :param figure: Off-screen figure to reuse in the output mode (Figure, optional)
+    :return: Figure (Iterator of Figure)
+    """
+    if output is None:
+        figure = plt.figure(figsize=figsize)
+        yield figure
+        plt.show(block=block)
+        return
+
+    file_format = output_format(output)
+    start = time.perf_counter()
+    if figure is None:
+        figure = offscreen_figure(figsize)
+    else:
+        figure.clear()
+        if figsize is not None:
+            figure.set_size_inches(figsize)
+    yield figure
+    figure.savefig(output, format=file_format)
+    print(f"Saved {output} in {time.perf_counter() - start:.3f} s")
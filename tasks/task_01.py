@@ -4,11 +4,22 @@
 HomeWork Task 2
 """
 
+import argparse
 import copy
+import gc
+import heapq
+import itertools
 import random
-from typing import Any, Optional, Iterator
+import time
+import tracemalloc
+from array import array
+from typing import Any, Optional, Iterator, Iterable, Callable
+
+from .benchmarking import run_benchmark_cli, timed
 
 class Node:
+    __slots__ = ("data", "next")
+
     def __init__(self, data: Any = None) -> None:
         self.data: Any = data
         self.next: Optional[Node] = None
@@ -17,9 +28,113 @@ class Node:
         return f"Node({self.data!r})"
 
 
+class _KeyNode:
+    """
+    Node of a temporary chain of sort keys, refers to the node the key was computed for
+    """
+    __slots__ = ("data", "next", "node")
+
+    def __init__(self, data: Any, node: Node) -> None:
+        self.data: Any = data
+        self.next: Optional[_KeyNode] = None
+        self.node: Node = node
+
+
+class _ReversedKey:
+    """
+    Sort key with the inverted order (for heap-based merges in descending order)
+    """
+    __slots__ = ("key",)
+
+    def __init__(self, key: Any) -> None:
+        self.key = key
+
+    def __lt__(self, other: "_ReversedKey") -> bool:
+        return other.key < self.key
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _ReversedKey) and self.key == other.key
+
+
+def _chain_tail(head: Optional[Node]) -> Optional[Node]:
+    """
+    Returns the last node of the chain
+    """
+    current_node = head
+    while current_node is not None and current_node.next is not None:
+        current_node = current_node.next
+    return current_node
+
+
+def _reverse_chain(head: Optional[Node]) -> Optional[Node]:
+    """
+    Reverse the chain in-place and return its new head
+    """
+    prev_node = None
+    current_node = head
+    while current_node is not None:
+        current_node.next, prev_node, current_node = prev_node, current_node, current_node.next
+    return prev_node
+
+
+def _decorate_chain(head: Node, key: Callable[[Any], Any]) -> _KeyNode:
+    """
+    Build a chain of keys (computed once per node) parallel to the chain of nodes
+    """
+    dummy_head = _KeyNode(None, head)
+    tail_node = dummy_head
+    current_node = head
+    while current_node is not None:
+        tail_node.next = _KeyNode(key(current_node.data), current_node)
+        tail_node = tail_node.next
+        current_node = current_node.next
+    return dummy_head.next
+
+
+def _undecorate_chain(head: _KeyNode) -> tuple[Node, Node]:
+    """
+    Relink the nodes in the order of the chain of keys. Return (head, tail).
+    """
+    dummy_head = Node()
+    tail_node = dummy_head
+    key_node = head
+    while key_node is not None:
+        tail_node.next = key_node.node
+        tail_node = key_node.node
+        key_node = key_node.next
+    tail_node.next = None
+    return dummy_head.next, tail_node
+
+
 class LinkedList:
-    def __init__(self, head: Optional[Node] = None) -> None:
+    def __init__(self, head: Optional[Node] = None, indexed: bool = False) -> None:
         self.head: Optional[Node] = head
+        self.tail: Optional[Node] = None
+        self._size: int = 0
+        # Tail and size of an externally built chain
+        current_node = head
+        while current_node is not None:
+            self.tail = current_node
+            self._size += 1
+            current_node = current_node.next
+        # Optional value index (see build_index)
+        self._index: Optional[dict[Any, list[Node]]] = None
+        self._prev: Optional[dict[Node, Optional[Node]]] = None
+        self._stale: set[Any] = set()
+        if indexed:
+            self.build_index()
+
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[Any], indexed: bool = False) -> "LinkedList":
+        """
+        Build a list from the values of the iterable in one pass
+        """
+        ll = cls(indexed=indexed)
+        ll.extend(iterable)
+        return ll
+
+    def __len__(self) -> int:
+        return self._size
 
     def __iter__(self) -> Iterator[Node]:
         current_node = self.head
@@ -27,13 +142,67 @@ class LinkedList:
             yield current_node
             current_node = current_node.next
 
+    def values(self) -> Iterator[Any]:
+        """
+        Iterator over the values of the list
+        """
+        current_node = self.head
+        while current_node is not None:
+            yield current_node.data
+            current_node = current_node.next
+
+    def to_list(self) -> list[Any]:
+        """
+        Returns the values of the list as a Python list
+        """
+        result: list[Any] = []
+        add = result.append
+        current_node = self.head
+        while current_node is not None:
+            add(current_node.data)
+            current_node = current_node.next
+        return result
+
     def __str__(self) -> str:
         return " -> ".join(repr(x) for x in self)
 
+    def clone(self, deep: bool = False, memo: Optional[dict[int, Any]] = None) -> "LinkedList":
+        """
+        Copy the list iteratively in one pass (copy.deepcopy recurses through Node.next and
+        overflows the stack on long lists).
+
+        :param deep: Deep-copy the values, otherwise the values are shared (Boolean, optional)
+        :param memo: copy.deepcopy memo dictionary (Dictionary, optional)
+        :return: Copy of the list (LinkedList)
+        """
+        copied = type(self)()
+        values = self.values()
+        if deep:
+            memo = {} if memo is None else memo
+            # Registered before the values are copied, so a list which contains itself keeps the cycle
+            memo[id(self)] = copied
+            values = (copy.deepcopy(data, memo) for data in values)
+        copied.extend(values)
+        if self.indexed:
+            copied.build_index()
+        return copied
+
+    def __copy__(self) -> "LinkedList":
+        return self.clone()
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "LinkedList":
+        return self.clone(deep=True, memo=memo)
+
     def _search(self, data: Any) -> tuple[Optional[Node], Optional[Node]]:
         """
         Returns the first and the previous node with the specified value
         """
+        if self._index is not None:
+            bucket = self._bucket(data)
+            if bucket:
+                return bucket[0], self._prev[bucket[0]]
+            return None, self.tail
+
         current_node = self.head
         prev_node: Optional[Node] = None
         while current_node is not None:
@@ -47,13 +216,15 @@ class LinkedList:
         Add an element to the end of the list
         """
         new_node = Node(data)
-        if self.head is None:
+        prev_node = self.tail
+        if self.tail is None:
             self.head = new_node
-            return
-        current_node = self.head
-        while current_node.next is not None:
-            current_node = current_node.next
-        current_node.next = new_node
+        else:
+            self.tail.next = new_node
+        self.tail = new_node
+        self._size += 1
+        if self._index is not None:
+            self._index_link(new_node, prev_node)
 
     def prepend(self, data: Any) -> None:
         """
@@ -62,6 +233,42 @@ class LinkedList:
         new_node = Node(data)
         new_node.next = self.head
         self.head = new_node
+        if self.tail is None:
+            self.tail = new_node
+        self._size += 1
+        if self._index is not None:
+            self._index_link(new_node, None)
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """
+        Add the values of the iterable to the end of the list.
+        The new nodes are created in one map call, linked into a chain in one loop and attached to the tail at once.
+        """
+        new_nodes = list(map(Node, iterable))
+        if not new_nodes:
+            return
+        tail_node = new_nodes[0]
+        for new_node in itertools.islice(new_nodes, 1, None):
+            tail_node.next = new_node
+            tail_node = new_node
+        prev_node = self.tail
+        if self.tail is None:
+            self.head = new_nodes[0]
+        else:
+            self.tail.next = new_nodes[0]
+        self.tail = tail_node
+        self._size += len(new_nodes)
+        if self._index is not None:
+            # The new nodes follow the old tail in list order, so they go straight to the end of their buckets
+            index, predecessors = self._index, self._prev
+            for new_node in new_nodes:
+                predecessors[new_node] = prev_node
+                bucket = index.get(new_node.data)
+                if bucket is None:
+                    index[new_node.data] = [new_node]
+                else:
+                    bucket.append(new_node)
+                prev_node = new_node
 
     def delete(self, data: Any) -> bool:
         """
@@ -74,6 +281,11 @@ class LinkedList:
                 prev_node.next = current_node.next
             else:
                 self.head = current_node.next
+            if self.tail is current_node:
+                self.tail = prev_node
+            self._size -= 1
+            if self._index is not None:
+                self._index_unlink(current_node, prev_node)
             return True
         return False
 
@@ -88,21 +300,47 @@ class LinkedList:
             return
         new_node = Node(data)
         new_node.next = next_node
+        if self._index is not None:
+            # The predecessor is known, no scan is needed
+            if next_node not in self._prev:
+                return
+            current_node = self._prev[next_node]
+            current_node.next = new_node
+            self._size += 1
+            self._index_link(new_node, current_node)
+            return
         current_node = self.head
         while current_node is not None and current_node.next != next_node:
             current_node = current_node.next
         if current_node is not None:
             current_node.next = new_node
+            self._size += 1
 
     def insert_after(self, prev_node: Node, data: Any) -> None:
         """
-        Insert a new node after the specified one
+        Insert a new node after the specified one. A node of another list is ignored: the membership is checked
+        in O(1) for the tail and with the value index, otherwise by a scan from the head (as in insert_before).
         """
         if prev_node is None:
             return
+        if prev_node is not self.tail:
+            if self._index is not None:
+                if prev_node not in self._prev:
+                    return
+            else:
+                current_node = self.head
+                while current_node is not None and current_node is not prev_node:
+                    current_node = current_node.next
+                if current_node is None:
+                    return
         new_node = Node(data)
         new_node.next = prev_node.next
         prev_node.next = new_node
+        if self.tail is prev_node:
+            self.tail = new_node
+        self._size += 1
+        if self._index is not None:
+            self._index_link(new_node, prev_node)
 
     def find(self, data: Any) -> Optional[Node]:
         """
@@ -117,6 +355,8 @@ class LinkedList:
         """
         prev_node = None
         current_node = self.head
+        # the old head becomes the tail
+        self.tail = current_node
         while current_node is not None:
             # save the reference to the next one
             next_node = current_node.next
@@ -128,6 +368,7 @@ class LinkedList:
             current_node = next_node
         # new head of the list
         self.head = prev_node
+        self._reindex()
 
     def reverse_recursive(self) -> None:
         """
@@ -141,14 +382,51 @@ class LinkedList:
             node.next = prev_node
             return _reverse_(next_node, node)
 
+        self.tail = self.head
         self.head = _reverse_(self.head)
+        self._reindex()
 
     # =================================================== Merge Sort ===================================================
 
-    def sort_iterative(self) -> None:
+    def _sort_chain(
+            self,
+            sort: Callable[[Node], tuple[Node, Node]],
+            key: Optional[Callable[[Any], Any]],
+            reverse: bool,
+    ) -> None:
+        """
+        Apply an ascending stable chain sort to the list.
+        With key, a temporary chain of keys (computed once per node) is sorted and the nodes are relinked in its order.
+        With reverse, the chain is reversed before and after the sort, so equal elements keep their order
+        (as in list.sort).
+        """
+        head = self.head
+        if reverse:
+            head = _reverse_chain(head)
+        if key is not None:
+            head = _decorate_chain(head, key)
+        head, tail = sort(head)
+        if key is not None:
+            head, tail = _undecorate_chain(head)
+        if reverse:
+            head, tail = _reverse_chain(head), head
+        self.head, self.tail = head, tail
+        self._reindex()
+
+    def sort_iterative(
+            self,
+            key: Optional[Callable[[Any], Any]] = None,
+            reverse: bool = False,
+            adaptive: bool = False,
+    ) -> None:
         """
         Sort a list with merge sort (bottom-up, non-recursive).
         Works on very large lists and doesn’t overflow the recursion stack.
+
+        :param key: Function of one argument that extracts a comparison key, computed once per node (Callable, optional)
+        :param reverse: Sort in descending order, stable (Boolean, optional)
+        :param adaptive: Merge the natural runs of the list (see _sort_natural_runs) instead of
+                         starting from runs of size 1 (Boolean, optional)
         """
         if self.head is None or self.head.next is None:
             return
@@ -185,35 +463,146 @@ class LinkedList:
                 tail_node = tail_node.next
             return dummy_head.next, tail_node
 
-        # Length calculation
-        _length = 0
-        _current_node = self.head
-        while _current_node is not None:
-            _length += 1
-            _current_node = _current_node.next
+        def _bottom_up_(head: Node) -> tuple[Node, Node]:
+            """
+            Merge runs of size 1, 2, 4, ... Return (head, tail).
+            """
+            if adaptive and self._natural_runs_probe(head) >= 4:
+                return self._sort_natural_runs(head)
 
-        _dummy_head = Node(0)
-        _dummy_head.next = self.head
-        _size = 1
+            _length = self._size
 
-        while _size < _length:
-            _prev_node, _current_node = _dummy_head, _dummy_head.next
-            while _current_node is not None:
-                _left_node = _current_node
-                _right_node = _split_(_left_node, _size)
-                _current_node = _split_(_right_node, _size)
-                _merged_head, _merged_tail = _merge_(_left_node, _right_node)
-                _prev_node.next = _merged_head
-                _prev_node = _merged_tail
-            _size *= 2
+            _dummy_head = Node(0)
+            _dummy_head.next = head
+            _size = 1
 
-        self.head = _dummy_head.next
+            while _size < _length:
+                _prev_node, _current_node = _dummy_head, _dummy_head.next
+                while _current_node is not None:
+                    _left_node = _current_node
+                    _right_node = _split_(_left_node, _size)
+                    _current_node = _split_(_right_node, _size)
+                    _merged_head, _merged_tail = _merge_(_left_node, _right_node)
+                    _prev_node.next = _merged_head
+                    _prev_node = _merged_tail
+                _size *= 2
 
-    def sort_recursive(self) -> None:
+            # The tail of the last merged pair is the tail of the list
+            return _dummy_head.next, _prev_node
+
+        self._sort_chain(_bottom_up_, key, reverse)
+
+    @staticmethod
+    def _natural_runs_probe(head: Node, limit: int = 256) -> float:
+        """
+        Average length of the natural runs among the first limit nodes.
+        Random data gives runs of 2-3 nodes: detecting them costs extra comparisons and gains nothing,
+        so the adaptive sort falls back to the bottom-up merge in that case.
+        """
+        runs, length = 0, 0
+        current_node = head
+        while current_node is not None and length < limit:
+            runs += 1
+            length += 1
+            next_node = current_node.next
+            descending = next_node is not None and next_node.data < current_node.data
+            while next_node is not None and length < limit and \
+                    (next_node.data < current_node.data if descending else current_node.data <= next_node.data):
+                current_node, next_node = next_node, next_node.next
+                length += 1
+            current_node = next_node
+        return length / runs if runs else 0.0
+
+    @staticmethod
+    def _sort_natural_runs(head: Node) -> tuple[Node, Node]:
+        """
+        Natural (adaptive) merge sort, Timsort-style.
+        The list is cut into existing runs: non-decreasing ones are taken as is, strictly decreasing ones
+        are reversed in place (strictness keeps the sort stable). The runs are pushed onto a stack and adjacent
+        runs are merged while the Timsort invariants are violated, so the stack stays O(log n) deep.
+        A sorted or reverse-sorted list costs about n comparisons. Returns (head, tail).
+        """
+
+        def _next_run_(head: Node) -> tuple[Node, Node, int, Optional[Node]]:
+            """
+            Detach the run starting at head. Return (run head, run tail, run length, rest of the list).
+            """
+            next_node = head.next
+            length = 1
+            if next_node is not None and next_node.data < head.data:
+                # Strictly decreasing run: reverse the links while walking
+                prev_node, current_node = None, head
+                while True:
+                    next_node = current_node.next
+                    current_node.next = prev_node
+                    if next_node is None or not next_node.data < current_node.data:
+                        return current_node, head, length, next_node
+                    prev_node, current_node = current_node, next_node
+                    length += 1
+            current_node = head
+            while next_node is not None and current_node.data <= next_node.data:
+                current_node, next_node = next_node, next_node.next
+                length += 1
+            current_node.next = None
+            return head, current_node, length, next_node
+
+        def _merge_runs_(left: list, right: list) -> list:
+            """
+            Merge two adjacent runs [head, tail, length], the left one goes first on ties.
+            """
+            ll1, ll1_tail, ll1_length = left
+            ll2, ll2_tail, ll2_length = right
+            dummy_head = Node()
+            tail_node = dummy_head
+            while ll1 is not None and ll2 is not None:
+                if ll1.data <= ll2.data:
+                    tail_node.next, ll1 = ll1, ll1.next
+                else:
+                    tail_node.next, ll2 = ll2, ll2.next
+                tail_node = tail_node.next
+            if ll1 is not None:
+                tail_node.next, tail_node = ll1, ll1_tail
+            else:
+                tail_node.next, tail_node = ll2, ll2_tail
+            return [dummy_head.next, tail_node, ll1_length + ll2_length]
+
+        def _merge_at_(stack: list[list], i: int) -> None:
+            stack[i] = _merge_runs_(stack[i], stack[i + 1])
+            del stack[i + 1]
+
+        runs: list[list] = []
+        rest = head
+        while rest is not None:
+            run_head, run_tail, length, rest = _next_run_(rest)
+            runs.append([run_head, run_tail, length])
+            # Restore the invariants: A > B + C and B > C for the top runs A, B, C
+            while len(runs) > 1:
+                n = len(runs) - 2
+                if (n > 0 and runs[n - 1][2] <= runs[n][2] + runs[n + 1][2]) or \
+                        (n > 1 and runs[n - 2][2] <= runs[n - 1][2] + runs[n][2]):
+                    if runs[n - 1][2] < runs[n + 1][2]:
+                        n -= 1
+                    _merge_at_(runs, n)
+                elif runs[n][2] <= runs[n + 1][2]:
+                    _merge_at_(runs, n)
+                else:
+                    break
+        while len(runs) > 1:
+            _merge_at_(runs, len(runs) - 2)
+
+        return runs[0][0], runs[0][1]
+
+    def sort_recursive(self, key: Optional[Callable[[Any], Any]] = None, reverse: bool = False) -> None:
         """
         Recursive merge sort of a list.
-        Causes a RecursionError on very large lists.
+        Only the division recurses and the merging is iterative, so the recursion depth is O(log n).
+
+        :param key: Function of one argument that extracts a comparison key, computed once per node (Callable, optional)
+        :param reverse: Sort in descending order, stable (Boolean, optional)
         """
+        if self.head is None or self.head.next is None:
+            return
+
         def _get_middle_(head: Node) -> Node:
             """
             Find the middle of the list (fast (2 nodes shift)/slow (1 node shift) pointers)
@@ -226,20 +615,18 @@ class LinkedList:
 
         def _sorted_merge_(left_node: Optional[Node], right_node: Optional[Node]) -> Optional[Node]:
             """
-            Merge two sorted lists
+            Merge two sorted lists (iteratively, one recursion level per element would overflow the stack)
             """
-            if left_node is None:
-                return right_node
-            if right_node is None:
-                return left_node
-
-            if left_node.data <= right_node.data:
-                result = left_node
-                result.next = _sorted_merge_(left_node.next, right_node)
-            else:
-                result = right_node
-                result.next = _sorted_merge_(left_node, right_node.next)
-            return result
+            dummy_head = Node(0)
+            tail_node = dummy_head
+            while left_node is not None and right_node is not None:
+                if left_node.data <= right_node.data:
+                    tail_node.next, left_node = left_node, left_node.next
+                else:
+                    tail_node.next, right_node = right_node, right_node.next
+                tail_node = tail_node.next
+            tail_node.next = left_node if left_node is not None else right_node
+            return dummy_head.next
 
         def _merge_sort_(head: Optional[Node]) -> Optional[Node]:
             """
@@ -257,100 +644,1324 @@ class LinkedList:
 
             return _sorted_merge_(left, right)
 
-        self.head = _merge_sort_(self.head)
+        def _sort_(head: Node) -> tuple[Node, Node]:
+            sorted_head = _merge_sort_(head)
+            return sorted_head, _chain_tail(sorted_head)
+
+        self._sort_chain(_sort_, key, reverse)
 
     # =================================================== Merge Sort ===================================================
 
+    # ================================================== Value Index ===================================================
 
-def merge_sorted_lists(ll1: LinkedList, ll2: LinkedList) -> LinkedList:
-    """
-    Merge two sorted singly linked lists into one sorted list.
+    @property
+    def indexed(self) -> bool:
+        return self._index is not None
 
-    :param ll1: First linked list (LinkedList, mandatory)
-    :param ll2: Second linked list (LinkedList, mandatory)
-    :return: Merged linked list (LinkedList)
-    """
+    def build_index(self) -> None:
+        """
+        Enable the value index: value -> nodes with that value (in list order) and node -> previous node.
+        find and delete become O(1) and insert_before no longer scans for the predecessor.
+        Costs two dictionary entries per node; the values must be hashable.
+        """
+        index: dict[Any, list[Node]] = {}
+        predecessors: dict[Node, Optional[Node]] = {}
+        prev_node: Optional[Node] = None
+        for node in self:
+            bucket = index.get(node.data)
+            if bucket is None:
+                index[node.data] = [node]
+            else:
+                bucket.append(node)
+            predecessors[node] = prev_node
+            prev_node = node
+        self._index, self._prev, self._stale = index, predecessors, set()
 
-    # Dummy "head" to simplify the logic
-    dummy_head = Node(0)
-    tail = dummy_head
+    def drop_index(self) -> None:
+        """
+        Disable the value index
+        """
+        self._index, self._prev, self._stale = None, None, set()
 
-    ll1_node = ll1.head
-    ll2_node = ll2.head
+    def _reindex(self) -> None:
+        """
+        Rebuild the value index (if it is enabled) after the nodes were relinked
+        """
+        if self._index is not None:
+            self.build_index()
+
+    def _bucket(self, data: Any) -> list[Node]:
+        """
+        Returns the nodes with the specified value in list order
+        """
+        if data in self._stale:
+            # Restore the order after a duplicate value was inserted in the middle of the list
+            self._index[data] = [node for node in self if node.data == data]
+            self._stale.discard(data)
+        return self._index.get(data, [])
 
-    while ll1_node is not None and ll2_node is not None:
-        if ll1_node.data <= ll2_node.data:
-            tail.next, ll1_node = ll1_node, ll1_node.next
+    def _index_link(self, new_node: Node, prev_node: Optional[Node]) -> None:
+        """
+        Register a node that was just linked after prev_node
+        """
+        self._prev[new_node] = prev_node
+        if new_node.next is not None:
+            self._prev[new_node.next] = new_node
+        bucket = self._index.get(new_node.data)
+        if bucket is None:
+            self._index[new_node.data] = [new_node]
+        elif new_node is self.tail:
+            bucket.append(new_node)
+        elif new_node is self.head:
+            bucket.insert(0, new_node)
         else:
-            tail.next, ll2_node = ll2_node, ll2_node.next
-        tail = tail.next
+            # The position among the nodes with the same value is unknown
+            bucket.append(new_node)
+            self._stale.add(new_node.data)
 
-    # Add the remaining elements
-    tail.next = ll1_node if ll1_node is not None else ll2_node
+    def _index_unlink(self, node: Node, prev_node: Optional[Node]) -> None:
+        """
+        Unregister a node that was just unlinked from prev_node
+        """
+        del self._prev[node]
+        if node.next is not None:
+            self._prev[node.next] = prev_node
+        bucket = self._index[node.data]
+        if bucket[0] is node:
+            del bucket[0]
+        else:
+            bucket.remove(node)
+        if not bucket:
+            del self._index[node.data]
+            self._stale.discard(node.data)
 
-    return LinkedList(head=dummy_head.next)
+    # ================================================== Value Index ===================================================
 
 
-def test_linked_list_operations() -> None:
+class CompactLinkedList:
+    """
+    Singly linked list stored as a struct of arrays.
+    Values are kept in a Python list and the next links are indices in an array('q'), so a node costs
+    two machine words instead of a Python object. Nodes are addressed by integer handles (indices),
+    NIL (-1) marks the end of the chain. Slots of deleted nodes are reused through a free list that is
+    threaded through the same next array.
+    """
 
-    ll = LinkedList()
-    for number in [random.randint(1, 100) for _ in range(10)]:
-        ll.append(number)
+    NIL = -1
 
-    print("Зв'язний список:")
-    print(ll)
+    def __init__(self) -> None:
+        self._data: list[Any] = []
+        self._next: array = array("q")
+        self._free: int = self.NIL
+        self.head: int = self.NIL
+        self.tail: int = self.NIL
+        self._size: int = 0
 
-    print()
-    print("Ітераційна реалізація реверсу (O(n) часу та O(1) пам’яті)")
-    ll_copy = copy.deepcopy(ll)
-    print("Зв'язний список до реверсу:")
-    print(ll)
-    ll_copy.reverse_iterative()
-    print("Зв'язний список після реверсу:")
-    print(ll_copy)
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[Any]) -> "CompactLinkedList":
+        """
+        Build a list from the values of the iterable in one pass
+        """
+        ll = cls()
+        ll.extend(iterable)
+        return ll
 
-    print()
-    print("Рекурсивна реалізація реверсу (O(n) часу та O(n) пам’яті)")
-    ll_copy = copy.deepcopy(ll)
-    print("Зв'язний список до реверсу:")
-    print(ll)
-    ll_copy.reverse_recursive()
-    print("Зв'язний список після реверсу:")
-    print(ll_copy)
+    def __len__(self) -> int:
+        return self._size
 
-    print()
-    print("Ітераційна реалізація merge sort O(n log n) часу та O(1) пам’яті)")
-    ll_copy = copy.deepcopy(ll)
-    print("Зв'язний список до сортування:")
-    print(ll)
-    ll_copy.sort_iterative()
-    print("Зв'язний список після сортування:")
-    print(ll_copy)
+    def __iter__(self) -> Iterator[int]:
+        next_links = self._next
+        current_node = self.head
+        while current_node != self.NIL:
+            yield current_node
+            current_node = next_links[current_node]
 
-    print()
-    print("Рекурсивна реалізація merge sort (O(n log n) часу та O(log n) пам’яті)")
-    ll_copy = copy.deepcopy(ll)
-    print("Зв'язний список до сортування:")
-    print(ll)
-    ll_copy.sort_recursive()
-    print("Зв'язний список після сортування:")
-    print(ll_copy)
+    def values(self) -> Iterator[Any]:
+        """
+        Iterator over the values of the list
+        """
+        values, next_links = self._data, self._next
+        current_node = self.head
+        while current_node != self.NIL:
+            yield values[current_node]
+            current_node = next_links[current_node]
 
-    ll1 = LinkedList()
-    for number in [random.randint(1, 100) for _ in range(10)]:
-        ll1.append(number)
-    ll1.sort_iterative()
+    def to_list(self) -> list[Any]:
+        """
+        Returns the values of the list as a Python list
+        """
+        result: list[Any] = []
+        add = result.append
+        values, next_links = self._data, self._next
+        current_node = self.head
+        while current_node != self.NIL:
+            add(values[current_node])
+            current_node = next_links[current_node]
+        return result
 
-    ll2 = LinkedList()
-    for number in [random.randint(1, 100) for _ in range(10)]:
-        ll2.append(number)
-    ll2.sort_iterative()
+    def __str__(self) -> str:
+        return " -> ".join(f"Node({self._data[x]!r})" for x in self)
 
-    print()
-    print("Перший зв'язний відсортований список:")
-    print(ll1)
-    print("Другий зв'язний відсортований список:")
-    print(ll2)
-    ll_merged = merge_sorted_lists(ll1, ll2)
-    print("Об'єднаний зв'язний список:")
-    print(ll_merged)
+    def value(self, node: int) -> Any:
+        """
+        Returns the value stored in the specified node
+        """
+        return self._data[node]
+
+    def _new_node(self, data: Any) -> int:
+        """
+        Allocate a node (reuse a free slot if there is one) and return its handle
+        """
+        if self._free != self.NIL:
+            node = self._free
+            self._free = self._next[node]
+            self._data[node] = data
+            self._next[node] = self.NIL
+            return node
+        self._data.append(data)
+        self._next.append(self.NIL)
+        return len(self._data) - 1
+
+    def _free_node(self, node: int) -> None:
+        """
+        Return the slot of the node to the free list
+        """
+        self._data[node] = None
+        self._next[node] = self._free
+        self._free = node
+
+    def _search(self, data: Any) -> tuple[int, int]:
+        """
+        Returns the first and the previous node with the specified value
+        """
+        values, next_links = self._data, self._next
+        current_node = self.head
+        prev_node = self.NIL
+        while current_node != self.NIL:
+            if values[current_node] == data:
+                return current_node, prev_node
+            prev_node, current_node = current_node, next_links[current_node]
+        return self.NIL, prev_node
+
+    def _last_node(self) -> int:
+        """
+        Returns the last node of the chain starting from the head
+        """
+        next_links = self._next
+        current_node = self.head
+        while current_node != self.NIL and next_links[current_node] != self.NIL:
+            current_node = next_links[current_node]
+        return current_node
+
+    def append(self, data: Any) -> None:
+        """
+        Add an element to the end of the list
+        """
+        new_node = self._new_node(data)
+        if self.tail == self.NIL:
+            self.head = new_node
+        else:
+            self._next[self.tail] = new_node
+        self.tail = new_node
+        self._size += 1
+
+    def prepend(self, data: Any) -> None:
+        """
+        Add an element to the beginning of the list
+        """
+        new_node = self._new_node(data)
+        self._next[new_node] = self.head
+        self.head = new_node
+        if self.tail == self.NIL:
+            self.tail = new_node
+        self._size += 1
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """
+        Add the values of the iterable to the end of the list.
+        The values are stored in new slots at the end of the storage and linked to each other in one step.
+        """
+        start = len(self._data)
+        self._data.extend(iterable)
+        count = len(self._data) - start
+        if count == 0:
+            return
+        self._next.extend(range(start + 1, start + count + 1))
+        self._next[-1] = self.NIL
+        if self.tail == self.NIL:
+            self.head = start
+        else:
+            self._next[self.tail] = start
+        self.tail = start + count - 1
+        self._size += count
+
+    def delete(self, data: Any) -> bool:
+        """
+        Delete the first node with the value data.
+        Returns True if deleted, and False if the node was not found.
+        """
+        current_node, prev_node = self._search(data)
+        if current_node != self.NIL:
+            if prev_node != self.NIL:
+                self._next[prev_node] = self._next[current_node]
+            else:
+                self.head = self._next[current_node]
+            if self.tail == current_node:
+                self.tail = prev_node
+            self._free_node(current_node)
+            self._size -= 1
+            return True
+        return False
+
+    def insert_before(self, next_node: int, data: Any) -> None:
+        """
+        Insert a new node before the specified one
+        """
+        if next_node == self.NIL:
+            return
+        if self.head == next_node:
+            self.prepend(data)
+            return
+        next_links = self._next
+        current_node = self.head
+        while current_node != self.NIL and next_links[current_node] != next_node:
+            current_node = next_links[current_node]
+        if current_node != self.NIL:
+            new_node = self._new_node(data)
+            next_links[new_node] = next_node
+            next_links[current_node] = new_node
+            self._size += 1
+
+    def insert_after(self, prev_node: int, data: Any) -> None:
+        """
+        Insert a new node after the specified one
+        """
+        if prev_node == self.NIL:
+            return
+        new_node = self._new_node(data)
+        self._next[new_node] = self._next[prev_node]
+        self._next[prev_node] = new_node
+        if self.tail == prev_node:
+            self.tail = new_node
+        self._size += 1
+
+    def find(self, data: Any) -> Optional[int]:
+        """
+        Returns the first node with the specified value
+        """
+        current_node, _ = self._search(data)
+        return current_node if current_node != self.NIL else None
+
+    def reverse_iterative(self) -> None:
+        """
+        Reverse the list in-place (modifies the next links)
+        """
+        next_links = self._next
+        prev_node = self.NIL
+        current_node = self.head
+        self.tail = current_node
+        while current_node != self.NIL:
+            next_node = next_links[current_node]
+            next_links[current_node] = prev_node
+            prev_node = current_node
+            current_node = next_node
+        self.head = prev_node
+
+    def reverse_recursive(self) -> None:
+        """
+        Reverse the list in-place recursively (modifies the next links)
+        """
+        next_links = self._next
+
+        def _reverse_(node: int, prev_node: int = self.NIL) -> int:
+            if node == self.NIL:
+                return prev_node
+            next_node = next_links[node]
+            next_links[node] = prev_node
+            return _reverse_(next_node, node)
+
+        self.tail = self.head
+        self.head = _reverse_(self.head)
+
+    # =================================================== Merge Sort ===================================================
+
+    def _merge_(self, ll1: int, ll2: int) -> tuple[int, int]:
+        """
+        Merge two sorted chains. Return (head, tail).
+        """
+        nil, values, next_links = self.NIL, self._data, self._next
+        head = tail_node = nil
+        while ll1 != nil and ll2 != nil:
+            if values[ll1] <= values[ll2]:
+                node, ll1 = ll1, next_links[ll1]
+            else:
+                node, ll2 = ll2, next_links[ll2]
+            if tail_node == nil:
+                head = node
+            else:
+                next_links[tail_node] = node
+            tail_node = node
+        rest = ll1 if ll1 != nil else ll2
+        if tail_node == nil:
+            head = rest
+        else:
+            next_links[tail_node] = rest
+        if rest != nil:
+            tail_node = rest
+            while next_links[tail_node] != nil:
+                tail_node = next_links[tail_node]
+        return head, tail_node
+
+    def sort_iterative(self) -> None:
+        """
+        Sort a list with merge sort (bottom-up, non-recursive).
+        """
+        nil, next_links = self.NIL, self._next
+        if self.head == nil or next_links[self.head] == nil:
+            return
+
+        def _split_(head: int, size: int) -> int:
+            """
+            Detach a sublist of length size and return its head.
+            """
+            current_node = head
+            for _ in range(size - 1):
+                if current_node == nil or next_links[current_node] == nil:
+                    break
+                current_node = next_links[current_node]
+            if current_node == nil:
+                return nil
+            next_node = next_links[current_node]
+            next_links[current_node] = nil
+            return next_node
+
+        _size = 1
+        while _size < self._size:
+            _head = _prev_node = nil
+            _current_node = self.head
+            while _current_node != nil:
+                _left_node = _current_node
+                _right_node = _split_(_left_node, _size)
+                _current_node = _split_(_right_node, _size)
+                _merged_head, _merged_tail = self._merge_(_left_node, _right_node)
+                if _prev_node == nil:
+                    _head = _merged_head
+                else:
+                    next_links[_prev_node] = _merged_head
+                _prev_node = _merged_tail
+            self.head = _head
+            _size *= 2
+
+        self.tail = _prev_node
+
+    def sort_recursive(self) -> None:
+        """
+        Recursive merge sort of a list.
+        Only the division recurses and the merging is iterative, so the recursion depth is O(log n).
+        """
+        nil, next_links = self.NIL, self._next
+
+        def _get_middle_(head: int) -> int:
+            slow, fast = head, head
+            while next_links[fast] != nil and next_links[next_links[fast]] != nil:
+                slow = next_links[slow]
+                fast = next_links[next_links[fast]]
+            return slow
+
+        def _merge_sort_(head: int) -> int:
+            if head == nil or next_links[head] == nil:
+                return head
+
+            middle_node = _get_middle_(head)
+            next_to_middle = next_links[middle_node]
+            next_links[middle_node] = nil
+
+            left = _merge_sort_(head)
+            right = _merge_sort_(next_to_middle)
+
+            merged_head, _ = self._merge_(left, right)
+            return merged_head
+
+        self.head = _merge_sort_(self.head)
+        self.tail = self._last_node()
+
+    # =================================================== Merge Sort ===================================================
+
+
+class DoublyNode:
+    __slots__ = ("data", "prev", "next", "owner")
+
+    def __init__(self, data: Any = None) -> None:
+        self.data: Any = data
+        self.prev: Optional[DoublyNode] = None
+        self.next: Optional[DoublyNode] = None
+        # The list the node is linked into (None for the sentinels and unlinked nodes)
+        self.owner: Optional[DoublyLinkedList] = None
+
+    def __repr__(self) -> str:
+        return f"Node({self.data!r})"
+
+
+class DoublyLinkedList:
+    """
+    Doubly linked list with head and tail sentinels.
+    Every node knows its predecessor, so inserting before a node and removing a known node are O(1);
+    the sentinels remove the special cases for the first and the last node.
+    Every node also knows its list, so a node of another list is rejected in O(1) as well.
+    """
+
+    def __init__(self) -> None:
+        self._head_sentinel = DoublyNode()
+        self._tail_sentinel = DoublyNode()
+        self._head_sentinel.next = self._tail_sentinel
+        self._tail_sentinel.prev = self._head_sentinel
+        self._size: int = 0
+
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[Any]) -> "DoublyLinkedList":
+        """
+        Build a list from the values of the iterable in one pass
+        """
+        dll = cls()
+        dll.extend(iterable)
+        return dll
+
+    @property
+    def head(self) -> Optional[DoublyNode]:
+        return self._head_sentinel.next if self._size else None
+
+    @property
+    def tail(self) -> Optional[DoublyNode]:
+        return self._tail_sentinel.prev if self._size else None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[DoublyNode]:
+        current_node = self._head_sentinel.next
+        while current_node is not self._tail_sentinel:
+            yield current_node
+            current_node = current_node.next
+
+    def values(self) -> Iterator[Any]:
+        """
+        Iterator over the values of the list
+        """
+        for node in self:
+            yield node.data
+
+    def to_list(self) -> list[Any]:
+        """
+        Returns the values of the list as a Python list
+        """
+        return [node.data for node in self]
+
+    def __str__(self) -> str:
+        return " <-> ".join(repr(x) for x in self)
+
+    def clone(self, deep: bool = False, memo: Optional[dict[int, Any]] = None) -> "DoublyLinkedList":
+        """
+        Copy the list iteratively in one pass, see LinkedList.clone
+        """
+        copied = type(self)()
+        values = self.values()
+        if deep:
+            memo = {} if memo is None else memo
+            memo[id(self)] = copied
+            values = (copy.deepcopy(data, memo) for data in values)
+        copied.extend(values)
+        return copied
+
+    def __copy__(self) -> "DoublyLinkedList":
+        return self.clone()
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "DoublyLinkedList":
+        return self.clone(deep=True, memo=memo)
+
+    def _link_after(self, prev_node: DoublyNode, data: Any) -> DoublyNode:
+        """
+        Link a new node between prev_node and its successor
+        """
+        new_node = DoublyNode(data)
+        new_node.owner = self
+        next_node = prev_node.next
+        new_node.prev, new_node.next = prev_node, next_node
+        prev_node.next = next_node.prev = new_node
+        self._size += 1
+        return new_node
+
+    def append(self, data: Any) -> DoublyNode:
+        """
+        Add an element to the end of the list
+        """
+        return self._link_after(self._tail_sentinel.prev, data)
+
+    def prepend(self, data: Any) -> DoublyNode:
+        """
+        Add an element to the beginning of the list
+        """
+        return self._link_after(self._head_sentinel, data)
+
+    def extend(self, iterable: Iterable[Any]) -> None:
+        """
+        Add the values of the iterable to the end of the list
+        """
+        tail_node = self._tail_sentinel.prev
+        new_nodes = list(map(DoublyNode, iterable))
+        for new_node in new_nodes:
+            new_node.owner = self
+            new_node.prev = tail_node
+            tail_node.next = new_node
+            tail_node = new_node
+        tail_node.next = self._tail_sentinel
+        self._tail_sentinel.prev = tail_node
+        self._size += len(new_nodes)
+
+    def insert_before(self, next_node: DoublyNode, data: Any) -> Optional[DoublyNode]:
+        """
+        Insert a new node before the specified one (O(1)). Returns the new node,
+        or None if the node is not in this list.
+        """
+        if next_node is None or next_node.owner is not self:
+            return None
+        return self._link_after(next_node.prev, data)
+
+    def insert_after(self, prev_node: DoublyNode, data: Any) -> Optional[DoublyNode]:
+        """
+        Insert a new node after the specified one (O(1)). Returns the new node,
+        or None if the node is not in this list.
+        """
+        if prev_node is None or prev_node.owner is not self:
+            return None
+        return self._link_after(prev_node, data)
+
+    def remove(self, node: DoublyNode) -> None:
+        """
+        Unlink the specified node of this list (O(1))
+        """
+        if node.owner is not self:
+            raise ValueError("The node is not in this list")
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        node.prev = node.next = node.owner = None
+        self._size -= 1
+
+    def find(self, data: Any) -> Optional[DoublyNode]:
+        """
+        Returns the first node with the specified value
+        """
+        for node in self:
+            if node.data == data:
+                return node
+        return None
+
+    def delete(self, data: Any) -> bool:
+        """
+        Delete the first node with the value data.
+        Returns True if deleted, and False if the node was not found.
+        """
+        node = self.find(data)
+        if node is None:
+            return False
+        self.remove(node)
+        return True
+
+    def reverse_iterative(self) -> None:
+        """
+        Reverse the list in-place: swap the prev and next references of every node and of the sentinels
+        """
+        current_node = self._head_sentinel
+        while current_node is not None:
+            current_node.prev, current_node.next = current_node.next, current_node.prev
+            current_node = current_node.prev
+        self._head_sentinel, self._tail_sentinel = self._tail_sentinel, self._head_sentinel
+
+    def reverse_recursive(self) -> None:
+        """
+        Reverse the list in-place recursively (O(n) memory of the call stack), see reverse_iterative
+        """
+
+        def _reverse_(node: Optional[DoublyNode]) -> None:
+            if node is None:
+                return
+            node.prev, node.next = node.next, node.prev
+            _reverse_(node.prev)
+
+        _reverse_(self._head_sentinel)
+        self._head_sentinel, self._tail_sentinel = self._tail_sentinel, self._head_sentinel
+
+    def _as_chain(self) -> LinkedList:
+        """
+        The nodes as a singly linked chain (the list itself is left inconsistent until _adopt_chain)
+        """
+        chain = LinkedList()
+        if self._size:
+            chain.head, chain.tail, chain._size = self._head_sentinel.next, self._tail_sentinel.prev, self._size
+            chain.tail.next = None
+        return chain
+
+    def _adopt_chain(self, chain: LinkedList) -> None:
+        """
+        Take over the nodes of a singly linked chain of DoublyNode and restore their prev references
+        """
+        prev_node = self._head_sentinel
+        for node in chain:
+            prev_node.next, node.prev, node.owner = node, prev_node, self
+            prev_node = node
+        prev_node.next, self._tail_sentinel.prev = self._tail_sentinel, prev_node
+        self._size = len(chain)
+
+    def _sort_with(self, sort: Callable[[LinkedList], None]) -> None:
+        """
+        Sort the nodes as a singly linked chain with the LinkedList merge sort and restore the prev references
+        """
+        if self._size < 2:
+            return
+        chain = self._as_chain()
+        sort(chain)
+        self._adopt_chain(chain)
+
+    def sort_iterative(
+            self,
+            key: Optional[Callable[[Any], Any]] = None,
+            reverse: bool = False,
+            adaptive: bool = False,
+    ) -> None:
+        """
+        Sort a list with merge sort (bottom-up, non-recursive), see LinkedList.sort_iterative
+        """
+        self._sort_with(lambda chain: chain.sort_iterative(key=key, reverse=reverse, adaptive=adaptive))
+
+    def sort_recursive(self, key: Optional[Callable[[Any], Any]] = None, reverse: bool = False) -> None:
+        """
+        Recursive merge sort of a list, see LinkedList.sort_recursive
+        """
+        self._sort_with(lambda chain: chain.sort_recursive(key=key, reverse=reverse))
+
+
+def _merge_compact_lists(ll1: CompactLinkedList, ll2: CompactLinkedList) -> CompactLinkedList:
+    """
+    Merge two sorted compact lists: the storage of the first list is taken over,
+    the nodes of the second one are moved into it and the two chains are merged by relinking.
+    """
+    nil = CompactLinkedList.NIL
+    merged = CompactLinkedList()
+    merged._data, merged._next, merged._free = ll1._data, ll1._next, ll1._free
+
+    second_head = second_tail = nil
+    for node in ll2:
+        new_node = merged._new_node(ll2._data[node])
+        if second_tail == nil:
+            second_head = new_node
+        else:
+            merged._next[second_tail] = new_node
+        second_tail = new_node
+
+    merged.head, merged.tail = merged._merge_(ll1.head, second_head)
+    merged._size = len(ll1) + len(ll2)
+
+    # The source lists no longer own their nodes
+    ll1.__init__()
+    ll2.__init__()
+
+    return merged
+
+
+def _merge_doubly_lists(
+        ll1: DoublyLinkedList,
+        ll2: DoublyLinkedList,
+        key: Optional[Callable[[Any], Any]],
+        reverse: bool,
+) -> DoublyLinkedList:
+    """
+    Merge two sorted doubly linked lists: their chains are merged as singly linked ones
+    and the prev references are restored.
+    """
+    merged = DoublyLinkedList()
+    merged._adopt_chain(merge_sorted_lists(ll1._as_chain(), ll2._as_chain(), key=key, reverse=reverse))
+
+    # The source lists no longer own their nodes
+    ll1.__init__()
+    ll2.__init__()
+
+    return merged
+
+
+def merge_sorted_lists(
+        ll1: LinkedList | CompactLinkedList | DoublyLinkedList,
+        ll2: LinkedList | CompactLinkedList | DoublyLinkedList,
+        key: Optional[Callable[[Any], Any]] = None,
+        reverse: bool = False,
+) -> LinkedList | CompactLinkedList | DoublyLinkedList:
+    """
+    Merge two sorted linked lists into one sorted list.
+    The nodes of the source lists are relinked, so both source lists are left empty.
+
+    :param ll1: First linked list (LinkedList | CompactLinkedList | DoublyLinkedList, mandatory)
+    :param ll2: Second linked list of the same type (LinkedList | CompactLinkedList | DoublyLinkedList, mandatory)
+    :param key: Key the lists are sorted by, computed once per node (Callable, optional, not for CompactLinkedList)
+    :param reverse: The lists are sorted in descending order (Boolean, optional, not for CompactLinkedList)
+    :return: Merged linked list of the same type (LinkedList | CompactLinkedList | DoublyLinkedList)
+    """
+    if type(ll1) is not type(ll2):
+        raise TypeError(
+            f"Only lists of the same type can be merged, got {type(ll1).__name__} and {type(ll2).__name__}"
+        )
+    if isinstance(ll1, CompactLinkedList):
+        if key is not None or reverse:
+            raise TypeError("key and reverse are not supported for CompactLinkedList")
+        return _merge_compact_lists(ll1, ll2)
+    if isinstance(ll1, DoublyLinkedList):
+        return _merge_doubly_lists(ll1, ll2, key, reverse)
+
+    # Dummy "head" to simplify the logic
+    dummy_head = Node(0)
+    tail = dummy_head
+
+    ll1_node = ll1.head
+    ll2_node = ll2.head
+
+    if key is None and not reverse:
+        while ll1_node is not None and ll2_node is not None:
+            if ll1_node.data <= ll2_node.data:
+                tail.next, ll1_node = ll1_node, ll1_node.next
+            else:
+                tail.next, ll2_node = ll2_node, ll2_node.next
+            tail = tail.next
+    else:
+        # The key of a node is computed once, when the node becomes the head of its list
+        get_key = key if key is not None else (lambda data: data)
+        ll1_key = get_key(ll1_node.data) if ll1_node is not None else None
+        ll2_key = get_key(ll2_node.data) if ll2_node is not None else None
+        while ll1_node is not None and ll2_node is not None:
+            # On ties the node of the first list goes first
+            if (ll2_key <= ll1_key) if reverse else (ll1_key <= ll2_key):
+                tail.next, ll1_node = ll1_node, ll1_node.next
+                if ll1_node is not None:
+                    ll1_key = get_key(ll1_node.data)
+            else:
+                tail.next, ll2_node = ll2_node, ll2_node.next
+                if ll2_node is not None:
+                    ll2_key = get_key(ll2_node.data)
+            tail = tail.next
+
+    # Add the remaining elements
+    if ll1_node is not None:
+        tail.next, tail = ll1_node, ll1.tail
+    elif ll2_node is not None:
+        tail.next, tail = ll2_node, ll2.tail
+
+    merged = LinkedList()
+    merged.head = dummy_head.next
+    merged.tail = tail if merged.head is not None else None
+    merged._size = len(ll1) + len(ll2)
+    if ll1.indexed or ll2.indexed:
+        merged.build_index()
+
+    # The source lists no longer own their nodes
+    for ll in (ll1, ll2):
+        ll.head, ll.tail, ll._size = None, None, 0
+        ll._reindex()
+
+    return merged
+
+
+def merge_k_sorted_lists(
+        lists: Iterable[LinkedList],
+        key: Optional[Callable[[Any], Any]] = None,
+        reverse: bool = False,
+) -> LinkedList:
+    """
+    Merge any number of sorted singly linked lists into one sorted list (heap-based k-way merge).
+    O(n log k) time and O(k) memory instead of O(n k) for pairwise merging.
+    The nodes of the source lists are relinked, so the source lists are left empty.
+    On equal values the node of the earlier list goes first (the same tie rule as merge_sorted_lists).
+
+    :param lists: Sorted linked lists (Iterable of LinkedList, mandatory)
+    :param key: Key the lists are sorted by, computed once per node (Callable, optional)
+    :param reverse: The lists are sorted in descending order (Boolean, optional)
+    :return: Merged linked list (LinkedList)
+    """
+    lists = list(lists)
+
+    def _sort_key_(data: Any) -> Any:
+        sort_key = key(data) if key is not None else data
+        return _ReversedKey(sort_key) if reverse else sort_key
+
+    # Heap records (key, list number, node): the list number breaks ties, nodes are never compared
+    heap: list[tuple[Any, int, Node]] = [
+        (_sort_key_(ll.head.data), i, ll.head) for i, ll in enumerate(lists) if ll.head is not None
+    ]
+    heapq.heapify(heap)
+
+    dummy_head = Node(0)
+    tail = dummy_head
+    while heap:
+        _, i, node = heap[0]
+        tail.next = node
+        if len(heap) == 1:
+            # The last non-empty list is attached as a whole
+            tail = lists[i].tail
+            break
+        tail = node
+        if node.next is None:
+            heapq.heappop(heap)
+        else:
+            heapq.heapreplace(heap, (_sort_key_(node.next.data), i, node.next))
+
+    merged = LinkedList()
+    merged.head = dummy_head.next
+    merged.tail = tail if merged.head is not None else None
+    merged._size = sum(len(ll) for ll in lists)
+    if any(ll.indexed for ll in lists):
+        merged.build_index()
+
+    # The source lists no longer own their nodes
+    for ll in lists:
+        ll.head, ll.tail, ll._size = None, None, 0
+        ll._reindex()
+
+    return merged
+
+
+def iter_merged_values(
+        *sources: LinkedList | CompactLinkedList | Iterable[Node],
+        key: Optional[Callable[[Any], Any]] = None,
+        reverse: bool = False,
+) -> Iterator[Any]:
+    """
+    Lazily merge any number of sorted lists (or iterators of nodes) and yield the values in sorted order.
+    Nothing is relinked; only one value per source is held, so the head of a huge merge can be consumed
+    without finishing it. On equal values the value of the earlier source goes first.
+
+    :param sources: Sorted linked lists or node iterators (LinkedList | CompactLinkedList | Iterable of Node)
+    :param key: Key the sources are sorted by, computed once per value (Callable, optional)
+    :param reverse: The sources are sorted in descending order (Boolean, optional)
+    :return: Merged values (Iterator)
+    """
+    return heapq.merge(
+        *(
+            source.values() if isinstance(source, (LinkedList, CompactLinkedList)) else (node.data for node in source)
+            for source in sources
+        ),
+        key=key,
+        reverse=reverse,
+    )
+
+
+def test_linked_list_operations() -> None:
+
+    ll = LinkedList()
+    for number in [random.randint(1, 100) for _ in range(10)]:
+        ll.append(number)
+
+    print("Зв'язний список:")
+    print(ll)
+
+    print()
+    print("Ітераційна реалізація реверсу (O(n) часу та O(1) пам’яті)")
+    ll_copy = copy.deepcopy(ll)
+    print("Зв'язний список до реверсу:")
+    print(ll)
+    ll_copy.reverse_iterative()
+    print("Зв'язний список після реверсу:")
+    print(ll_copy)
+
+    print()
+    print("Рекурсивна реалізація реверсу (O(n) часу та O(n) пам’яті)")
+    ll_copy = copy.deepcopy(ll)
+    print("Зв'язний список до реверсу:")
+    print(ll)
+    ll_copy.reverse_recursive()
+    print("Зв'язний список після реверсу:")
+    print(ll_copy)
+
+    print()
+    print("Ітераційна реалізація merge sort O(n log n) часу та O(1) пам’яті)")
+    ll_copy = copy.deepcopy(ll)
+    print("Зв'язний список до сортування:")
+    print(ll)
+    ll_copy.sort_iterative()
+    print("Зв'язний список після сортування:")
+    print(ll_copy)
+
+    print()
+    print("Рекурсивна реалізація merge sort (O(n log n) часу та O(log n) пам’яті)")
+    ll_copy = copy.deepcopy(ll)
+    print("Зв'язний список до сортування:")
+    print(ll)
+    ll_copy.sort_recursive()
+    print("Зв'язний список після сортування:")
+    print(ll_copy)
+
+    ll1 = LinkedList()
+    for number in [random.randint(1, 100) for _ in range(10)]:
+        ll1.append(number)
+    ll1.sort_iterative()
+
+    ll2 = LinkedList()
+    for number in [random.randint(1, 100) for _ in range(10)]:
+        ll2.append(number)
+    ll2.sort_iterative()
+
+    print()
+    print("Перший зв'язний відсортований список:")
+    print(ll1)
+    print("Другий зв'язний відсортований список:")
+    print(ll2)
+    ll_merged = merge_sorted_lists(ll1, ll2)
+    print("Об'єднаний зв'язний список:")
+    print(ll_merged)
+
+    dll1 = DoublyLinkedList.from_iterable(sorted(random.randint(1, 100) for _ in range(10)))
+    dll2 = DoublyLinkedList.from_iterable(sorted(random.randint(1, 100) for _ in range(10)))
+
+    print()
+    print("Перший двобічно зв'язний відсортований список:")
+    print(dll1)
+    print("Другий двобічно зв'язний відсортований список:")
+    print(dll2)
+    dll_merged = merge_sorted_lists(dll1, dll2)
+    print("Об'єднаний двобічно зв'язний список:")
+    print(dll_merged)
+
+    print()
+    print("Об'єднання списків різних типів:")
+    try:
+        merge_sorted_lists(ll_merged, dll_merged)
+    except TypeError as e:
+        print(f"TypeError: {e}")
+
+
+# =================================================== Benchmarks ===================================================
+
+
+class _DictNode:
+    """
+    Node with an instance dictionary (the object-per-node layout without __slots__), used as a baseline
+    """
+
+    def __init__(self, data: Any = None) -> None:
+        self.data: Any = data
+        self.next: Optional[_DictNode] = None
+
+
+def _build_chain(node_class: type, values: list[Any]) -> LinkedList:
+    """
+    Build a LinkedList over a chain of nodes of the specified class
+    """
+    dummy_head = node_class()
+    tail = dummy_head
+    for value in values:
+        tail.next = node_class(value)
+        tail = tail.next
+    return LinkedList(head=dummy_head.next)
+
+
+def _build_compact(values: list[Any]) -> CompactLinkedList:
+    ll = CompactLinkedList()
+    for value in values:
+        ll.append(value)
+    return ll
+
+
+def _traced_peak(func: Callable[[], Any]) -> int:
+    """
+    Returns the peak of memory (in bytes) allocated during the call
+    """
+    tracemalloc.start()
+    try:
+        _result = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def benchmark_storage(size: int = 1_000_000, seed: int = 42) -> None:
+    """
+    Memory and throughput of the node storages: Node with __dict__, Node with __slots__, struct of arrays.
+
+    :param size: Number of elements (Integer, optional)
+    :param seed: Initialization of the random number generator for reproducibility (Integer, optional)
+    """
+    rng = random.Random(seed)
+    values = [rng.randint(0, size) for _ in range(size)]
+    builders: dict[str, Callable[[], LinkedList | CompactLinkedList]] = {
+        "Node (__dict__)": lambda: _build_chain(_DictNode, values),
+        "Node (__slots__)": lambda: _build_chain(Node, values),
+        "CompactLinkedList": lambda: _build_compact(values),
+    }
+
+    print(f"\nNode storage, {size:,} elements:")
+    print(" Storage           | Bytes/node |  Build, s | Iterate, s | Reverse, s | Sort iterative, s")
+    print("-------------------+------------+-----------+------------+------------+------------------")
+    for name, builder in builders.items():
+        bytes_per_node = _traced_peak(builder) / size
+        ll, build_time = timed(builder)
+        _, iterate_time = timed(lambda: sum(1 for _ in ll))
+        _, reverse_time = timed(ll.reverse_iterative)
+        _, sort_time = timed(ll.sort_iterative)
+        print(
+            f" {name:<17} | {bytes_per_node:>10.1f} | {build_time:>9.3f} | {iterate_time:>10.3f} "
+            f"| {reverse_time:>10.3f} | {sort_time:>17.3f}"
+        )
+
+
+def benchmark_bulk(size: int = 1_000_000, seed: int = 42) -> None:
+    """
+    Bulk construction and export against per-element append and a plain Python list.
+
+    :param size: Number of elements (Integer, optional)
+    :param seed: Initialization of the random number generator for reproducibility (Integer, optional)
+    """
+    rng = random.Random(seed)
+    values = [rng.randint(0, size) for _ in range(size)]
+
+    def _append_one_by_one_(list_class: type) -> LinkedList | CompactLinkedList:
+        ll = list_class()
+        for value in values:
+            ll.append(value)
+        return ll
+
+    print(f"\nBulk construction and export, {size:,} elements:")
+    print(" Method                                    |  Build, s | Export, s")
+    print("-------------------------------------------+-----------+----------")
+    py_list, build_time = timed(lambda: list(iter(values)))
+    _, export_time = timed(lambda: py_list[:])
+    print(f" {'list':<41} | {build_time:>9.3f} | {export_time:>9.3f}")
+    for list_class in (LinkedList, CompactLinkedList):
+        ll, build_time = timed(lambda: _append_one_by_one_(list_class))
+        _, export_time = timed(lambda: [ll.value(x) for x in ll] if list_class is CompactLinkedList
+                                 else [x.data for x in ll])
+        print(f" {list_class.__name__ + ' append / __iter__':<41} | {build_time:>9.3f} | {export_time:>9.3f}")
+        ll, build_time = timed(lambda: list_class.from_iterable(iter(values)))
+        _, export_time = timed(ll.to_list)
+        print(f" {list_class.__name__ + ' from_iterable / to_list':<41} | {build_time:>9.3f} | {export_time:>9.3f}")
+
+
+def benchmark_index(size: int = 1_000_000, operations: int = 200, seed: int = 42) -> None:
+    """
+    Throughput of find/delete by value: linear scan against the value index,
+    for unique values and for values with many duplicates (about 4 nodes per value).
+
+    :param size: Number of elements (Integer, optional)
+    :param operations: Number of find and of delete operations (Integer, optional)
+    :param seed: Initialization of the random number generator for reproducibility (Integer, optional)
+    """
+    rng = random.Random(seed)
+    unique = list(range(size))
+    rng.shuffle(unique)
+    inputs = {"unique": unique, "duplicates": [rng.randrange(max(1, size // 4)) for _ in range(size)]}
+
+    print(f"\nFind/delete by value, {size:,} elements, {min(operations, size):,} operations of each kind:")
+    print(" Input      | Mode      |  Build, s | Find, ops/s | Delete, ops/s")
+    print("------------+-----------+-----------+-------------+--------------")
+    for input_name, values in inputs.items():
+        targets = rng.sample(values, min(operations, size))
+
+        def _find_all_(ll: LinkedList) -> None:
+            for value in targets:
+                ll.find(value)
+
+        def _delete_all_(ll: LinkedList) -> None:
+            for value in targets:
+                ll.delete(value)
+
+        for name, indexed in (("scan", False), ("indexed", True)):
+            ll, build_time = timed(lambda: LinkedList.from_iterable(values, indexed=indexed))
+            _, find_time = timed(lambda: _find_all_(ll))
+            _, delete_time = timed(lambda: _delete_all_(ll))
+            print(
+                f" {input_name:<10} | {name:<9} | {build_time:>9.3f} | {len(targets) / find_time:>11,.0f} "
+                f"| {len(targets) / delete_time:>13,.0f}"
+            )
+
+
+class _Counted:
+    """
+    Value wrapper that counts the comparisons made by a sort
+    """
+    __slots__ = ("value",)
+    comparisons: int = 0
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __lt__(self, other: "_Counted") -> bool:
+        _Counted.comparisons += 1
+        return self.value < other.value
+
+    def __le__(self, other: "_Counted") -> bool:
+        _Counted.comparisons += 1
+        return self.value <= other.value
+
+
+def benchmark_adaptive_sort(size: int = 1_000_000, seed: int = 42) -> None:
+    """
+    Comparisons and time of the bottom-up and the adaptive (natural runs) merge sort on differently ordered input.
+
+    :param size: Number of elements (Integer, optional)
+    :param seed: Initialization of the random number generator for reproducibility (Integer, optional)
+    """
+    rng = random.Random(seed)
+    nearly_sorted = list(range(size))
+    for _ in range(max(1, size // 100)):
+        i, j = rng.randrange(size), rng.randrange(size)
+        nearly_sorted[i], nearly_sorted[j] = nearly_sorted[j], nearly_sorted[i]
+    random_values = [rng.randint(0, size) for _ in range(size)]
+    inputs: dict[str, list[int]] = {
+        "sorted": list(range(size)),
+        "reversed": list(range(size, 0, -1)),
+        "nearly sorted (1% swaps)": nearly_sorted,
+        "sorted blocks of 1000": [
+            v for start in range(0, size, 1000) for v in sorted(random_values[start:start + 1000])
+        ],
+        "random": random_values,
+    }
+
+    print(f"\nBottom-up against adaptive merge sort, {size:,} elements:")
+    print(" Input                    | Cmp. bottom-up | Cmp. adaptive | Bottom-up, s | Adaptive, s")
+    print("--------------------------+----------------+---------------+--------------+------------")
+    for name, values in inputs.items():
+        row = []
+        for adaptive in (False, True):
+            ll = LinkedList.from_iterable(map(_Counted, values))
+            _Counted.comparisons = 0
+            _, elapsed = timed(lambda: ll.sort_iterative(adaptive=adaptive))
+            row.append((_Counted.comparisons, elapsed))
+        (bottom_up, bottom_up_time), (adaptive, adaptive_time) = row
+        print(f" {name:<24} | {bottom_up:>14,} | {adaptive:>13,} | {bottom_up_time:>12.3f} | {adaptive_time:>11.3f}")
+
+
+def benchmark_k_way_merge(size: int = 1_000_000, lists_number: int = 64, seed: int = 42) -> None:
+    """
+    Merging k sorted lists: pairwise merge_sorted_lists against the heap-based k-way merge.
+
+    :param size: Total number of elements (Integer, optional)
+    :param lists_number: Number of lists (Integer, optional)
+    :param seed: Initialization of the random number generator for reproducibility (Integer, optional)
+    """
+    rng = random.Random(seed)
+    shards = [sorted(rng.randint(0, size) for _ in range(size // lists_number)) for _ in range(lists_number)]
+
+    def _pairwise_() -> LinkedList:
+        merged = LinkedList()
+        for shard in shards:
+            merged = merge_sorted_lists(merged, LinkedList.from_iterable(shard))
+        return merged
+
+    def _k_way_() -> LinkedList:
+        return merge_k_sorted_lists([LinkedList.from_iterable(shard) for shard in shards])
+
+    print(f"\nMerging {lists_number} sorted lists, {size:,} elements in total:")
+    print(" Method                       | Time, s")
+    print("------------------------------+--------")
+    for name, merge in (("pairwise merge_sorted_lists", _pairwise_), ("merge_k_sorted_lists", _k_way_)):
+        _, elapsed = timed(merge)
+        print(f" {name:<28} | {elapsed:>7.3f}")
+    lists = [LinkedList.from_iterable(shard) for shard in shards]
+    _, elapsed = timed(lambda: list(itertools.islice(iter_merged_values(*lists), 10)))
+    print(f" {'iter_merged_values, first 10':<28} | {elapsed:>7.3f}")
+
+
+def benchmark_cursor_edits(size: int = 1_000_000, operations: int = 1_000, seed: int = 42) -> None:
+    """
+    Editing near a cursor in the middle of the list: insert before the cursor and remove the inserted node.
+    LinkedList scans for the predecessor (and deletes by value), DoublyLinkedList does both in O(1).
+
+    :param size: Number of elements (Integer, optional)
+    :param operations: Number of edits (Integer, optional)
+    :param seed: Initialization of the random number generator for reproducibility (Integer, optional)
+    """
+    rng = random.Random(seed)
+    values = [rng.randint(0, size) for _ in range(size)]
+    edits = [-rng.randint(1, size) for _ in range(operations)]
+
+    def _singly_(ll: LinkedList, cursor: Node) -> None:
+        for value in edits:
+            ll.insert_before(cursor, value)
+            ll.delete(value)
+
+    def _doubly_(dll: DoublyLinkedList, cursor: DoublyNode) -> None:
+        for value in edits:
+            dll.remove(dll.insert_before(cursor, value))
+
+    print(f"\nCursor edits in the middle of the list, {size:,} elements, {operations:,} edits:")
+    print(" List             | Edits/s")
+    print("------------------+------------")
+    for name, list_class, edit in (
+            ("LinkedList", LinkedList, _singly_),
+            ("DoublyLinkedList", DoublyLinkedList, _doubly_),
+    ):
+        ll = list_class.from_iterable(values)
+        cursor = next(itertools.islice(iter(ll), size // 2, None))
+        _, elapsed = timed(lambda: edit(ll, cursor))
+        print(f" {name:<16} | {operations / elapsed:>10,.0f}")
+
+
+def benchmark_clone(size: int = 1_000_000, seed: int = 42) -> None:
+    """
+    Cloning a list: shallow and deep clone (copy.copy / copy.deepcopy use them).
+
+    :param size: Number of elements (Integer, optional)
+    :param seed: Initialization of the random number generator for reproducibility (Integer, optional)
+    """
+    rng = random.Random(seed)
+    ll = LinkedList.from_iterable([rng.randint(0, size)] for _ in range(size))
+
+    print(f"\nCloning a list of {size:,} elements (values are one-element lists):")
+    print(" Method                 | Time, s")
+    print("------------------------+--------")
+    for name, clone in (
+            ("to_list (reference)", ll.to_list),
+            ("copy.copy", lambda: copy.copy(ll)),
+            ("copy.deepcopy", lambda: copy.deepcopy(ll)),
+    ):
+        _, elapsed = timed(clone)
+        print(f" {name:<22} | {elapsed:>7.3f}")
+
+
+def benchmark_sorts(size: int = 1_000_000, seed: int = 42) -> None:
+    """
+    Iterative (bottom-up) against recursive (top-down) merge sort on the same random input.
+
+    :param size: Number of elements (Integer, optional)
+    :param seed: Initialization of the random number generator for reproducibility (Integer, optional)
+    """
+    rng = random.Random(seed)
+    values = [rng.randint(0, size) for _ in range(size)]
+
+    print(f"\nMerge sorts, {size:,} random elements:")
+    print(" List              | Iterative, s | Recursive, s")
+    print("-------------------+--------------+-------------")
+    for list_class in (LinkedList, CompactLinkedList):
+        times = []
+        for method in ("sort_iterative", "sort_recursive"):
+            ll = list_class.from_iterable(values)
+            _, elapsed = timed(getattr(ll, method))
+            times.append(elapsed)
+        print(f" {list_class.__name__:<17} | {times[0]:>12.3f} | {times[1]:>12.3f}")
+
+
+BENCHMARKS: dict[str, Callable[..., None]] = {
+    "storage": benchmark_storage,
+    "sorts": benchmark_sorts,
+    "bulk": benchmark_bulk,
+    "index": benchmark_index,
+    "adaptive": benchmark_adaptive_sort,
+    "kway": benchmark_k_way_merge,
+    "cursor": benchmark_cursor_edits,
+    "clone": benchmark_clone,
+}
+
+
+def benchmark_cli() -> None:
+    run_benchmark_cli(
+        "Linked list benchmarks",
+        BENCHMARKS,
+        "-n", "--size",
+        dest="size",
+        default=1_000_000,
+        help_text="Number of elements (default 1000000)",
+    )
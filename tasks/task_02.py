@@ -7,6 +7,11 @@ HomeWork Task 2
 import argparse
 import turtle
 import math
+from typing import Optional
+
+from matplotlib.collections import LineCollection
+
+from .plotting import figure_output
 
 
 def pythagoras_tree(t: turtle.Turtle, x: float, y: float, size: float, angle: float, depth: int) -> None:
@@ -42,13 +47,53 @@ def pythagoras_tree(t: turtle.Turtle, x: float, y: float, size: float, angle: fl
     pythagoras_tree(t, x1, y1, factor * size, angle + math.pi / 4, depth - 1)
 
 
-def draw_pythagoras_tree(depth: int, size: float = 100) -> None:
+def pythagoras_segments(
+        x: float, y: float, size: float, angle: float, depth: int
+) -> list[tuple[tuple[float, float], tuple[float, float]]]:
+    """Segments of the tree drawn by pythagoras_tree, without the turtle
+
+    :param x: X coordinate of the bottom point of the tree trunk in pixels (Float, mandatory)
+    :param y: Y coordinate of the bottom point of the tree trunk in pixels (Float, mandatory)
+    :param size: Tree trunk length in pixels (Float, mandatory)
+    :param angle: Angle of tilt of the tree trunk (Float, mandatory)
+    :param depth: Recursion depth (Integer, mandatory)
+    :return: Segments as pairs of the end points (List of Tuples)
+    """
+
+    # Reduction factor
+    factor = 0.7
+
+    segments = []
+    stack = [(x, y, size, angle, depth)]
+    while stack:
+        x, y, size, angle, depth = stack.pop()
+        x1 = x - size * math.cos(angle)
+        y1 = y + size * math.sin(angle)
+        segments.append(((x, y), (x1, y1)))
+        if depth > 1:
+            stack.append((x1, y1, factor * size, angle + math.pi / 4, depth - 1))
+            stack.append((x1, y1, factor * size, angle - math.pi / 4, depth - 1))
+    return segments
+
+
+def draw_pythagoras_tree(depth: int, size: float = 100, output: Optional[str] = None) -> None:
     """Draw the Pythagoras tree
 
     :param depth: Recursion depth
     :param size: Size of tree trunk
+    :param output: Render to this PNG/SVG/PDF file with matplotlib instead of the turtle window (String, optional)
     """
 
+    if output is not None:
+        with figure_output((8, 8), output=output) as figure:
+            ax = figure.add_subplot()
+            ax.add_collection(LineCollection(pythagoras_segments(0, -size, size, math.pi / 2, depth),
+                                             colors="black", linewidths=1))
+            ax.autoscale_view()
+            ax.set_aspect("equal")
+            ax.set_axis_off()
+        return
+
     window = turtle.Screen()
     window.bgcolor("white")
 
@@ -64,10 +109,11 @@ def cli() -> None:
     try:
         parser = argparse.ArgumentParser(description="Draw the Pythagoras tree", epilog="Good bye!")
         parser.add_argument("-d", "--depth", type=int, default=5, help="Recursion depth (default 5)")
+        parser.add_argument("-o", "--output", help="Render to a PNG/SVG/PDF file instead of the turtle window")
 
         args = parser.parse_args()
 
-        draw_pythagoras_tree(args.depth)
+        draw_pythagoras_tree(args.depth, output=args.output)
     except Exception as e:
         print(e)
 
@@ -4,23 +4,41 @@
 HomeWork Task 3
 """
 
+import argparse
 import heapq
-from typing import Any, Iterable
+import itertools
+import math
+import os
+import random
+import tempfile
+import time
+import weakref
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Iterable, Iterator, Callable, Optional, Sequence
 
+import numpy as np
 import networkx as nx
-import matplotlib.pyplot as plt
+
+from .benchmarking import run_benchmark_cli, timed
+from .contraction_hierarchy import ContractionHierarchy, build_contraction_hierarchy
+from .plotting import figure_output
 
 
 def iter_neighbors(
         graph: nx.Graph | nx.DiGraph | nx.MultiGraph | nx.MultiDiGraph,
-        node: Any
+        node: Any,
+        reverse: bool = False,
 ) -> Iterable[tuple[Any, float]]:
     """
     Iterator of (node, weight) for edges outgoing from the specified node
+    (incoming edges with reverse=True, which differ only for directed graphs).
     For Multi* graphs, choose the minimum weight among parallel edges.
     """
     multigraph = graph.is_multigraph()
-    for neighbor_node, edge_info in graph[node].items():
+    adjacency = graph.pred if reverse and graph.is_directed() else graph.adj
+    for neighbor_node, edge_info in adjacency[node].items():
         if multigraph:
             # Select the minimal weight among the parallel edges node–neighbor_node
             weight = min(d.get("weight", 1.0) for d in edge_info.values())
@@ -29,27 +47,244 @@ def iter_neighbors(
         yield neighbor_node, float(weight)
 
 
-def dijkstra(graph: nx.Graph | nx.DiGraph | nx.MultiGraph | nx.MultiDiGraph, start_node: Any) -> dict[Any, float]:
+class IndexedDaryHeap:
+    """
+    Indexed d-ary min-heap of unique items with a position map, supports a real decrease-key
+    (no outdated records, the heap never holds more than one record per item)
+    """
+
+    def __init__(self, arity: int = 4) -> None:
+        """
+        :param arity: Number of children of a heap node (Integer, optional)
+        """
+        if arity < 2:
+            raise ValueError("The heap arity must be at least 2")
+        self.arity = arity
+        self._priorities: list[float] = []
+        self._items: list[Any] = []
+        self._positions: dict[Any, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __bool__(self) -> bool:
+        return bool(self._items)
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._positions
+
+    def priority(self, item: Any) -> float:
+        """
+        Priority of the item in the heap (KeyError if it is absent)
+        """
+        return self._priorities[self._positions[item]]
+
+    def push(self, item: Any, priority: float) -> None:
+        """
+        Add a new item (ValueError if it is already in the heap)
+        """
+        if item in self._positions:
+            raise ValueError(f"The item {item!r} is already in the heap")
+        self._priorities.append(priority)
+        self._items.append(item)
+        self._sift_up(len(self._items) - 1, item, priority)
+
+    def decrease_key(self, item: Any, priority: float) -> None:
+        """
+        Lower the priority of an item in the heap (ValueError if the new priority is greater)
+        """
+        position = self._positions[item]
+        if priority > self._priorities[position]:
+            raise ValueError(f"The new priority {priority} is greater than the current one")
+        self._sift_up(position, item, priority)
+
+    def push_or_decrease(self, item: Any, priority: float) -> bool:
+        """
+        Add the item or lower its priority. Returns False if the item has a priority not greater than the new one.
+        """
+        position = self._positions.get(item)
+        if position is None:
+            self.push(item, priority)
+            return True
+        if priority < self._priorities[position]:
+            self._sift_up(position, item, priority)
+            return True
+        return False
+
+    def peek(self) -> tuple[float, Any]:
+        """
+        The item with the minimal priority as (priority, item), without removal
+        """
+        if not self._items:
+            raise IndexError("peek from an empty heap")
+        return self._priorities[0], self._items[0]
+
+    def pop(self) -> tuple[float, Any]:
+        """
+        Remove and return the item with the minimal priority as (priority, item)
+        """
+        if not self._items:
+            raise IndexError("pop from an empty heap")
+        priority, item = self._priorities[0], self._items[0]
+        del self._positions[item]
+        last_priority, last_item = self._priorities.pop(), self._items.pop()
+        if self._items:
+            self._sift_down(0, last_item, last_priority)
+        return priority, item
+
+    def _sift_up(self, position: int, item: Any, priority: float) -> None:
+        """
+        Place the item with the priority at the position or above it (the position is a "hole")
+        """
+        priorities, items, positions, arity = self._priorities, self._items, self._positions, self.arity
+        while position:
+            parent = (position - 1) // arity
+            if priorities[parent] <= priority:
+                break
+            priorities[position] = priorities[parent]
+            items[position] = items[parent]
+            positions[items[position]] = position
+            position = parent
+        priorities[position] = priority
+        items[position] = item
+        positions[item] = position
+
+    def _sift_down(self, position: int, item: Any, priority: float) -> None:
+        """
+        Place the item with the priority at the position or below it (the position is a "hole")
+        """
+        priorities, items, positions, arity = self._priorities, self._items, self._positions, self.arity
+        size = len(items)
+        while True:
+            first = position * arity + 1
+            if first >= size:
+                break
+            # The child with the minimal priority
+            child = first
+            for other in range(first + 1, min(first + arity, size)):
+                if priorities[other] < priorities[child]:
+                    child = other
+            if priorities[child] >= priority:
+                break
+            priorities[position] = priorities[child]
+            items[position] = items[child]
+            positions[items[position]] = position
+            position = child
+        priorities[position] = priority
+        items[position] = item
+        positions[item] = position
+
+
+# Priority queue implementations of dijkstra ("auto" selects "dial" or "heapq")
+PRIORITY_QUEUES = ("auto", "heapq", "dary", "dial")
+
+# The maximal edge weight for which "auto" selects Dial’s bucket queue: every bucket of the distance range
+# is visited, so for large weights the empty buckets cost more than the heap operations
+DIAL_MAX_WEIGHT = 1_000
+
+# Results of integer_max_weight for the Versioned* graphs: graph -> (version, maximal weight)
+_INTEGER_MAX_WEIGHTS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def integer_max_weight(graph: nx.Graph | nx.DiGraph | nx.MultiGraph | nx.MultiDiGraph) -> Optional[int]:
+    """
+    The maximal edge weight if all the weights are non-negative integers (by value, 3.0 included), otherwise None.
+    The scan stops at the first other weight; for the Versioned* graphs the result is cached per graph version.
+
+    :param graph: Graph (nx.Graph, mandatory)
+    :return: The maximal weight, 0 for a graph without edges (Integer or None)
+    """
+    versioned = isinstance(graph, _VersionedGraphMixin)
+    if versioned:
+        cached = _INTEGER_MAX_WEIGHTS.get(graph)
+        if cached is not None and cached[0] == graph.version:
+            return cached[1]
+
+    max_weight: Optional[int] = 0
+    for _, _, weight in graph.edges(data="weight", default=1):
+        if weight < 0 or (weight.__class__ is not int and not float(weight).is_integer()):
+            max_weight = None
+            break
+        if weight > max_weight:
+            max_weight = weight
+    if max_weight is not None:
+        max_weight = int(max_weight)
+
+    if versioned:
+        _INTEGER_MAX_WEIGHTS[graph] = (graph.version, max_weight)
+    return max_weight
+
+
+def dijkstra(
+        graph: nx.Graph | nx.DiGraph | nx.MultiGraph | nx.MultiDiGraph,
+        start_node: Any,
+        queue: str = "heapq",
+        arity: int = 4,
+        stats: Optional[dict[str, int]] = None,
+) -> dict[Any, float]:
     """
     Heap-based Dijkstra’s algorithm for networkx graphs (edge attribute "weight").
-    Implemented without decrease-key: uses "lazy" deletion of outdated records.
+    With queue="heapq" it is implemented without decrease-key and uses "lazy" deletion of outdated records,
+    with queue="dary" it uses IndexedDaryHeap with a real decrease-key,
+    with queue="dial" it uses Dial’s bucket queue (integer weights only, O(1) queue operations).
+    With queue="auto" the bucket queue is selected when all the weights are integers up to DIAL_MAX_WEIGHT.
 
     :param graph: Graph, weights must be non-negative (nx.Graph, mandatory)
     :param start_node: Start vertex (Any value, mandatory)
+    :param queue: Priority queue, one of PRIORITY_QUEUES (String, optional)
+    :param arity: Arity of the d-ary heap (Integer, optional)
+    :param stats: Receives "pushes" (with decrease-keys), "pops", "stale_pops", "max_heap_size" (Dictionary, optional)
     :return: Shortest paths to the other vertices (Dictionary of distances)
     """
+    if queue not in PRIORITY_QUEUES:
+        raise ValueError(f"Unknown priority queue {queue!r}, expected one of {', '.join(PRIORITY_QUEUES)}")
 
     # Initialization
     distances = {nodes: float("inf") for nodes in graph.nodes}
     distances[start_node] = 0.0
 
+    max_weight = integer_max_weight(graph) if queue in ("auto", "dial") else None
+    if queue == "dial" and max_weight is None:
+        raise ValueError("Dial’s bucket queue requires non-negative integer edge weights")
+    if queue == "auto":
+        queue = "dial" if max_weight is not None and max_weight <= DIAL_MAX_WEIGHT else "heapq"
+
+    if queue == "dary":
+        counters = _dijkstra_dary(graph, start_node, distances, arity)
+    elif queue == "dial":
+        counters = _dijkstra_dial(graph, start_node, distances, max_weight)
+    else:
+        counters = _dijkstra_heapq(graph, start_node, distances)
+    if stats is not None:
+        stats.update(counters)
+
+    # Remove a start vertex from the shortest paths
+    distances.pop(start_node, None)
+
+    # Return the shortest paths to the vertices
+    return distances
+
+
+def _dijkstra_heapq(
+        graph: nx.Graph | nx.DiGraph | nx.MultiGraph | nx.MultiDiGraph,
+        start_node: Any,
+        distances: dict[Any, float],
+) -> dict[str, int]:
+    """
+    Main loop of dijkstra on heapq with lazy deletion, fills the distances in place and returns the counters
+    """
+    pushes = pops = stale_pops = 0
+    max_heap_size = 1
+
     # Heap initialization
     heap: list[tuple[float, Any]] = [(0.0, start_node)]
     while heap:
         current_distance, current_node = heapq.heappop(heap)
+        pops += 1
 
         if current_distance != distances[current_node]:
             # Outdated record
+            stale_pops += 1
             continue
 
         for neighbor_node, weight in iter_neighbors(graph, current_node):
@@ -59,15 +294,1103 @@ def dijkstra(graph: nx.Graph | nx.DiGraph | nx.MultiGraph | nx.MultiDiGraph, sta
             if distance < distances[neighbor_node]:
                 distances[neighbor_node] = distance
                 heapq.heappush(heap, (distance, neighbor_node))
+                pushes += 1
+        if len(heap) > max_heap_size:
+            max_heap_size = len(heap)
 
-    # Remove a start vertex from the shortest paths
-    distances.pop(start_node, None)
+    return {"pushes": pushes, "pops": pops, "stale_pops": stale_pops, "max_heap_size": max_heap_size}
 
-    # Return the shortest paths to the vertices
+
+def _dijkstra_dary(
+        graph: nx.Graph | nx.DiGraph | nx.MultiGraph | nx.MultiDiGraph,
+        start_node: Any,
+        distances: dict[Any, float],
+        arity: int,
+) -> dict[str, int]:
+    """
+    Main loop of dijkstra on IndexedDaryHeap, fills the distances in place and returns the counters
+    """
+    pushes = pops = 0
+    max_heap_size = 1
+
+    heap = IndexedDaryHeap(arity)
+    heap.push(start_node, 0.0)
+    while heap:
+        current_distance, current_node = heap.pop()
+        pops += 1
+
+        for neighbor_node, weight in iter_neighbors(graph, current_node):
+            if weight < 0:
+                raise ValueError("A negative edge weight was found — Dijkstra’s algorithm is not valid")
+            distance = current_distance + weight
+            if distance < distances[neighbor_node]:
+                distances[neighbor_node] = distance
+                heap.push_or_decrease(neighbor_node, distance)
+                pushes += 1
+        if len(heap) > max_heap_size:
+            max_heap_size = len(heap)
+
+    return {"pushes": pushes, "pops": pops, "stale_pops": 0, "max_heap_size": max_heap_size}
+
+
+def _dijkstra_dial(
+        graph: nx.Graph | nx.DiGraph | nx.MultiGraph | nx.MultiDiGraph,
+        start_node: Any,
+        distances: dict[Any, float],
+        max_weight: int,
+) -> dict[str, int]:
+    """
+    Main loop of dijkstra on Dial’s bucket queue: max_weight + 1 buckets in a ring, the bucket of the distance d
+    is d % (max_weight + 1). The distances are scanned in increasing order, a bucket holds only vertices at the
+    current distance (plus outdated records). Fills the distances in place and returns the counters.
+    """
+    pushes = pops = stale_pops = 0
+    max_heap_size = pending = 1
+
+    ring_size = max_weight + 1
+    buckets: list[list[Any]] = [[] for _ in range(ring_size)]
+    buckets[0].append(start_node)
+    current_distance = 0
+    while pending:
+        bucket = buckets[current_distance % ring_size]
+        # Zero-weight edges append to the current bucket while it is processed
+        while bucket:
+            current_node = bucket.pop()
+            pending -= 1
+            pops += 1
+
+            if distances[current_node] != current_distance:
+                # Outdated record
+                stale_pops += 1
+                continue
+
+            for neighbor_node, weight in iter_neighbors(graph, current_node):
+                distance = current_distance + weight
+                if distance < distances[neighbor_node]:
+                    distances[neighbor_node] = distance
+                    buckets[int(distance) % ring_size].append(neighbor_node)
+                    pending += 1
+                    pushes += 1
+            if pending > max_heap_size:
+                max_heap_size = pending
+        current_distance += 1
+
+    return {"pushes": pushes, "pops": pops, "stale_pops": stale_pops, "max_heap_size": max_heap_size}
+
+
+def _path_to(predecessors: dict[Any, Any], node: Any) -> list[Any]:
+    """
+    Path from the root of the predecessor tree to the node
+    """
+    path = [node]
+    while node in predecessors:
+        node = predecessors[node]
+        path.append(node)
+    path.reverse()
+    return path
+
+
+def shortest_path(
+        graph: nx.Graph | nx.DiGraph | nx.MultiGraph | nx.MultiDiGraph,
+        source: Any,
+        target: Any,
+        stats: Optional[dict[str, int]] = None,
+) -> tuple[float, list[Any]]:
+    """
+    Point-to-point Dijkstra’s algorithm: the search stops as soon as the target is settled
+    and the route is restored from the predecessor map.
+
+    :param graph: Graph, weights must be non-negative (nx.Graph, mandatory)
+    :param source: Start vertex (Any value, mandatory)
+    :param target: Finish vertex (Any value, mandatory)
+    :param stats: Receives the number of settled vertices under the "settled" key (Dictionary, optional)
+    :return: Distance and path from source to target, (inf, []) if the target is unreachable (Tuple)
+    """
+    return astar_shortest_path(graph, source, target, heuristic=lambda node: 0.0, stats=stats)
+
+
+def iter_dijkstra(
+        graph: nx.Graph | nx.DiGraph | nx.MultiGraph | nx.MultiDiGraph,
+        source: Any,
+        max_distance: Optional[float] = None,
+        k: Optional[int] = None,
+        stats: Optional[dict[str, int]] = None,
+) -> Iterator[tuple[Any, float]]:
+    """
+    Lazy Dijkstra’s algorithm: yields (vertex, distance) in non-decreasing order of the distance as the vertices
+    are settled, the source first. The search goes only as far as the consumer reads, and with the cut-offs it
+    stops by itself; the memory depends on the explored neighbourhood, not on the graph size.
+
+    :param graph: Graph, weights must be non-negative (nx.Graph, mandatory)
+    :param source: Start vertex (Any value, mandatory)
+    :param max_distance: Yield only the vertices within this distance (Float, optional)
+    :param k: Yield at most k vertices, the source included (Integer, optional)
+    :param stats: Receives the numbers of "settled" and "reached" vertices when the iteration ends
+        (Dictionary, optional)
+    :return: Pairs (vertex, distance) (Iterator)
+    """
+    if source not in graph:
+        raise ValueError(f"The vertex {source!r} is not in the graph")
+    if k is not None and k < 0:
+        raise ValueError("k must be non-negative")
+    return _iter_dijkstra(graph, source, float("inf") if max_distance is None else max_distance,
+                          -1 if k is None else k, stats)
+
+
+def _iter_dijkstra(
+        graph: nx.Graph | nx.DiGraph | nx.MultiGraph | nx.MultiDiGraph,
+        source: Any,
+        max_distance: float,
+        k: int,
+        stats: Optional[dict[str, int]],
+) -> Iterator[tuple[Any, float]]:
+    """
+    Generator of iter_dijkstra (k = -1 for no limit)
+    """
+    distances = {source: 0.0}
+    settled = 0
+    heap: list[tuple[float, int, Any]] = [(0.0, 0, source)]
+    counter = 1
+    try:
+        while heap and settled != k:
+            current_distance, _, current_node = heapq.heappop(heap)
+            if current_distance > distances[current_node]:
+                # Outdated record
+                continue
+            settled += 1
+            yield current_node, current_distance
+
+            for neighbor_node, weight in iter_neighbors(graph, current_node):
+                if weight < 0:
+                    raise ValueError("A negative edge weight was found — Dijkstra’s algorithm is not valid")
+                distance = current_distance + weight
+                # Vertices beyond the radius are not even queued
+                if distance <= max_distance and distance < distances.get(neighbor_node, float("inf")):
+                    distances[neighbor_node] = distance
+                    heapq.heappush(heap, (distance, counter, neighbor_node))
+                    counter += 1
+    finally:
+        if stats is not None:
+            stats["settled"] = settled
+            stats["reached"] = len(distances)
+
+
+def euclidean_distance(pos_1: tuple[float, ...], pos_2: tuple[float, ...]) -> float:
+    """
+    Straight-line distance between two points
+    """
+    return math.dist(pos_1, pos_2)
+
+
+def haversine_distance(pos_1: tuple[float, float], pos_2: tuple[float, float]) -> float:
+    """
+    Great-circle distance in kilometres between two (latitude, longitude) points in degrees
+    """
+    lat_1, lon_1, lat_2, lon_2 = map(math.radians, (*pos_1, *pos_2))
+    a = math.sin((lat_2 - lat_1) / 2) ** 2 + math.cos(lat_1) * math.cos(lat_2) * math.sin((lon_2 - lon_1) / 2) ** 2
+    return 2 * 6371.0088 * math.asin(math.sqrt(a))
+
+
+METRICS: dict[str, Callable[[Any, Any], float]] = {
+    "euclidean": euclidean_distance,
+    "haversine": haversine_distance,
+}
+
+
+def astar_shortest_path(
+        graph: nx.Graph | nx.DiGraph | nx.MultiGraph | nx.MultiDiGraph,
+        source: Any,
+        target: Any,
+        heuristic: Optional[Callable[[Any], float]] = None,
+        pos_attribute: Optional[str] = None,
+        metric: str = "euclidean",
+        debug: bool = False,
+        stats: Optional[dict[str, int]] = None,
+) -> tuple[float, list[Any]]:
+    """
+    A* search: Dijkstra’s algorithm that settles vertices in the order of distance + estimate of the remaining
+    distance to the target, so it expands far fewer vertices when the estimate is good.
+    The estimate is the heuristic callable, or the metric distance between the coordinates stored in the
+    pos_attribute of the vertices (the same units as the weights). It must be consistent (never exceeds
+    an edge weight plus the estimate of the edge end, zero at the target), then the result is exact.
+
+    :param graph: Graph, weights must be non-negative (nx.Graph, mandatory)
+    :param source: Start vertex (Any value, mandatory)
+    :param target: Finish vertex (Any value, mandatory)
+    :param heuristic: Estimate of the distance from a vertex to the target (Callable, optional)
+    :param pos_attribute: Vertex attribute with the coordinates, used without heuristic (String, optional)
+    :param metric: "euclidean" or "haversine" (for (latitude, longitude) in degrees, kilometres) (String, optional)
+    :param debug: Check the heuristic on every relaxed edge, ValueError if it is not consistent (Boolean, optional)
+    :param stats: Receives the number of settled vertices under the "settled" key (Dictionary, optional)
+    :return: Distance and path from source to target, (inf, []) if the target is unreachable (Tuple)
+    """
+    for node in (source, target):
+        if node not in graph:
+            raise ValueError(f"The vertex {node!r} is not in the graph")
+
+    if heuristic is None:
+        if pos_attribute is None:
+            raise ValueError("Either heuristic or pos_attribute must be specified")
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric {metric!r}, expected one of {', '.join(METRICS)}")
+        distance_function = METRICS[metric]
+        target_pos = graph.nodes[target][pos_attribute]
+
+        def heuristic(node: Any) -> float:
+            return distance_function(graph.nodes[node][pos_attribute], target_pos)
+
+    if debug and heuristic(target) != 0:
+        raise ValueError("The heuristic is not admissible: the estimate at the target is not zero")
+
+    # Only the reached vertices are stored, the estimate is computed once per vertex
+    distances: dict[Any, float] = {source: 0.0}
+    estimates: dict[Any, float] = {source: heuristic(source)}
+    predecessors: dict[Any, Any] = {}
+    settled: set[Any] = set()
+
+    heap: list[tuple[float, int, float, Any]] = [(estimates[source], 0, 0.0, source)]
+    counter = 1  # tie breaker, the vertices themselves may be not comparable
+    try:
+        while heap:
+            _, _, current_distance, current_node = heapq.heappop(heap)
+            if current_node in settled:
+                # Outdated record
+                continue
+            settled.add(current_node)
+            if current_node == target:
+                return current_distance, _path_to(predecessors, target)
+
+            for neighbor_node, weight in iter_neighbors(graph, current_node):
+                if weight < 0:
+                    raise ValueError("A negative edge weight was found — Dijkstra’s algorithm is not valid")
+                if neighbor_node not in estimates:
+                    estimates[neighbor_node] = heuristic(neighbor_node)
+                if debug and estimates[current_node] > weight + estimates[neighbor_node] + 1e-9:
+                    raise ValueError(
+                        f"The heuristic is not consistent on the edge {current_node!r} - {neighbor_node!r}"
+                    )
+                distance = current_distance + weight
+                if distance < distances.get(neighbor_node, float("inf")):
+                    distances[neighbor_node] = distance
+                    predecessors[neighbor_node] = current_node
+                    heapq.heappush(heap, (distance + estimates[neighbor_node], counter, distance, neighbor_node))
+                    counter += 1
+
+        return float("inf"), []
+    finally:
+        if stats is not None:
+            stats["settled"] = len(settled)
+
+
+def bidirectional_shortest_path(
+        graph: nx.Graph | nx.DiGraph | nx.MultiGraph | nx.MultiDiGraph,
+        source: Any,
+        target: Any,
+) -> tuple[float, list[Any]]:
+    """
+    Bidirectional Dijkstra’s algorithm: a forward search from the source and a backward search from the target
+    (over the reversed edges of a directed graph) run in turns, each time the side with the smaller frontier
+    distance makes a step. The search stops when the sum of both frontier distances reaches the best path found.
+
+    :param graph: Graph, weights must be non-negative (nx.Graph, mandatory)
+    :param source: Start vertex (Any value, mandatory)
+    :param target: Finish vertex (Any value, mandatory)
+    :return: Distance and path from source to target, (inf, []) if the target is unreachable (Tuple)
+    """
+    for node in (source, target):
+        if node not in graph:
+            raise ValueError(f"The vertex {node!r} is not in the graph")
+    if source == target:
+        return 0.0, [source]
+
+    # Index 0 — forward search, index 1 — backward search
+    distances: tuple[dict[Any, float], dict[Any, float]] = ({source: 0.0}, {target: 0.0})
+    predecessors: tuple[dict[Any, Any], dict[Any, Any]] = ({}, {})
+    settled: tuple[set[Any], set[Any]] = (set(), set())
+    heaps: tuple[list, list] = ([(0.0, 0, source)], [(0.0, 0, target)])
+    counter = 1
+
+    best_distance, meeting_node = float("inf"), None
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= best_distance:
+            break
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        current_distance, _, current_node = heapq.heappop(heaps[side])
+        if current_node in settled[side]:
+            # Outdated record
+            continue
+        settled[side].add(current_node)
+
+        for neighbor_node, weight in iter_neighbors(graph, current_node, reverse=side == 1):
+            if weight < 0:
+                raise ValueError("A negative edge weight was found — Dijkstra’s algorithm is not valid")
+            distance = current_distance + weight
+            if distance < distances[side].get(neighbor_node, float("inf")):
+                distances[side][neighbor_node] = distance
+                predecessors[side][neighbor_node] = current_node
+                heapq.heappush(heaps[side], (distance, counter, neighbor_node))
+                counter += 1
+            # A path through neighbor_node reached by both searches
+            other_distance = distances[1 - side].get(neighbor_node)
+            if other_distance is not None and distances[side][neighbor_node] + other_distance < best_distance:
+                best_distance, meeting_node = distances[side][neighbor_node] + other_distance, neighbor_node
+
+    if meeting_node is None:
+        return float("inf"), []
+
+    # The forward part ends at the meeting vertex, the backward part goes from it to the target
+    path = _path_to(predecessors[0], meeting_node)
+    node = meeting_node
+    while node in predecessors[1]:
+        node = predecessors[1][node]
+        path.append(node)
+    return best_distance, path
+
+
+class CSRGraph:
+    """
+    Read-only snapshot of a graph in CSR (compressed sparse row) form.
+    Nodes are numbered 0..n-1 (labels[i] is the networkx node), the edges outgoing from node i are
+    indices[indptr[i]:indptr[i + 1]] with their weights at the same positions.
+    Parallel edges are collapsed to the minimal weight, an undirected edge is stored in both directions.
+    """
+
+    def __init__(
+            self,
+            labels: list[Any],
+            indptr: np.ndarray,
+            indices: np.ndarray,
+            weights: np.ndarray,
+            directed: bool,
+    ) -> None:
+        self.labels: list[Any] = labels
+        self.node_ids: dict[Any, int] = {label: i for i, label in enumerate(labels)}
+        self.indptr: np.ndarray = indptr
+        self.indices: np.ndarray = indices
+        self.weights: np.ndarray = weights
+        self.directed: bool = directed
+        self._lists: tuple[list[int], list[int], list[float]] | None = None
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def __repr__(self) -> str:
+        return f"CSRGraph(nodes={len(self.labels)}, edges={len(self.indices)}, directed={self.directed})"
+
+    def as_lists(self) -> tuple[list[int], list[int], list[float]]:
+        """
+        The CSR arrays as Python lists (built once and cached).
+        Interpreted code reads list items much faster than NumPy scalars.
+        """
+        if self._lists is None:
+            self._lists = (self.indptr.tolist(), self.indices.tolist(), self.weights.tolist())
+        return self._lists
+
+
+def compile_graph(graph: nx.Graph | nx.DiGraph | nx.MultiGraph | nx.MultiDiGraph) -> CSRGraph:
+    """
+    Compile a networkx graph into a CSR snapshot (see CSRGraph). Weights are checked for negativity once.
+
+    :param graph: Graph (nx.Graph | nx.DiGraph | nx.MultiGraph | nx.MultiDiGraph, mandatory)
+    :return: CSR snapshot of the graph (CSRGraph)
+    """
+    labels = list(graph.nodes)
+    node_ids = {label: i for i, label in enumerate(labels)}
+
+    indptr = np.zeros(len(labels) + 1, dtype=np.int64)
+    indices: list[int] = []
+    weights: list[float] = []
+    for i, node in enumerate(labels):
+        for neighbor_node, weight in iter_neighbors(graph, node):
+            indices.append(node_ids[neighbor_node])
+            weights.append(weight)
+        indptr[i + 1] = len(indices)
+
+    weights_array = np.asarray(weights, dtype=np.float64)
+    if weights_array.size and weights_array.min() < 0:
+        raise ValueError("A negative edge weight was found — Dijkstra’s algorithm is not valid")
+
+    return CSRGraph(labels, indptr, np.asarray(indices, dtype=np.int64), weights_array, graph.is_directed())
+
+
+def _csr_dijkstra(
+        indptr: Sequence[int], indices: Sequence[int], weights: Sequence[float], source: int
+) -> list[float]:
+    """
+    Heap-based Dijkstra’s algorithm on CSR lists or typed memoryviews (lazy deletion of outdated records).
+    Returns the distances from the source to every node id (inf for unreachable nodes).
+    """
+    distances = [float("inf")] * (len(indptr) - 1)
+    distances[source] = 0.0
+    heap: list[tuple[float, int]] = [(0.0, source)]
+    heappush, heappop = heapq.heappush, heapq.heappop
+    while heap:
+        current_distance, current_node = heappop(heap)
+        if current_distance != distances[current_node]:
+            # Outdated record
+            continue
+        for edge in range(indptr[current_node], indptr[current_node + 1]):
+            neighbor_node = indices[edge]
+            distance = current_distance + weights[edge]
+            if distance < distances[neighbor_node]:
+                distances[neighbor_node] = distance
+                heappush(heap, (distance, neighbor_node))
     return distances
 
 
-def test_dijkstra_heap() -> None:
+def dijkstra_csr(csr: CSRGraph, start_node: Any) -> dict[Any, float]:
+    """
+    Dijkstra’s algorithm on a CSR snapshot of a graph (see compile_graph).
+    Gives the same result as dijkstra, but the search runs on integer ids and flat arrays.
+
+    :param csr: Compiled graph (CSRGraph, mandatory)
+    :param start_node: Start vertex (Any value, mandatory)
+    :return: Shortest paths to the other vertices (Dictionary of distances)
+    """
+    distances = _csr_dijkstra(*csr.as_lists(), csr.node_ids[start_node])
+    result = dict(zip(csr.labels, distances))
+
+    # Remove a start vertex from the shortest paths
+    result.pop(start_node, None)
+    return result
+
+
+# Per-process state of the iter_dijkstra_many / distance_matrix workers:
+# shared memory blocks, views of the CSR arrays and the result matrix
+_WORKER_STATE: dict[str, Any] = {}
+
+
+def _share_array(array: np.ndarray) -> tuple[SharedMemory, tuple[str, tuple[int, ...], str]]:
+    """
+    Copy the array into a new shared memory block. Returns the block and its (name, shape, dtype) description.
+    """
+    block = SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+    return block, (block.name, array.shape, array.dtype.str)
+
+
+def _attach_array(spec: tuple[str, tuple[int, ...], str]) -> tuple[SharedMemory, np.ndarray]:
+    """
+    Attach to the shared memory block described by spec and wrap it into an array (no copy)
+    """
+    name, shape, dtype = spec
+    block = SharedMemory(name=name)
+    return block, np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+
+def _attach_view(spec: tuple[str, tuple[int, ...], str]) -> tuple[SharedMemory, memoryview]:
+    """
+    Attach to the shared memory block described by spec and view it as a flat typed memoryview (no copy).
+    Its items are read as Python numbers, so _csr_dijkstra runs over it as over a list.
+    """
+    name, shape, dtype = spec
+    block = SharedMemory(name=name)
+    dtype = np.dtype(dtype)
+    # The block may be larger than requested (rounded up to pages)
+    return block, block.buf[:math.prod(shape) * dtype.itemsize].cast(dtype.char)
+
+
+def _worker_init(
+        csr_specs: list[tuple[str, tuple[int, ...], str]],
+        result_spec: Optional[tuple[str, tuple[int, ...], str]],
+) -> None:
+    """
+    Worker initializer: attach to the shared CSR arrays (and the result matrix) once per process.
+    The search reads the shared buffers directly, a worker keeps no copy of the graph.
+    """
+    blocks = []
+    views = []
+    for spec in csr_specs:
+        block, view = _attach_view(spec)
+        blocks.append(block)
+        views.append(view)
+    _WORKER_STATE["views"] = tuple(views)
+    if result_spec is not None:
+        block, _WORKER_STATE["result"] = _attach_array(result_spec)
+        blocks.append(block)
+    _WORKER_STATE["blocks"] = blocks
+
+
+def _worker_dijkstra(task: tuple[int, int]) -> Optional[np.ndarray]:
+    """
+    Distances from one source: written into the shared result matrix row, or returned
+    """
+    row, source = task
+    distances = _csr_dijkstra(*_WORKER_STATE["views"], source)
+    if "result" in _WORKER_STATE:
+        _WORKER_STATE["result"][row] = distances
+        return None
+    return np.asarray(distances, dtype=np.float64)
+
+
+def iter_dijkstra_many(
+        graph: CSRGraph | nx.Graph | nx.DiGraph | nx.MultiGraph | nx.MultiDiGraph,
+        sources: Iterable[Any],
+        workers: Optional[int] = None,
+) -> Iterator[tuple[Any, np.ndarray]]:
+    """
+    Dijkstra’s algorithm from many sources in a process pool, the results are streamed per source (in order).
+    The graph is compiled to CSR once and its arrays are placed in shared memory, so every worker attaches to
+    them once instead of receiving a pickled graph with every task.
+
+    :param graph: Graph or its CSR snapshot, weights must be non-negative (CSRGraph | nx.Graph, mandatory)
+    :param sources: Start vertices (Iterable, mandatory)
+    :param workers: Number of processes, all CPUs by default (Integer, optional)
+    :return: Pairs (source, distances to the vertices in the order of CSRGraph.labels) (Iterator)
+    """
+    csr = graph if isinstance(graph, CSRGraph) else compile_graph(graph)
+    sources = list(sources)
+    tasks = [(row, csr.node_ids[source]) for row, source in enumerate(sources)]
+    yield from zip(sources, _run_dijkstra_many(csr, tasks, workers, result=None))
+
+
+def distance_matrix(
+        graph: CSRGraph | nx.Graph | nx.DiGraph | nx.MultiGraph | nx.MultiDiGraph,
+        sources: Iterable[Any],
+        workers: Optional[int] = None,
+) -> tuple[np.ndarray, list[Any]]:
+    """
+    Dense matrix of the shortest distances from many sources, computed in a process pool.
+    The workers write their rows straight into a shared result matrix (see iter_dijkstra_many).
+
+    :param graph: Graph or its CSR snapshot, weights must be non-negative (CSRGraph | nx.Graph, mandatory)
+    :param sources: Start vertices (Iterable, mandatory)
+    :param workers: Number of processes, all CPUs by default (Integer, optional)
+    :return: Matrix len(sources) x len(graph) (inf for unreachable) and the vertices of its columns (Tuple)
+    """
+    csr = graph if isinstance(graph, CSRGraph) else compile_graph(graph)
+    tasks = [(row, csr.node_ids[source]) for row, source in enumerate(sources)]
+    result = np.empty((len(tasks), len(csr)), dtype=np.float64)
+    for _ in _run_dijkstra_many(csr, tasks, workers, result=result):
+        pass
+    return result, csr.labels
+
+
+def _run_dijkstra_many(
+        csr: CSRGraph,
+        tasks: list[tuple[int, int]],
+        workers: Optional[int],
+        result: Optional[np.ndarray],
+) -> Iterator[Optional[np.ndarray]]:
+    """
+    Run the (row, source id) tasks: in the current process for a single worker, otherwise in a process pool
+    over shared memory. Yields the rows in the order of the tasks; with a result matrix the rows are filled in place
+    and None is yielded instead (no views of the shared memory leave this function).
+    The tasks are submitted in a bounded window, so a caller that stops early does not wait for the rest.
+    """
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+    if workers <= 1:
+        lists = csr.as_lists()
+        for row, source in tasks:
+            distances = np.asarray(_csr_dijkstra(*lists, source), dtype=np.float64)
+            if result is not None:
+                result[row] = distances
+                distances = None
+            yield distances
+        return
+
+    blocks: list[SharedMemory] = []
+    shared_result: Optional[np.ndarray] = None
+    try:
+        csr_specs = []
+        for array in (csr.indptr, csr.indices, csr.weights):
+            block, spec = _share_array(array)
+            blocks.append(block)
+            csr_specs.append(spec)
+        result_spec = None
+        if result is not None:
+            block, result_spec = _share_array(result)
+            blocks.append(block)
+            shared_result = np.ndarray(result.shape, dtype=result.dtype, buffer=block.buf)
+
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_worker_init,
+                                       initargs=(csr_specs, result_spec))
+        try:
+            # At most two tasks per worker are submitted ahead, so an early close waits for these only
+            pending: deque[Future] = deque()
+            remaining = iter(tasks)
+            for task in itertools.islice(remaining, 2 * workers):
+                pending.append(executor.submit(_worker_dijkstra, task))
+            while pending:
+                distances = pending.popleft().result()
+                for task in itertools.islice(remaining, 1):
+                    pending.append(executor.submit(_worker_dijkstra, task))
+                yield distances
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        if result is not None:
+            result[...] = shared_result
+    finally:
+        # The array exports the buffer of its block, which cannot be closed while the export exists
+        shared_result = None
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+# Methods of the networkx graph classes which change nodes or edges
+_GRAPH_MUTATORS = (
+    "add_node", "add_nodes_from", "remove_node", "remove_nodes_from",
+    "add_edge", "add_edges_from", "add_weighted_edges_from", "remove_edge", "remove_edges_from",
+    "update", "clear", "clear_edges",
+)
+
+
+class _VersionedGraphMixin:
+    """
+    Graph with a version counter: every node or edge mutation through the graph methods increments it.
+    Changing an attribute in place (graph[u][v]["weight"] = ...) is not tracked, use add_edge(u, v, weight=...)
+    to change a weight or call touch() afterwards.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self.version = 0
+        super().__init__(*args, **kwargs)
+
+    def touch(self) -> None:
+        """
+        Mark the graph as changed
+        """
+        self.version += 1
+
+
+def _versioned_method(name: str) -> Callable[..., Any]:
+    """
+    Wrap a mutator of the networkx graph so that it increments the version
+    """
+
+    def _method_(self: _VersionedGraphMixin, *args: Any, **kwargs: Any) -> Any:
+        result = getattr(super(_VersionedGraphMixin, self), name)(*args, **kwargs)
+        self.version += 1
+        return result
+
+    _method_.__name__ = name
+    return _method_
+
+
+for _name in _GRAPH_MUTATORS:
+    setattr(_VersionedGraphMixin, _name, _versioned_method(_name))
+
+
+class VersionedGraph(_VersionedGraphMixin, nx.Graph):
+    """
+    nx.Graph with a version counter (see DijkstraCache)
+    """
+
+
+class VersionedDiGraph(_VersionedGraphMixin, nx.DiGraph):
+    """
+    nx.DiGraph with a version counter (see DijkstraCache)
+    """
+
+
+class VersionedMultiGraph(_VersionedGraphMixin, nx.MultiGraph):
+    """
+    nx.MultiGraph with a version counter (see DijkstraCache)
+    """
+
+
+class VersionedMultiDiGraph(_VersionedGraphMixin, nx.MultiDiGraph):
+    """
+    nx.MultiDiGraph with a version counter (see DijkstraCache)
+    """
+
+
+def graph_version(graph: nx.Graph | nx.DiGraph | nx.MultiGraph | nx.MultiDiGraph) -> int:
+    """
+    Version of the graph: the counter of the Versioned* graphs.
+    A plain networkx graph has no cheap and reliable version, so it is rejected.
+
+    :param graph: Graph (VersionedGraph | VersionedDiGraph | VersionedMultiGraph | VersionedMultiDiGraph, mandatory)
+    :return: Value which changes when the graph changes (Integer)
+    """
+    if not isinstance(graph, _VersionedGraphMixin):
+        raise TypeError(
+            f"A Versioned* graph is required, got {type(graph).__name__} (wrap it: VersionedGraph(graph), ...)"
+        )
+    return graph.version
+
+
+class DijkstraCache:
+    """
+    LRU cache of the dijkstra results keyed on (graph identity, graph version, start vertex) for the Versioned*
+    graphs (TypeError for the others). A mutation of the graph changes its version, so the cached entries
+    of the graph are dropped on the next lookup; all entries of a graph are dropped when it is garbage collected.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        """
+        :param maxsize: Maximum number of cached shortest path trees (Integer, optional)
+        """
+        if maxsize < 1:
+            raise ValueError("The cache size must be positive")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        # (id(graph), start vertex) -> (graph version, distances); ordered from the least recently used
+        self._entries: OrderedDict[tuple[int, Any], tuple[Any, dict[Any, float]]] = OrderedDict()
+        # id(graph) -> (version of its entries, their start vertices, finalizer)
+        self._graphs: dict[int, tuple[Any, set[Any], weakref.finalize]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __call__(self, graph: nx.Graph | nx.DiGraph | nx.MultiGraph | nx.MultiDiGraph,
+                 start_node: Any) -> dict[Any, float]:
+        return self.dijkstra(graph, start_node)
+
+    def dijkstra(self, graph: nx.Graph | nx.DiGraph | nx.MultiGraph | nx.MultiDiGraph,
+                 start_node: Any) -> dict[Any, float]:
+        """
+        Cached dijkstra(graph, start_node)
+
+        :param graph: Versioned* graph, weights must be non-negative (VersionedGraph, mandatory)
+        :param start_node: Start vertex (Any value, mandatory)
+        :return: Shortest paths to the other vertices, a copy which may be changed (Dictionary of distances)
+        """
+        graph_id = id(graph)
+        version = graph_version(graph)
+
+        known = self._graphs.get(graph_id)
+        if known is not None and known[0] != version:
+            # The graph changed: its entries are outdated
+            self._drop_graph(graph_id)
+            self.invalidations += len(known[1])
+            known = None
+
+        key = (graph_id, start_node)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return dict(entry[1])
+
+        self.misses += 1
+        distances = dijkstra(graph, start_node)
+
+        if known is None:
+            known = (version, set(), weakref.finalize(graph, self._drop_graph, graph_id))
+            self._graphs[graph_id] = known
+        known[1].add(start_node)
+        self._entries[key] = (version, distances)
+
+        while len(self._entries) > self.maxsize:
+            (evicted_id, evicted_start), _ = self._entries.popitem(last=False)
+            self.evictions += 1
+            starts = self._graphs[evicted_id][1]
+            starts.discard(evicted_start)
+            if not starts:
+                self._drop_graph(evicted_id)
+
+        return dict(distances)
+
+    def _drop_graph(self, graph_id: int) -> None:
+        """
+        Remove all entries of the graph
+        """
+        known = self._graphs.pop(graph_id, None)
+        if known is None:
+            return
+        known[2].detach()
+        for start_node in known[1]:
+            self._entries.pop((graph_id, start_node), None)
+
+    def clear(self) -> None:
+        """
+        Remove all entries (the counters are kept)
+        """
+        for graph_id in list(self._graphs):
+            self._drop_graph(graph_id)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Counters for sizing the cache
+
+        :return: Size, maximum size, hits, misses, evictions and invalidations (Dictionary)
+        """
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+def shortest_path_tree(
+        graph: nx.Graph | nx.DiGraph | nx.MultiGraph | nx.MultiDiGraph,
+        source: Any,
+) -> tuple[dict[Any, float], dict[Any, Any]]:
+    """
+    Dijkstra’s algorithm with the predecessor tree
+
+    :param graph: Graph, weights must be non-negative (nx.Graph, mandatory)
+    :param source: Start vertex (Any value, mandatory)
+    :return: Distances to all vertices (the source included, inf for unreachable) and predecessors (Tuple)
+    """
+    if source not in graph:
+        raise ValueError(f"The vertex {source!r} is not in the graph")
+    distances = {node: float("inf") for node in graph.nodes}
+    distances[source] = 0.0
+    predecessors: dict[Any, Any] = {}
+    heap: list[tuple[float, int, Any]] = [(0.0, 0, source)]
+    counter = 1
+    while heap:
+        current_distance, _, current_node = heapq.heappop(heap)
+        if current_distance != distances[current_node]:
+            # Outdated record
+            continue
+        for neighbor_node, weight in iter_neighbors(graph, current_node):
+            if weight < 0:
+                raise ValueError("A negative edge weight was found — Dijkstra’s algorithm is not valid")
+            distance = current_distance + weight
+            if distance < distances[neighbor_node]:
+                distances[neighbor_node] = distance
+                predecessors[neighbor_node] = current_node
+                heapq.heappush(heap, (distance, counter, neighbor_node))
+                counter += 1
+    return distances, predecessors
+
+
+class DynamicShortestPaths:
+    """
+    Single-source shortest paths kept up to date under edge updates (nx.Graph or nx.DiGraph).
+    The edges are changed through the methods of this class, which update the graph and then repair
+    only the affected part of the shortest path tree:
+    - a shorter or new edge u -> v: a Dijkstra’s search from v, limited to the vertices which get closer;
+    - a longer or deleted tree edge u -> v: the subtree of v is detached, its vertices get the best distances
+      through the rest of the tree and a Dijkstra’s search runs inside the subtree;
+    - a longer or deleted edge outside the tree changes nothing.
+    Every update returns the number of touched vertices (also kept in last_touched).
+    """
+
+    def __init__(
+            self,
+            graph: nx.Graph | nx.DiGraph,
+            source: Any,
+            distances: Optional[dict[Any, float]] = None,
+            predecessors: Optional[dict[Any, Any]] = None,
+    ) -> None:
+        """
+        :param graph: Graph, weights must be non-negative (nx.Graph | nx.DiGraph, mandatory)
+        :param source: Start vertex (Any value, mandatory)
+        :param distances: Distances to all vertices, the source included (Dictionary, optional)
+        :param predecessors: Shortest path tree for the distances (Dictionary, optional)
+        """
+        if graph.is_multigraph():
+            raise ValueError("Multigraphs are not supported: an edge update must identify a single edge")
+        if (distances is None) != (predecessors is None):
+            raise ValueError("The distances and the predecessors must be given together")
+        if distances is None:
+            distances, predecessors = shortest_path_tree(graph, source)
+        self.graph = graph
+        self.source = source
+        self.distances = dict(distances)
+        self.distances.setdefault(source, 0.0)
+        self.predecessors = dict(predecessors)
+        self.children: dict[Any, set[Any]] = {}
+        for node, parent in self.predecessors.items():
+            self.children.setdefault(parent, set()).add(node)
+        self.last_touched = 0
+
+    def distance(self, node: Any) -> float:
+        """
+        Current distance from the source to the vertex (inf if it is unreachable)
+        """
+        return self.distances.get(node, float("inf"))
+
+    def path(self, node: Any) -> list[Any]:
+        """
+        Current shortest path from the source to the vertex ([] if it is unreachable)
+        """
+        if self.distance(node) == float("inf"):
+            return []
+        return _path_to(self.predecessors, node)
+
+    def update_weight(self, u: Any, v: Any, weight: float) -> int:
+        """
+        Change the weight of the existing edge u - v
+
+        :param u: First vertex of the edge (Any value, mandatory)
+        :param v: Second vertex of the edge (Any value, mandatory)
+        :param weight: New non-negative weight (Float, mandatory)
+        :return: Number of touched vertices (Integer)
+        """
+        if not self.graph.has_edge(u, v):
+            raise ValueError(f"The edge {u!r} - {v!r} is not in the graph")
+        if weight < 0:
+            raise ValueError("A negative edge weight was found — Dijkstra’s algorithm is not valid")
+        old_weight = float(self.graph[u][v].get("weight", 1.0))
+        # Through add_edge, so that a Versioned* graph changes its version (see DijkstraCache)
+        self.graph.add_edge(u, v, weight=weight)
+        if weight < old_weight:
+            return self._decreased(u, v, float(weight))
+        if weight > old_weight:
+            return self._increased(u, v)
+        self.last_touched = 0
+        return 0
+
+    def insert_edge(self, u: Any, v: Any, weight: float = 1.0) -> int:
+        """
+        Add the edge u - v (new vertices are added as unreachable) or lower the weight of an existing one
+
+        :param u: First vertex of the edge (Any value, mandatory)
+        :param v: Second vertex of the edge (Any value, mandatory)
+        :param weight: Non-negative weight (Float, optional)
+        :return: Number of touched vertices (Integer)
+        """
+        if self.graph.has_edge(u, v):
+            return self.update_weight(u, v, weight)
+        if weight < 0:
+            raise ValueError("A negative edge weight was found — Dijkstra’s algorithm is not valid")
+        self.graph.add_edge(u, v, weight=weight)
+        for node in (u, v):
+            self.distances.setdefault(node, float("inf"))
+        return self._decreased(u, v, float(weight))
+
+    def delete_edge(self, u: Any, v: Any) -> int:
+        """
+        Remove the edge u - v (the vertices stay in the graph)
+
+        :param u: First vertex of the edge (Any value, mandatory)
+        :param v: Second vertex of the edge (Any value, mandatory)
+        :return: Number of touched vertices (Integer)
+        """
+        if not self.graph.has_edge(u, v):
+            raise ValueError(f"The edge {u!r} - {v!r} is not in the graph")
+        self.graph.remove_edge(u, v)
+        return self._increased(u, v)
+
+    def _arcs(self, u: Any, v: Any) -> list[tuple[Any, Any]]:
+        """
+        Directed arcs of the edge u - v
+        """
+        return [(u, v)] if self.graph.is_directed() else [(u, v), (v, u)]
+
+    def _set_parent(self, node: Any, parent: Optional[Any]) -> None:
+        """
+        Move the vertex under another parent of the tree (None detaches it)
+        """
+        old_parent = self.predecessors.pop(node, None)
+        if old_parent is not None:
+            self.children[old_parent].discard(node)
+        if parent is not None:
+            self.predecessors[node] = parent
+            self.children.setdefault(parent, set()).add(node)
+
+    def _decreased(self, u: Any, v: Any, weight: float) -> int:
+        """
+        Repair after the edge u - v became shorter (or appeared)
+        """
+        distances = self.distances
+        heap: list[tuple[float, int, Any]] = []
+        counter = 0
+        for tail, head in self._arcs(u, v):
+            distance = distances[tail] + weight
+            if distance < distances[head]:
+                distances[head] = distance
+                self._set_parent(head, tail)
+                heap.append((distance, counter, head))
+                counter += 1
+        heapq.heapify(heap)
+
+        touched = set()
+        while heap:
+            current_distance, _, current_node = heapq.heappop(heap)
+            if current_distance != distances[current_node]:
+                # Outdated record
+                continue
+            touched.add(current_node)
+            for neighbor_node, neighbor_weight in iter_neighbors(self.graph, current_node):
+                distance = current_distance + neighbor_weight
+                if distance < distances[neighbor_node]:
+                    distances[neighbor_node] = distance
+                    self._set_parent(neighbor_node, current_node)
+                    heapq.heappush(heap, (distance, counter, neighbor_node))
+                    counter += 1
+
+        self.last_touched = len(touched)
+        return self.last_touched
+
+    def _increased(self, u: Any, v: Any) -> int:
+        """
+        Repair after the edge u - v became longer (or disappeared)
+        """
+        # Only the subtrees hanging on the edge are affected
+        roots = [head for tail, head in self._arcs(u, v) if self.predecessors.get(head) == tail]
+        if not roots:
+            self.last_touched = 0
+            return 0
+
+        affected = set()
+        stack = list(roots)
+        while stack:
+            node = stack.pop()
+            affected.add(node)
+            stack.extend(self.children.get(node, ()))
+
+        # Best distances through the unaffected vertices, whose distances are still correct
+        distances = self.distances
+        heap: list[tuple[float, int, Any]] = []
+        counter = 0
+        for node in affected:
+            best, parent = float("inf"), None
+            for neighbor_node, weight in iter_neighbors(self.graph, node, reverse=True):
+                if neighbor_node not in affected and distances[neighbor_node] + weight < best:
+                    best, parent = distances[neighbor_node] + weight, neighbor_node
+            distances[node] = best
+            self._set_parent(node, parent)
+            if parent is not None:
+                heap.append((best, counter, node))
+                counter += 1
+        heapq.heapify(heap)
+
+        # Dijkstra’s search inside the affected subtrees
+        while heap:
+            current_distance, _, current_node = heapq.heappop(heap)
+            if current_distance != distances[current_node]:
+                # Outdated record
+                continue
+            for neighbor_node, weight in iter_neighbors(self.graph, current_node):
+                distance = current_distance + weight
+                if neighbor_node in affected and distance < distances[neighbor_node]:
+                    distances[neighbor_node] = distance
+                    self._set_parent(neighbor_node, current_node)
+                    heapq.heappush(heap, (distance, counter, neighbor_node))
+                    counter += 1
+
+        self.last_touched = len(affected)
+        return self.last_touched
+
+    def verify(self) -> bool:
+        """
+        Compare the distances with a full recomputation and check the predecessor tree
+
+        :return: True if the structure is consistent with the graph (Boolean)
+        """
+        expected = dijkstra(self.graph, self.source)
+        expected[self.source] = 0.0
+        if expected != self.distances:
+            return False
+        for node, parent in self.predecessors.items():
+            if not self.graph.has_edge(parent, node):
+                return False
+            weight = float(self.graph[parent][node].get("weight", 1.0))
+            if self.distances[parent] + weight != self.distances[node]:
+                return False
+        return all(node in self.children.get(parent, ()) for node, parent in self.predecessors.items())
+
+
+def test_dijkstra_heap(output: Optional[str] = None) -> None:
+    """
+    Dijkstra's algorithm on a small graph of cities and roads with its visualization.
+
+    :param output: Render the graph to this PNG/SVG/PDF file instead of showing a window (String, optional)
+    """
 
     # Graph creation
     graph = nx.Graph()
@@ -81,10 +1404,11 @@ def test_dijkstra_heap() -> None:
 
     # Graph visualization
     pos = nx.spring_layout(graph, seed=42)
-    nx.draw(graph, pos, with_labels=True, node_size=700, node_color="skyblue", font_size=15, width=2)
-    labels = nx.get_edge_attributes(graph, "weight")
-    nx.draw_networkx_edge_labels(graph, pos, edge_labels=labels)
-    plt.show()
+    with figure_output(output=output) as figure:
+        ax = figure.add_subplot()
+        nx.draw(graph, pos, ax=ax, with_labels=True, node_size=700, node_color="skyblue", font_size=15, width=2)
+        labels = nx.get_edge_attributes(graph, "weight")
+        nx.draw_networkx_edge_labels(graph, pos, edge_labels=labels, ax=ax)
 
     # Graph information
     print(f"Graph: {graph}")
@@ -94,3 +1418,468 @@ def test_dijkstra_heap() -> None:
 
     # Using Dijkstra’s algorithm
     print(f"Dijkstra shortest path: {dijkstra(graph, "A")}")
+
+
+def cli() -> None:
+    try:
+        parser = argparse.ArgumentParser(description="Dijkstra's algorithm on a small graph", epilog="Good bye!")
+        parser.add_argument("-o", "--output", help="Render the graph to a PNG/SVG/PDF file instead of showing a window")
+
+        args = parser.parse_args()
+
+        test_dijkstra_heap(output=args.output)
+    except Exception as e:
+        print(e)
+
+    exit(0)
+
+
+# =================================================== Benchmarks ===================================================
+
+
+def road_graph(side: int = 100, seed: int = 42) -> nx.Graph:
+    """
+    Road-like test graph: a side x side grid of crossroads with integer road lengths 1..10
+    and the crossroad coordinates in the "pos" node attribute (a road is never shorter than the straight line).
+
+    :param side: Number of crossroads along a side (Integer, optional)
+    :param seed: Initialization of the random number generator for reproducibility (Integer, optional)
+    :return: Graph (nx.Graph)
+    """
+    rng = random.Random(seed)
+    graph = nx.grid_2d_graph(side, side)
+    for u, v in graph.edges:
+        graph.edges[u, v]["weight"] = rng.randint(1, 10)
+    for node in graph.nodes:
+        graph.nodes[node]["pos"] = node
+    return graph
+
+
+def benchmark_csr(side: int = 300, queries: int = 5, seed: int = 42) -> None:
+    """
+    Dijkstra on the networkx graph against Dijkstra on its CSR snapshot.
+
+    :param side: Side of the road-like grid graph (Integer, optional)
+    :param queries: Number of start vertices (Integer, optional)
+    :param seed: Initialization of the random number generator for reproducibility (Integer, optional)
+    """
+    graph = road_graph(side, seed)
+    sources = random.Random(seed).sample(list(graph.nodes), queries)
+
+    csr, compile_time = timed(lambda: compile_graph(graph))
+    _, lists_time = timed(csr.as_lists)
+
+    nx_times, csr_times = [], []
+    for source in sources:
+        expected, elapsed = timed(lambda: dijkstra(graph, source))
+        nx_times.append(elapsed)
+        result, elapsed = timed(lambda: dijkstra_csr(csr, source))
+        csr_times.append(elapsed)
+        if result != expected:
+            raise AssertionError("CSR Dijkstra result differs from dijkstra")
+
+    print(f"\nDijkstra on {graph} ({csr.indices.size:,} directed arcs), {queries} queries:")
+    print(f" Compilation: {compile_time:.3f} s, list cache: {lists_time:.3f} s")
+    print(f" dijkstra:     {sum(nx_times) / queries:.3f} s per query")
+    print(f" dijkstra_csr: {sum(csr_times) / queries:.3f} s per query "
+          f"(x{sum(nx_times) / sum(csr_times):.1f})")
+
+
+def benchmark_point_to_point(side: int = 300, queries: int = 5, seed: int = 42) -> None:
+    """
+    Full-graph dijkstra against shortest_path (early termination) and bidirectional_shortest_path.
+
+    :param side: Side of the road-like grid graph (Integer, optional)
+    :param queries: Number of source-target pairs (Integer, optional)
+    :param seed: Initialization of the random number generator for reproducibility (Integer, optional)
+    """
+    graph = road_graph(side, seed)
+    rng = random.Random(seed)
+    pairs = [tuple(rng.sample(list(graph.nodes), 2)) for _ in range(queries)]
+
+    times: dict[str, float] = {"dijkstra": 0.0, "shortest_path": 0.0, "bidirectional_shortest_path": 0.0}
+    for source, target in pairs:
+        distances, elapsed = timed(lambda: dijkstra(graph, source))
+        times["dijkstra"] += elapsed
+        for name, search in (("shortest_path", shortest_path), ("bidirectional_shortest_path",
+                                                                 bidirectional_shortest_path)):
+            (distance, path), elapsed = timed(lambda: search(graph, source, target))
+            times[name] += elapsed
+            if distance != distances[target] or path[0] != source or path[-1] != target:
+                raise AssertionError(f"{name} result differs from dijkstra")
+
+    print(f"\nPoint-to-point queries on {graph}, {queries} random pairs:")
+    print(" Method                      | Time per query, s")
+    print("-----------------------------+------------------")
+    for name, elapsed in times.items():
+        print(f" {name:<27} | {elapsed / queries:>17.3f}")
+
+
+def geometric_graph(nodes: int = 10_000, seed: int = 42) -> nx.Graph:
+    """
+    Geometric test graph: random points in the unit square joined when closer than a radius
+    (chosen for connectivity), the weight of a road is its length times a detour factor 1..1.3.
+
+    :param nodes: Number of vertices (Integer, optional)
+    :param seed: Initialization of the random number generator for reproducibility (Integer, optional)
+    :return: Graph with the "pos" vertex attribute (nx.Graph)
+    """
+    rng = random.Random(seed)
+    radius = 1.5 * math.sqrt(math.log(nodes) / (math.pi * nodes))
+    points = [(rng.random(), rng.random()) for _ in range(nodes)]
+
+    graph = nx.Graph()
+    for node, pos in enumerate(points):
+        graph.add_node(node, pos=pos)
+
+    # Only the points of the neighbouring cells of a radius x radius grid can be closer than the radius
+    cells: dict[tuple[int, int], list[int]] = {}
+    for node, (x, y) in enumerate(points):
+        cells.setdefault((int(x / radius), int(y / radius)), []).append(node)
+    for (cx, cy), cell_nodes in cells.items():
+        for dx, dy in ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1)):
+            for u in cell_nodes:
+                for v in cells.get((cx + dx, cy + dy), ()):
+                    if (dx, dy) == (0, 0) and v <= u:
+                        continue
+                    length = math.dist(points[u], points[v])
+                    if length <= radius:
+                        graph.add_edge(u, v, weight=length * (1 + 0.3 * rng.random()))
+    return graph
+
+
+def benchmark_astar(side: int = 300, queries: int = 5, seed: int = 42) -> None:
+    """
+    Settled vertices and time: dijkstra, shortest_path and A* with the Euclidean estimate on a geometric graph.
+
+    :param side: The graph has side * side vertices (Integer, optional)
+    :param queries: Number of source-target pairs (Integer, optional)
+    :param seed: Initialization of the random number generator for reproducibility (Integer, optional)
+    """
+    graph = geometric_graph(side * side, seed)
+    component = max(nx.connected_components(graph), key=len)
+    rng = random.Random(seed)
+    pairs = [tuple(rng.sample(sorted(component), 2)) for _ in range(queries)]
+
+    settled: dict[str, int] = {"dijkstra": 0, "shortest_path": 0, "astar_shortest_path": 0}
+    times: dict[str, float] = {name: 0.0 for name in settled}
+    for source, target in pairs:
+        distances, elapsed = timed(lambda: dijkstra(graph, source))
+        times["dijkstra"] += elapsed
+        # dijkstra settles every reachable vertex
+        settled["dijkstra"] += sum(1 for distance in distances.values() if distance < float("inf")) + 1
+        for name, search in (
+                ("shortest_path", lambda stats: shortest_path(graph, source, target, stats=stats)),
+                ("astar_shortest_path", lambda stats: astar_shortest_path(
+                    graph, source, target, pos_attribute="pos", stats=stats
+                )),
+        ):
+            stats: dict[str, int] = {}
+            (distance, _), elapsed = timed(lambda: search(stats))
+            times[name] += elapsed
+            settled[name] += stats["settled"]
+            if not math.isclose(distance, distances[target]):
+                raise AssertionError(f"{name} result differs from dijkstra")
+
+    print(f"\nA* on a geometric {graph}, {queries} random pairs:")
+    print(" Method              | Settled per query | Time per query, s")
+    print("---------------------+-------------------+------------------")
+    for name in settled:
+        print(f" {name:<19} | {settled[name] / queries:>17,.0f} | {times[name] / queries:>17.4f}")
+
+
+def benchmark_many_sources(side: int = 300, sources_number: int = 32, seed: int = 42) -> None:
+    """
+    Throughput of distance_matrix with 1, 2, 4, ... worker processes (up to the number of CPUs).
+
+    :param side: Side of the road-like grid graph (Integer, optional)
+    :param sources_number: Number of sources (Integer, optional)
+    :param seed: Initialization of the random number generator for reproducibility (Integer, optional)
+    """
+    graph = road_graph(side, seed)
+    csr = compile_graph(graph)
+    sources = random.Random(seed).sample(list(graph.nodes), sources_number)
+
+    cpus = os.cpu_count() or 1
+    workers_numbers = sorted({1, cpus, *(2 ** p for p in range(1, cpus.bit_length()) if 2 ** p < cpus)})
+
+    print(f"\nDistance matrix {sources_number} x {len(csr):,} on {graph}, {cpus} CPUs:")
+    print(" Workers | Time, s | Sources/s | Speedup")
+    print("---------+---------+-----------+--------")
+    reference, single_time = None, None
+    for workers in workers_numbers:
+        (matrix, _), elapsed = timed(lambda: distance_matrix(csr, sources, workers=workers))
+        if reference is None:
+            reference, single_time = matrix, elapsed
+        elif not np.array_equal(matrix, reference):
+            raise AssertionError("The distance matrix depends on the number of workers")
+        print(f" {workers:>7} | {elapsed:>7.3f} | {sources_number / elapsed:>9.1f} | {single_time / elapsed:>6.2f}x")
+
+
+def benchmark_cache(side: int = 150, queries: int = 100, starts: int = 20, seed: int = 42) -> None:
+    """
+    Repeated dijkstra queries with and without DijkstraCache, with a mutation of the graph in the middle.
+
+    :param side: Side of the road-like grid graph (Integer, optional)
+    :param queries: Number of queries (Integer, optional)
+    :param starts: Number of distinct start vertices, the queries are drawn from them (Integer, optional)
+    :param seed: Initialization of the random number generator for reproducibility (Integer, optional)
+    """
+    graph = VersionedGraph(road_graph(side, seed))
+    generator = random.Random(seed)
+    nodes = list(graph.nodes)
+    start_nodes = generator.sample(nodes, starts)
+    stream = [generator.choice(start_nodes) for _ in range(queries)]
+    cache = DijkstraCache(maxsize=max(1, starts // 2))
+
+    def _run_(search: Callable[[Any, Any], dict[Any, float]]) -> None:
+        for i, start_node in enumerate(stream):
+            if i == queries // 2:
+                u, v = next(iter(graph.edges))
+                graph.add_edge(u, v, weight=graph[u][v]["weight"])
+            search(graph, start_node)
+
+    _, plain_time = timed(lambda: _run_(dijkstra))
+    _, cached_time = timed(lambda: _run_(cache))
+
+    print(f"\n{queries} queries from {starts} start vertices on {graph}, cache size {cache.maxsize}:")
+    print(f"   dijkstra: {plain_time:.3f} s")
+    print(f"   cached:   {cached_time:.3f} s  ({plain_time / cached_time:.2f}x)")
+    print("   " + ", ".join(f"{name} {value}" for name, value in cache.stats().items()))
+
+
+def dense_graph(nodes: int = 1_000, density: float = 0.2, seed: int = 42) -> nx.Graph:
+    """
+    Random graph G(n, p) with uniform integer weights 1..100
+
+    :param nodes: Number of vertices (Integer, optional)
+    :param density: Probability of an edge (Float, optional)
+    :param seed: Initialization of the random number generator for reproducibility (Integer, optional)
+    :return: Graph (nx.Graph)
+    """
+    generator = random.Random(seed)
+    graph = nx.gnp_random_graph(nodes, density, seed=seed)
+    for u, v in graph.edges:
+        graph[u][v]["weight"] = generator.randint(1, 100)
+    return graph
+
+
+def benchmark_priority_queues(side: int = 300, dense_nodes: int = 1_000, seed: int = 42) -> None:
+    """
+    dijkstra with the heapq queue (lazy deletion) against IndexedDaryHeap (decrease-key)
+    on a sparse road-like grid and on a dense random graph.
+
+    :param side: Side of the road-like grid graph (Integer, optional)
+    :param dense_nodes: Number of vertices of the dense graph (Integer, optional)
+    :param seed: Initialization of the random number generator for reproducibility (Integer, optional)
+    """
+    graphs = {
+        "sparse": road_graph(side, seed),
+        "dense": dense_graph(dense_nodes, seed=seed),
+    }
+    variants = [("heapq", 2), ("dary", 2), ("dary", 4), ("dary", 8)]
+
+    print("\nPriority queues of dijkstra:")
+    print(" Graph  | Vertices | Edges      | Queue   | Time, s | Max heap | Pushes     | Stale pops")
+    print("--------+----------+------------+---------+---------+----------+------------+-----------")
+    for name, graph in graphs.items():
+        start_node = next(iter(graph.nodes))
+        expected = None
+        for queue, arity in variants:
+            stats: dict[str, int] = {}
+            result, elapsed = timed(lambda: dijkstra(graph, start_node, queue=queue, arity=arity, stats=stats))
+            if expected is None:
+                expected = result
+            elif result != expected:
+                raise AssertionError(f"dijkstra with the {queue} queue gives a different result")
+            label = queue if queue == "heapq" else f"{arity}-ary"
+            print(f" {name:<6} | {graph.number_of_nodes():>8,} | {graph.number_of_edges():>10,} | {label:<7} | "
+                  f"{elapsed:>7.3f} | {stats['max_heap_size']:>8,} | {stats['pushes']:>10,} | "
+                  f"{stats['stale_pops']:>10,}")
+
+
+def benchmark_integer_weights(side: int = 300, repeats: int = 3, seed: int = 42) -> None:
+    """
+    dijkstra with Dial’s bucket queue against the heaps on graphs with integer weights:
+    a grid with unit weights, a road-like grid (weights 1..10) and the same roads in metres (weights 100..1000).
+    The time of the weight scan (integer_max_weight, part of "dial" and "auto") is reported separately.
+
+    :param side: Side of the grid graphs (Integer, optional)
+    :param repeats: The best time of that many runs is reported (Integer, optional)
+    :param seed: Initialization of the random number generator for reproducibility (Integer, optional)
+    """
+    grid = nx.grid_2d_graph(side, side)
+    roads = road_graph(side, seed)
+    rng = random.Random(seed)
+    metres = nx.Graph()
+    metres.add_weighted_edges_from((u, v, w * 100 - rng.randrange(100)) for u, v, w in roads.edges(data="weight"))
+    graphs = {"grid": grid, "road": roads, "road, m": metres}
+    variants = [("heapq", "heapq"), ("4-ary", "dary"), ("dial", "dial"), ("auto", "auto")]
+
+    print(f"\nInteger weights, {side} x {side} grids, the best of {repeats} runs:")
+    print(" Graph   | Max weight | Scan, s | Queue | Time, s | Stale pops")
+    print("---------+------------+---------+-------+---------+-----------")
+    for name, graph in graphs.items():
+        start_node = (side // 2, side // 2)
+        max_weight, scan_time = timed(lambda: integer_max_weight(graph))
+        expected = None
+        for label, queue in variants:
+            stats: dict[str, int] = {}
+            elapsed = math.inf
+            for _ in range(repeats):
+                result, run_time = timed(lambda: dijkstra(graph, start_node, queue=queue, stats=stats))
+                elapsed = min(elapsed, run_time)
+            if expected is None:
+                expected = result
+            elif result != expected:
+                raise AssertionError(f"dijkstra with the {queue} queue gives a different result")
+            print(f" {name:<7} | {max_weight:>10,} | {scan_time:>7.3f} | {label:<5} | {elapsed:>7.3f} | "
+                  f"{stats['stale_pops']:>10,}")
+
+
+def benchmark_contraction_hierarchy(side: int = 150, queries: int = 1_000, checks: int = 5, seed: int = 42) -> None:
+    """
+    Contraction hierarchy preprocessing, serialization and queries against full-graph dijkstra.
+
+    :param side: Side of the road-like grid graph (Integer, optional)
+    :param queries: Number of random source-target pairs (Integer, optional)
+    :param checks: Number of sources whose dijkstra results are compared with the hierarchy (Integer, optional)
+    :param seed: Initialization of the random number generator for reproducibility (Integer, optional)
+    """
+    graph = road_graph(side, seed)
+    rng = random.Random(seed)
+    nodes = list(graph.nodes)
+    pairs = [(rng.choice(nodes), rng.choice(nodes)) for _ in range(queries)]
+
+    hierarchy, build_time = timed(lambda: build_contraction_hierarchy(graph))
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "hierarchy.pickle")
+        _, save_time = timed(lambda: hierarchy.save(path))
+        size = os.path.getsize(path)
+        hierarchy, load_time = timed(lambda: ContractionHierarchy.load(path))
+
+    dijkstra_time = 0.0
+    for source in rng.sample(nodes, checks):
+        distances, elapsed = timed(lambda: dijkstra(graph, source))
+        dijkstra_time += elapsed
+        distances[source] = 0.0
+        if any(hierarchy.distance(source, target) != distances[target] for target in rng.sample(nodes, 100)):
+            raise AssertionError("Contraction hierarchy result differs from dijkstra")
+
+    stats: dict[str, int] = {}
+    settled = 0
+    start = time.perf_counter()
+    for source, target in pairs:
+        hierarchy.distance(source, target, stats=stats)
+        settled += stats["settled"]
+    query_time = (time.perf_counter() - start) / queries
+
+    print(f"\nContraction hierarchy of {graph}:")
+    print(f" {hierarchy}")
+    print(f" Preprocessing: {build_time:.1f} s, save: {save_time:.3f} s ({size / 2 ** 20:.1f} MiB), "
+          f"load: {load_time:.3f} s")
+    print(f" dijkstra:          {dijkstra_time / checks * 1000:>8.3f} ms per query")
+    print(f" hierarchy query:   {query_time * 1000:>8.3f} ms per query, {settled / queries:.0f} settled vertices "
+          f"(x{dijkstra_time / checks / query_time:.0f})")
+
+
+def benchmark_dynamic_updates(side: int = 150, updates: int = 200, seed: int = 42) -> None:
+    """
+    DynamicShortestPaths under random traffic updates (weight changes, road closures and reopenings)
+    against recomputing dijkstra after every update.
+
+    :param side: Side of the road-like grid graph (Integer, optional)
+    :param updates: Number of edge updates (Integer, optional)
+    :param seed: Initialization of the random number generator for reproducibility (Integer, optional)
+    """
+    graph = road_graph(side, seed)
+    rng = random.Random(seed)
+    source = (side // 2, side // 2)
+    paths = DynamicShortestPaths(graph, source)
+    closed: list[tuple[Any, Any, int]] = []
+
+    touched = {"increase": [], "decrease": [], "delete": [], "insert": []}
+    update_time = 0.0
+    for _ in range(updates):
+        kinds = ("increase", "decrease", "delete", "insert") if closed else ("increase", "decrease", "delete")
+        kind = rng.choice(kinds)
+        if kind == "insert":
+            u, v, weight = closed.pop(rng.randrange(len(closed)))
+            touched_number, elapsed = timed(lambda: paths.insert_edge(u, v, weight))
+        else:
+            u, v, weight = rng.choice(list(graph.edges(data="weight")))
+            if kind == "delete":
+                closed.append((u, v, weight))
+                touched_number, elapsed = timed(lambda: paths.delete_edge(u, v))
+            else:
+                new_weight = weight + rng.randint(1, 10) if kind == "increase" else rng.randint(1, max(1, weight))
+                touched_number, elapsed = timed(lambda: paths.update_weight(u, v, new_weight))
+        update_time += elapsed
+        touched[kind].append(touched_number)
+
+    _, full_time = timed(lambda: dijkstra(graph, source))
+    if not paths.verify():
+        raise AssertionError("DynamicShortestPaths differs from dijkstra")
+
+    print(f"\n{updates} edge updates on {graph}:")
+    print(" Update   | Count | Touched vertices, mean | max")
+    print("----------+-------+------------------------+--------")
+    for kind, numbers in touched.items():
+        if numbers:
+            print(f" {kind:<8} | {len(numbers):>5} | {sum(numbers) / len(numbers):>22.1f} | {max(numbers):>6,}")
+    print(f" Incremental: {update_time / updates * 1000:.3f} ms per update, "
+          f"full dijkstra: {full_time * 1000:.3f} ms per update (x{full_time * updates / update_time:.0f})")
+
+
+def benchmark_nearest(side: int = 300, k: int = 10, radius: float = 50.0, seed: int = 42) -> None:
+    """
+    iter_dijkstra with the k-nearest and radius cut-offs against the full dijkstra.
+
+    :param side: Side of the road-like grid graph (Integer, optional)
+    :param k: Number of the nearest vertices (Integer, optional)
+    :param radius: Search radius (Float, optional)
+    :param seed: Initialization of the random number generator for reproducibility (Integer, optional)
+    """
+    graph = road_graph(side, seed)
+    source = random.Random(seed).choice(list(graph.nodes))
+
+    distances, full_time = timed(lambda: dijkstra(graph, source))
+    distances[source] = 0.0
+    expected = sorted(distances.values())
+
+    print(f"\nNearest vertices on {graph}:")
+    print(" Query                | Time, ms | Settled | Reached")
+    print("----------------------+----------+---------+--------")
+    print(f" {'dijkstra':<20} | {full_time * 1000:>8.2f} | {len(distances):>7,} | {len(distances):>7,}")
+    for label, kwargs in ((f"k = {k}", {"k": k}), (f"radius {radius:g}", {"max_distance": radius})):
+        stats: dict[str, int] = {}
+        nearest, elapsed = timed(lambda: list(iter_dijkstra(graph, source, stats=stats, **kwargs)))
+        if [distance for _, distance in nearest] != expected[:len(nearest)] or \
+                any(distances[node] != distance for node, distance in nearest):
+            raise AssertionError("iter_dijkstra result differs from dijkstra")
+        print(f" {label:<20} | {elapsed * 1000:>8.2f} | {stats['settled']:>7,} | {stats['reached']:>7,}")
+
+
+BENCHMARKS: dict[str, Callable[..., None]] = {
+    "csr": benchmark_csr,
+    "p2p": benchmark_point_to_point,
+    "astar": benchmark_astar,
+    "many": benchmark_many_sources,
+    "cache": benchmark_cache,
+    "queues": benchmark_priority_queues,
+    "integer": benchmark_integer_weights,
+    "ch": benchmark_contraction_hierarchy,
+    "dynamic": benchmark_dynamic_updates,
+    "nearest": benchmark_nearest,
+}
+
+
+def benchmark_cli() -> None:
+    run_benchmark_cli(
+        "Shortest path benchmarks",
+        BENCHMARKS,
+        "-s", "--side",
+        dest="side",
+        default=300,
+        help_text="Side of the grid graph (default 300)",
+    )
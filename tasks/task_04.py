@@ -5,34 +5,173 @@ HomeWork Task 4
 """
 
 import argparse
+import random
+import sys
+import tracemalloc
+import uuid
+from typing import Any, Callable, Optional
 
-from .tree import tree_draw, heap_to_tree
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 
+from .benchmarking import run_benchmark_cli, timed
+from .tree import ArrayTree, Node, tree_draw, heap_to_tree, draw_tree_fast, draw_tree_networkx
 
-def heap_visualization(nodes_number: int = 15) -> None:
+
+def heap_visualization(nodes_number: int = 15, array_tree: bool = False, output: Optional[str] = None) -> None:
     """
     Creation and visualization of a binary tree from a min-heap with the specified number of vertices.
 
     :param nodes_number: Number of vertices (Integer, optional)
+    :param array_tree: Draw the heap array as an ArrayTree instead of creating the nodes (Boolean, optional)
+    :param output: Render to this PNG/SVG/PDF file instead of showing a window (String, optional)
     """
 
     # Min-heap as an array
     heap_array = [2 * n + 1 for n in range(nodes_number)]
 
-    root = heap_to_tree(heap_array)
+    root = ArrayTree(heap_array) if array_tree else heap_to_tree(heap_array)
 
-    tree_draw(root)
+    tree_draw(root, output=output)
 
 
 def cli() -> None:
     try:
         parser = argparse.ArgumentParser(description="Builds and visualizes a tree", epilog="Good bye!")
         parser.add_argument("-n", "--nodes", type=int, default=15, help="Number of nodes (default 15)")
+        parser.add_argument("-a", "--array", action="store_true", help="Array-backed tree without node objects")
+        parser.add_argument("-o", "--output", help="Render to a PNG/SVG/PDF file instead of showing a window")
 
         args = parser.parse_args()
 
-        heap_visualization(nodes_number=args.nodes)
+        heap_visualization(nodes_number=args.nodes, array_tree=args.array, output=args.output)
     except Exception as e:
         print(e)
 
     exit(0)
+
+
+# =================================================== Benchmarks ===================================================
+
+
+def benchmark_heap_to_tree(max_power: int = 6, seed: int = 42) -> None:
+    """
+    Scaling of heap_to_tree from 10^2 to 10^max_power elements: a sorted list (already a heap, verify-only
+    and heapify) and a shuffled one (heapify). Linear time shows as a constant time per element.
+
+    :param max_power: The largest heap has 10^max_power elements (Integer, optional)
+    :param seed: Initialization of the random number generator for reproducibility (Integer, optional)
+    """
+    rng = random.Random(seed)
+
+    print("\nheap_to_tree scaling:")
+    print(" Elements  | Input    | Mode      | Time, s | ns per element")
+    print("-----------+----------+-----------+---------+---------------")
+    for power in range(2, max_power + 1):
+        size = 10 ** power
+        ordered = [2 * n + 1 for n in range(size)]
+        shuffled = ordered[:]
+        rng.shuffle(shuffled)
+        for label, heap, heapify in (("sorted", ordered, False), ("sorted", ordered, True),
+                                     ("shuffled", shuffled, True)):
+            snapshot = heap[:]
+            root, elapsed = timed(lambda: heap_to_tree(heap, heapify=heapify))
+            if heap != snapshot or root.value != 1:
+                raise AssertionError("heap_to_tree changed the list or built a wrong root")
+            del root
+            mode = "heapify" if heapify else "verify"
+            print(f" {size:>9,} | {label:<8} | {mode:<9} | {elapsed:>7.3f} | {elapsed / size * 1e9:>14.0f}")
+
+
+class _UuidNode:
+    """
+    The former tree node (uuid4 key, instance dictionary), the baseline of benchmark_nodes
+    """
+
+    def __init__(self, value: Any, color: str = "#1C548C"):
+        self.left = None
+        self.right = None
+        self.value = value
+        self.color = color
+        self.key = uuid.uuid4()
+
+
+def benchmark_nodes(max_power: int = 6) -> None:
+    """
+    Construction time and memory per tree node: the former uuid4 node with __dict__ against Node
+    (__slots__, counter key). The node values are preallocated, so only the nodes themselves are measured.
+
+    :param max_power: Number of nodes is 10^max_power (Integer, optional)
+    """
+    size = 10 ** max_power
+    values = list(range(size))
+
+    print(f"\nConstruction of {size:,} tree nodes:")
+    print(" Node                 | Time, s | ns per node | Bytes per node")
+    print("----------------------+---------+-------------+---------------")
+    for label, node_class in (("uuid4 + __dict__", _UuidNode), ("counter + __slots__", Node)):
+        nodes, elapsed = timed(lambda: [node_class(value) for value in values])
+        del nodes
+
+        tracemalloc.start()
+        try:
+            nodes = [node_class(value) for value in values]
+            allocated, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        # Without the list of the nodes
+        per_node = (allocated - sys.getsizeof(nodes)) / size
+        del nodes
+        print(f" {label:<20} | {elapsed:>7.3f} | {elapsed / size * 1e9:>11.0f} | {per_node:>14.0f}")
+
+
+def benchmark_tree_draw(max_power: int = 6, networkx_max_power: int = 4) -> None:
+    """
+    Rendering time of a heap tree (into an off-screen Agg canvas) from 10^2 to 10^max_power nodes:
+    the networkx rendering of tree_draw against draw_tree_fast for a linked tree and for an ArrayTree.
+
+    :param max_power: The largest tree has 10^max_power nodes (Integer, optional)
+    :param networkx_max_power: The largest tree drawn with networkx has 10^networkx_max_power nodes
+        (Integer, optional)
+    """
+
+    def _render_(draw: Callable[[Any], None]) -> None:
+        figure = Figure(figsize=(15, 8))
+        canvas = FigureCanvasAgg(figure)
+        draw(figure.add_subplot())
+        canvas.draw()
+
+    print("\nTree rendering, s:")
+    print(" Nodes     | networkx | fast, Node | fast, ArrayTree")
+    print("-----------+----------+------------+----------------")
+    for power in range(2, max_power + 1):
+        size = 10 ** power
+        heap_array = [2 * n + 1 for n in range(size)]
+        root = heap_to_tree(heap_array, heapify=False)
+        array_tree = ArrayTree(heap_array)
+
+        networkx_cell = "-"
+        if power <= networkx_max_power:
+            _, elapsed = timed(lambda: _render_(lambda ax: draw_tree_networkx(ax, root)))
+            networkx_cell = f"{elapsed:.3f}"
+        _, node_time = timed(lambda: _render_(lambda ax: draw_tree_fast(ax, root)))
+        _, array_time = timed(lambda: _render_(lambda ax: draw_tree_fast(ax, array_tree)))
+        print(f" {size:>9,} | {networkx_cell:>8} | {node_time:>10.3f} | {array_time:>15.3f}")
+
+
+BENCHMARKS: dict[str, Callable[..., None]] = {
+    "heap_to_tree": benchmark_heap_to_tree,
+    "nodes": benchmark_nodes,
+    "draw": benchmark_tree_draw,
+}
+
+
+def benchmark_cli() -> None:
+    run_benchmark_cli(
+        "Tree building benchmarks",
+        BENCHMARKS,
+        "-p", "--power",
+        dest="max_power",
+        default=6,
+        help_text="Largest heap is 10^power (default 6)",
+    )
@@ -6,33 +6,118 @@ HomeWork Task 5
 
 import argparse
 import colorsys
+import tracemalloc
 from collections import deque
-from typing import Optional
+from typing import Any, Callable, Optional
 
-from .tree import Node, tree_draw, heap_to_tree
+from .benchmarking import run_benchmark_cli, timed
+from .plotting import offscreen_figure, output_format, output_name
+from .tree import ArrayTree, Node, tree_draw, heap_to_tree
 
 
-def tree_create(nodes_number: int = 15) -> Optional[Node]:
+def tree_create(nodes_number: int = 15, array_tree: bool = False) -> Optional[Node] | ArrayTree:
     """
     Creation of a binary tree from a min-heap with the specified number of vertices.
 
     :param nodes_number: Number of vertices (Integer, optional)
-    :return: Root of the tree or None, if the node is absent (Node, optional)
+    :param array_tree: Wrap the heap array into an ArrayTree instead of creating the nodes (Boolean, optional)
+    :return: Root of the tree or None, if the node is absent (Node, optional), or the array tree (ArrayTree)
     """
 
     # Min-heap as an array
     heap_array = [2 * n + 1 for n in range(nodes_number)]
+    if array_tree:
+        return ArrayTree(heap_array)
     return heap_to_tree(heap_array)
 
 
-def bfs(root: Optional[Node], colors: Optional[list[str]] = None) -> list[Node]:
+def _bfs_array(tree: ArrayTree, colors: Optional[list[str]]) -> list[int]:
+    """
+    BFS of an array tree: the level order is the order of the indices
+    """
+    result = list(range(len(tree)))
+    if colors:
+        for i in result:
+            tree.set_color(i, colors[i])
+    return result
+
+
+def _dfs_preorder_array(tree: ArrayTree, colors: Optional[list[str]]) -> list[int]:
+    """
+    DFS preorder of an array tree by indices
+    """
+    size = len(tree)
+    result: list[int] = []
+    stack = [0] if size else []
+    while stack:
+        i = stack.pop()
+        if colors:
+            tree.set_color(i, colors[len(result)])
+        result.append(i)
+        left = 2 * i + 1
+        if left + 1 < size:
+            stack.append(left + 1)
+            stack.append(left)
+        elif left < size:
+            stack.append(left)
+    return result
+
+
+def _dfs_inorder_array(tree: ArrayTree, colors: Optional[list[str]]) -> list[int]:
+    """
+    DFS inorder of an array tree by indices
+    """
+    size = len(tree)
+    result: list[int] = []
+    stack: list[int] = []
+    current = 0
+    while current < size or stack:
+        # Go as far left as possible
+        while current < size:
+            stack.append(current)
+            current = 2 * current + 1
+        current = stack.pop()
+        if colors:
+            tree.set_color(current, colors[len(result)])
+        result.append(current)
+        # Move to the right
+        current = 2 * current + 2
+    return result
+
+
+def _dfs_postorder_array(tree: ArrayTree, colors: Optional[list[str]]) -> list[int]:
+    """
+    DFS postorder of an array tree by indices
+    """
+    size = len(tree)
+    result: list[int] = []
+    stack = [(0, False)] if size else []
+    while stack:
+        i, visited = stack.pop()
+        if visited:
+            if colors:
+                tree.set_color(i, colors[len(result)])
+            result.append(i)
+        else:
+            stack.append((i, True))
+            left = 2 * i + 1
+            if left + 1 < size:
+                stack.append((left + 1, False))
+            if left < size:
+                stack.append((left, False))
+    return result
+
+
+def bfs(root: Optional[Node] | ArrayTree, colors: Optional[list[str]] = None) -> list[Node] | list[int]:
     """
     Breadth-first traversal of the tree (BFS).
 
-    :param root: Root node of the tree (Node, mandatory)
+    :param root: Root node of the tree or an array tree (Node | ArrayTree, mandatory)
     :param colors: List of colors (List of String, optional)
-    :return: List of vertices in traversal order (List of Node)
+    :return: List of vertices in traversal order (List of Node, or of indices for an ArrayTree)
     """
+    if isinstance(root, ArrayTree):
+        return _bfs_array(root, colors)
     if root is None:
         return []
 
@@ -53,14 +138,16 @@ def bfs(root: Optional[Node], colors: Optional[list[str]] = None) -> list[Node]:
     return result
 
 
-def dfs_preorder(root: Optional[Node], colors: Optional[list[str]] = None) -> list[Node]:
+def dfs_preorder(root: Optional[Node] | ArrayTree, colors: Optional[list[str]] = None) -> list[Node] | list[int]:
     """
     Depth-first traversal of the tree (DFS, preorder).
 
-    :param root: Root node of the tree (Node, mandatory)
+    :param root: Root node of the tree or an array tree (Node | ArrayTree, mandatory)
     :param colors: List of colors (List of String, optional)
-    :return: List of vertices in traversal order (List of Node)
+    :return: List of vertices in traversal order (List of Node, or of indices for an ArrayTree)
     """
+    if isinstance(root, ArrayTree):
+        return _dfs_preorder_array(root, colors)
     if root is None:
         return []
 
@@ -87,14 +174,16 @@ def dfs_preorder(root: Optional[Node], colors: Optional[list[str]] = None) -> li
     return result
 
 
-def dfs_inorder(root: Optional[Node], colors: Optional[list[str]] = None) -> list[Node]:
+def dfs_inorder(root: Optional[Node] | ArrayTree, colors: Optional[list[str]] = None) -> list[Node] | list[int]:
     """
     Depth-first traversal of the tree (DFS, inorder).
 
-    :param root: Root node of the tree (Node, mandatory)
+    :param root: Root node of the tree or an array tree (Node | ArrayTree, mandatory)
     :param colors: List of colors (List of String, optional)
-    :return: List of vertices in traversal order (List of Node)
+    :return: List of vertices in traversal order (List of Node, or of indices for an ArrayTree)
     """
+    if isinstance(root, ArrayTree):
+        return _dfs_inorder_array(root, colors)
     result: list[Node] = []
     stack: list[Node] = []
     current = root
@@ -121,14 +210,16 @@ def dfs_inorder(root: Optional[Node], colors: Optional[list[str]] = None) -> lis
     return result
 
 
-def dfs_postorder(root: Optional[Node], colors: Optional[list[str]] = None) -> list[Node]:
+def dfs_postorder(root: Optional[Node] | ArrayTree, colors: Optional[list[str]] = None) -> list[Node] | list[int]:
     """
     Depth-first traversal of the tree (DFS, postorder).
 
-    :param root: Root node of the tree (Node, mandatory)
+    :param root: Root node of the tree or an array tree (Node | ArrayTree, mandatory)
     :param colors: List of colors (List of String, optional)
-    :return: List of vertices in traversal order (List of Node)
+    :return: List of vertices in traversal order (List of Node, or of indices for an ArrayTree)
     """
+    if isinstance(root, ArrayTree):
+        return _dfs_postorder_array(root, colors)
     if root is None:
         return []
 
@@ -178,33 +269,119 @@ def generate_colors(colors_number: int = 15) -> list[str]:
     return colors
 
 
+def path_str(root: Optional[Node] | ArrayTree, path: list[Node] | list[int]) -> str:
+    """
+    Traversal path as a string (the values of the array tree nodes instead of their indices).
+
+    :param root: Root node of the tree or an array tree (Node | ArrayTree, mandatory)
+    :param path: Result of a traversal (List of Node or of indices)
+    :return: Path (String)
+    """
+    nodes: list[Any] = [f"Node({root.value(i)!r})" for i in path] if isinstance(root, ArrayTree) else path
+    return " -> ".join(str(n) for n in nodes)
+
+
 def cli() -> None:
     try:
         parser = argparse.ArgumentParser(description="Builds and visualizes a tree", epilog="Good bye!")
         parser.add_argument("-n", "--nodes", type=int, default=7, help="Number of nodes (default 7)")
+        parser.add_argument("-a", "--array", action="store_true", help="Array-backed tree without node objects")
+        parser.add_argument(
+            "-o", "--output",
+            help="Render to PNG/SVG/PDF files instead of showing windows, a suffix per traversal (tree_bfs.png, ...)"
+        )
 
         args = parser.parse_args()
 
-        root = tree_create(nodes_number=args.nodes)
+        root = tree_create(nodes_number=args.nodes, array_tree=args.array)
         colors: list[str] = generate_colors(args.nodes)
 
+        # One off-screen figure is reused for the four images in the output mode
+        figure = None
+        if args.output:
+            output_format(args.output)
+            figure = offscreen_figure((15, 8))
+
+        def _output_(suffix: str) -> Optional[str]:
+            return output_name(args.output, suffix) if args.output else None
+
         # Make BFS and visualize the result
-        print("BFS path:", " -> ".join(str(n) for n in bfs(root, colors=colors)))
-        tree_draw(root, title="BFS Traversal", last=False)
+        print("BFS path:", path_str(root, bfs(root, colors=colors)))
+        tree_draw(root, title="BFS Traversal", last=False, output=_output_("bfs"), figure=figure)
 
         # Make DFS preorder and visualize the result
-        print("DFS preorder path:", " -> ".join(str(n) for n in dfs_preorder(root, colors=colors)))
-        tree_draw(root, title="DFS PREORDER Traversal", last=False)
+        print("DFS preorder path:", path_str(root, dfs_preorder(root, colors=colors)))
+        tree_draw(root, title="DFS PREORDER Traversal", last=False, output=_output_("dfs_preorder"), figure=figure)
 
         # Make DFS inorder and visualize the result
-        print("DFS inorder path:", " -> ".join(str(n) for n in dfs_inorder(root, colors=colors)))
-        tree_draw(root, title="DFS INORDER Traversal", last=False)
+        print("DFS inorder path:", path_str(root, dfs_inorder(root, colors=colors)))
+        tree_draw(root, title="DFS INORDER Traversal", last=False, output=_output_("dfs_inorder"), figure=figure)
 
         # Make DFS postorder and visualize the result
-        print("DFS postorder path:", " -> ".join(str(n) for n in dfs_postorder(root, colors=colors)))
-        tree_draw(root, title="DFS POSTORDER Traversal", last=True)
+        print("DFS postorder path:", path_str(root, dfs_postorder(root, colors=colors)))
+        tree_draw(root, title="DFS POSTORDER Traversal", last=True, output=_output_("dfs_postorder"), figure=figure)
 
     except Exception as e:
         print(e)
 
     exit(0)
+
+
+# =================================================== Benchmarks ===================================================
+
+
+def benchmark_traversals(max_power: int = 6) -> None:
+    """
+    Building and traversing a heap of 10^max_power elements as a linked Node tree and as an ArrayTree.
+
+    :param max_power: Number of elements is 10^max_power (Integer, optional)
+    """
+    size = 10 ** max_power
+    heap_array = [2 * n + 1 for n in range(size)]
+    traversals = {"bfs": bfs, "dfs_preorder": dfs_preorder, "dfs_inorder": dfs_inorder, "dfs_postorder": dfs_postorder}
+
+    print(f"\nTree of {size:,} elements:")
+    print(" Tree      | Build, s | Build memory, MiB | " + " | ".join(f"{name:>13}" for name in traversals))
+    print("-----------+----------+-------------------+-" + "-+-".join("-" * 13 for _ in traversals))
+    results: dict[str, list[list[Any]]] = {}
+    for label, build in (("Node", lambda: heap_to_tree(heap_array, heapify=False)),
+                         ("ArrayTree", lambda: ArrayTree(heap_array))):
+        root, build_time = timed(build)
+        del root
+        tracemalloc.start()
+        try:
+            root = build()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        times = []
+        results[label] = []
+        for traversal in traversals.values():
+            path, elapsed = timed(lambda: traversal(root))
+            times.append(elapsed)
+            results[label].append([root.value(i) for i in path] if isinstance(root, ArrayTree)
+                                  else [node.value for node in path])
+            del path
+        del root
+        print(f" {label:<9} | {build_time:>8.3f} | {peak / 2 ** 20:>17.1f} | "
+              + " | ".join(f"{elapsed:>11.3f} s" for elapsed in times))
+
+    if results["Node"] != results["ArrayTree"]:
+        raise AssertionError("The traversals of Node and ArrayTree differ")
+
+
+BENCHMARKS: dict[str, Callable[..., None]] = {
+    "traversals": benchmark_traversals,
+}
+
+
+def benchmark_cli() -> None:
+    run_benchmark_cli(
+        "Tree traversal benchmarks",
+        BENCHMARKS,
+        "-p", "--power",
+        dest="max_power",
+        default=6,
+        help_text="Tree size is 10^power (default 6)",
+    )
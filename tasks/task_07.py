@@ -6,9 +6,11 @@ HomeWork Task 7
 
 import argparse
 import collections
+from typing import Optional
 
 import numpy as np
-import matplotlib.pyplot as plt
+
+from .plotting import figure_output
 
 
 def theoretical_probabilities() -> dict[int, float]:
@@ -40,27 +42,28 @@ def print_table(counts: dict[int, int], probabilities: dict[int, float]) -> None
         print(f"{s:>4} | {counts[s]:>10} | {p_mc:>14.2%} | {p_theory:>18.2%} | {p_mc - p_theory:>= .6f}")
 
 
-def plot_probabilities(probabilities: dict[int, float]) -> None:
+def plot_probabilities(probabilities: dict[int, float], output: Optional[str] = None) -> None:
     """
     Probability chart: Monte Carlo (bars) + theory (line).
 
     :param probabilities: probabilities for sums {2..12} (Dictionary, mandatory)
+    :param output: Render to this PNG/SVG/PDF file instead of showing a window (String, optional)
     """
     s_vals = np.arange(2, 13, dtype=np.int16)
     p_mc = np.array([probabilities[int(s)] for s in s_vals])
     p_th = np.array([theoretical_probabilities()[int(s)] for s in s_vals])
 
-    plt.figure(figsize=(10, 6))
-    plt.bar(s_vals, p_mc, width=0.3, label="MC", color="#5B8FF9")
-    plt.plot(s_vals, p_th, "o-", label="Теорія", color="#EE6666")
-    plt.xticks(s_vals)
-    plt.xlabel("Sum on two dice")
-    plt.ylabel("Probability")
-    plt.title("Probabilities of sums (Monte Carlo vs Theory)")
-    plt.grid(alpha=0.3, linestyle="--")
-    plt.legend()
-    plt.tight_layout()
-    plt.show()
+    with figure_output((10, 6), output=output) as figure:
+        ax = figure.add_subplot()
+        ax.bar(s_vals, p_mc, width=0.3, label="MC", color="#5B8FF9")
+        ax.plot(s_vals, p_th, "o-", label="Теорія", color="#EE6666")
+        ax.set_xticks(s_vals)
+        ax.set_xlabel("Sum on two dice")
+        ax.set_ylabel("Probability")
+        ax.set_title("Probabilities of sums (Monte Carlo vs Theory)")
+        ax.grid(alpha=0.3, linestyle="--")
+        ax.legend()
+        figure.tight_layout()
 
 
 def dice_simulation(simulation_numbers: int, seed: int = 42) -> tuple[dict[int, int], dict[int, float]]:
@@ -95,12 +98,13 @@ def cli() -> None:
             epilog="Good bye!",
         )
         parser.add_argument("-r", "--rolls", type=int, default=1_000_000, help="Number of rolls (default 1000000)")
+        parser.add_argument("-o", "--output", help="Render the chart to a PNG/SVG/PDF file instead of showing a window")
 
         args = parser.parse_args()
 
         counts, probabilities = dice_simulation(args.rolls)
         print_table(counts, probabilities)
-        plot_probabilities(probabilities)
+        plot_probabilities(probabilities, output=args.output)
     except Exception as e:
         print(e)
 
@@ -5,30 +5,120 @@ Knuth-Morris-Pratt algorithm implementation
 """
 
 import heapq
-import uuid
+import itertools
 from typing import Optional, Any, Union
 
+import numpy as np
 import networkx as nx
-import matplotlib.pyplot as plt
+from matplotlib.axes import Axes
+from matplotlib.collections import PathCollection
+from matplotlib.figure import Figure
+from matplotlib.path import Path
+
+from .plotting import figure_output
+
+
+# tree_draw switches to the vectorized rendering (draw_tree_fast) above this number of nodes
+FAST_DRAW_THRESHOLD = 1_000
+
+# draw_tree_fast drops the labels above this number of nodes
+LABELS_THRESHOLD = 200
+
+# Unique node keys (vertices of the networkx graph in tree_draw), cheaper than uuid4
+_node_keys = itertools.count()
 
 
 class Node:
+    __slots__ = ("left", "right", "value", "color", "key")
 
     def __init__(self, value: Any, color: str = "#1C548C"):
         self.left = None
         self.right = None
         self.value = value
         self.color = color
-        self.key = uuid.uuid4()
+        self.key = next(_node_keys)
 
     def __repr__(self) -> str:
         return f"Node({self.value!r})"
 
 
+class ArrayTree:
+    """
+    Implicit complete binary tree over a list or NumPy array in the heap layout: the node i has the children
+    2i+1 and 2i+2 and the parent (i-1)//2. The nodes are indices, no node objects are created;
+    the colors (set by the traversals) are stored per index only when assigned.
+    """
+    __slots__ = ("values", "colors", "default_color")
+
+    def __init__(self, values: Any, default_color: str = "#1C548C"):
+        """
+        :param values: Values in the heap layout, not copied (List or np.ndarray, mandatory)
+        :param default_color: Color of the nodes without an assigned one (String, optional)
+        """
+        self.values = values
+        self.colors: Optional[list[Optional[str]]] = None
+        self.default_color = default_color
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __repr__(self) -> str:
+        return f"ArrayTree({len(self.values)} nodes)"
+
+    @property
+    def root(self) -> Optional[int]:
+        """
+        Index of the root or None for an empty tree
+        """
+        return 0 if len(self.values) else None
+
+    def left(self, i: int) -> Optional[int]:
+        """
+        Index of the left child or None
+        """
+        j = 2 * i + 1
+        return j if j < len(self.values) else None
+
+    def right(self, i: int) -> Optional[int]:
+        """
+        Index of the right child or None
+        """
+        j = 2 * i + 2
+        return j if j < len(self.values) else None
+
+    def parent(self, i: int) -> Optional[int]:
+        """
+        Index of the parent or None for the root
+        """
+        return (i - 1) // 2 if i > 0 else None
+
+    def value(self, i: int) -> Any:
+        """
+        Value of the node
+        """
+        return self.values[i]
+
+    def color(self, i: int) -> str:
+        """
+        Color of the node
+        """
+        if self.colors is None or self.colors[i] is None:
+            return self.default_color
+        return self.colors[i]
+
+    def set_color(self, i: int, color: str) -> None:
+        """
+        Assign a color to the node
+        """
+        if self.colors is None:
+            self.colors = [None] * len(self.values)
+        self.colors[i] = color
+
+
 def edges_add(
         graph: Union[nx.Graph, nx.DiGraph],
         node: Node,
-        pos: dict[uuid.UUID, tuple[int, int]],
+        pos: dict[int, tuple[int, int]],
         x: int = 0,
         y: int = 0,
         layer: int = 1,
@@ -60,23 +150,137 @@ def edges_add(
     return graph
 
 
-def tree_draw(root: Node, title: Optional[str] = None, last: bool = True) -> None:
+def array_tree_graph(tree: ArrayTree) -> tuple[nx.DiGraph, dict[int, tuple[float, float]]]:
     """
-    Tree visualization.
+    Graph of an ArrayTree with the same layout as edges_add, computed from the indices:
+    the node i at the depth d and the position p = i - (2^d - 1) within its level is at ((2p + 1) / 2^d - 1, -d).
 
-    :param root: Root node of the tree (Node, mandatory)
-    :param title: Figure/chart title (String, optional)
-    :param last: Flag of whether it is the last figure/chart in the set or not (Boolean, optional)
+    :param tree: Array-backed tree (ArrayTree, mandatory)
+    :return: A graph representing the tree (vertices are indices) and the positions (Tuple)
+    """
+    graph = nx.DiGraph()
+    pos = {}
+    for i in range(len(tree)):
+        graph.add_node(i, color=tree.color(i), label=tree.value(i))
+        if i:
+            graph.add_edge((i - 1) // 2, i)
+        depth = (i + 1).bit_length() - 1
+        position = i + 1 - 2 ** depth
+        pos[i] = ((2 * position + 1) / 2 ** depth - 1, -depth)
+    return graph, pos
+
+
+def tree_layout(root: Node | ArrayTree) -> tuple[np.ndarray, np.ndarray, np.ndarray, Any, Any]:
+    """
+    Node positions of the tree as arrays, the same layout as edges_add. For an ArrayTree they are computed
+    in closed form from the indices: the node i at the depth d and the position p = i - (2^d - 1) within
+    its level is at ((2p + 1) / 2^d - 1, -d). A linked tree is walked once without recursion.
+
+    :param root: Root node of the tree or an array-backed tree (Node | ArrayTree, mandatory)
+    :return: x, y, the index of the parent of every node (-1 for the root), values and colors (Tuple)
+    """
+    if isinstance(root, ArrayTree):
+        indices = np.arange(len(root))
+        # Depth = floor(log2(i + 1)), exactly
+        depth = np.frexp(indices + 1)[1] - 1
+        level_start = np.ldexp(1.0, depth)
+        x = (2 * (indices + 1 - level_start) + 1) / level_start - 1
+        y = -depth.astype(float)
+        parents = (indices - 1) // 2
+        if root.colors is None:
+            colors: Any = root.default_color
+        else:
+            colors = [root.default_color if color is None else color for color in root.colors]
+        return x, y, parents, root.values, colors
+
+    xs: list[float] = []
+    ys: list[float] = []
+    parents_list: list[int] = []
+    values: list[Any] = []
+    colors = []
+    # (node, x, depth, parent index)
+    stack: list[tuple[Node, float, int, int]] = [(root, 0.0, 0, -1)] if root is not None else []
+    while stack:
+        node, x, depth, parent = stack.pop()
+        index = len(xs)
+        xs.append(x)
+        ys.append(-depth)
+        parents_list.append(parent)
+        values.append(node.value)
+        colors.append(node.color)
+        shift = 1 / 2 ** (depth + 1)
+        if node.right:
+            stack.append((node.right, x + shift, depth + 1, index))
+        if node.left:
+            stack.append((node.left, x - shift, depth + 1, index))
+    return np.array(xs), np.array(ys, dtype=float), np.array(parents_list, dtype=int), values, colors
+
+
+def draw_tree_fast(ax: Axes, root: Node | ArrayTree, labels: Optional[bool] = None) -> None:
+    """
+    Vectorized tree rendering without networkx: the edges are a single collection with one compound path
+    (a LineCollection creates a Path object per segment, which dominates for large trees) and the nodes are
+    a single scatter; the node size follows the width of the lowest level.
+
+    :param ax: Axes to draw on (Axes, mandatory)
+    :param root: Root node of the tree or an array-backed tree (Node | ArrayTree, mandatory)
+    :param labels: Draw the values; by default only up to LABELS_THRESHOLD nodes (Boolean, optional)
+    """
+    x, y, parents, values, colors = tree_layout(root)
+    nodes_number = len(x)
+    if not nodes_number:
+        ax.set_axis_off()
+        return
+
+    # Distance between the nodes of the lowest level in points: the node diameter is 80% of it (at most as in
+    # tree_draw), the edges get thinner with it
+    width_points = ax.figure.get_figwidth() * 72 * ax.get_position().width
+    spacing = width_points / (2 ** int(-y.min()) + 1)
+    node_size = min(2500.0, max(0.05, (0.8 * spacing) ** 2))
+    line_width = min(1.0, max(0.3, spacing / 2))
+
+    # Edges: "move to the parent, line to the child" for every child
+    children = np.flatnonzero(parents >= 0)
+    vertices = np.empty((2 * len(children), 2))
+    vertices[0::2, 0] = x[parents[children]]
+    vertices[0::2, 1] = y[parents[children]]
+    vertices[1::2, 0] = x[children]
+    vertices[1::2, 1] = y[children]
+    codes = np.tile(np.array([Path.MOVETO, Path.LINETO], dtype=Path.code_type), len(children))
+    ax.add_collection(PathCollection([Path(vertices, codes)], facecolors="none", edgecolors="black",
+                                     linewidths=line_width))
+    ax.scatter(x, y, s=node_size, c=colors, zorder=2, linewidths=0)
+
+    if labels is None:
+        labels = nodes_number <= LABELS_THRESHOLD
+    if labels:
+        font_size = min(12.0, max(4.0, node_size ** 0.5 / 4))
+        for node_x, node_y, value in zip(x, y, values):
+            ax.text(node_x, node_y, str(value), ha="center", va="center", color="white", fontweight="bold",
+                    fontsize=font_size, zorder=3)
+
+    ax.set_xlim(-1.05, 1.05)
+    ax.set_ylim(y.min() - 0.5, 0.5)
+    ax.set_axis_off()
+
+
+def draw_tree_networkx(ax: Axes, root: Node | ArrayTree) -> None:
     """
-    tree = nx.DiGraph()
-    pos = {root.key: (0, 0)}
-    tree = edges_add(tree, root, pos)
+    Tree rendering with networkx: one artist per node (tree_draw uses it up to FAST_DRAW_THRESHOLD nodes)
+
+    :param ax: Axes to draw on (Axes, mandatory)
+    :param root: Root node of the tree or an array-backed tree (Node | ArrayTree, mandatory)
+    """
+    if isinstance(root, ArrayTree):
+        tree, pos = array_tree_graph(root)
+    else:
+        tree = nx.DiGraph()
+        pos = {root.key: (0, 0)}
+        tree = edges_add(tree, root, pos)
 
     colors = [color for node_id, color in nx.get_node_attributes(tree, "color").items()]
     labels = nx.get_node_attributes(tree, "label")
 
-    plt.figure(figsize=(15, 8))
-    ax = plt.gca()
     nx.draw(
         tree,
         ax=ax,
@@ -88,25 +292,88 @@ def tree_draw(root: Node, title: Optional[str] = None, last: bool = True) -> Non
         font_weight='bold',
         node_color=colors,
     )
-    if title:
-        ax.set_title(title, fontweight="bold", fontsize="20")
-    plt.show(block=last)
 
 
-def heap_to_tree(heap: list[Any], i: int = 0) -> Optional[Node]:
+def tree_draw(
+        root: Node | ArrayTree,
+        title: Optional[str] = None,
+        last: bool = True,
+        fast: Optional[bool] = None,
+        output: Optional[str] = None,
+        figure: Optional[Figure] = None,
+) -> None:
     """
-    Builds a tree from a heap array (complete binary heap).
+    Tree visualization.
+
+    :param root: Root node of the tree or an array-backed tree (Node | ArrayTree, mandatory)
+    :param title: Figure/chart title (String, optional)
+    :param last: Flag of whether it is the last figure/chart in the set or not (Boolean, optional)
+    :param fast: Vectorized rendering (draw_tree_fast); by default above FAST_DRAW_THRESHOLD nodes
+        (Boolean, optional)
+    :param output: Render to this PNG/SVG/PDF file instead of showing a window (String, optional)
+    :param figure: Off-screen figure to reuse in the output mode (Figure, optional)
+    """
+    if fast is None:
+        fast = len(root) > FAST_DRAW_THRESHOLD if isinstance(root, ArrayTree) else \
+            _tree_size(root, FAST_DRAW_THRESHOLD + 1) > FAST_DRAW_THRESHOLD
+
+    with figure_output((15, 8), output=output, block=last, figure=figure) as fig:
+        ax = fig.add_subplot()
+        if fast:
+            draw_tree_fast(ax, root)
+        else:
+            draw_tree_networkx(ax, root)
+        if title:
+            ax.set_title(title, fontweight="bold", fontsize="20")
+
+
+def _tree_size(root: Optional[Node], limit: int) -> int:
+    """
+    Number of nodes of a linked tree, counted up to the limit
+    """
+    size = 0
+    stack = [root] if root is not None else []
+    while stack and size < limit:
+        node = stack.pop()
+        size += 1
+        if node.left:
+            stack.append(node.left)
+        if node.right:
+            stack.append(node.right)
+    return size
+
+
+def heap_to_tree(heap: list[Any], i: int = 0, heapify: bool = True) -> Optional[Node]:
+    """
+    Builds a tree from a heap array (complete binary heap) in O(n) without recursion.
+    The caller's list is not changed: it is heapified once as a copy, or only verified with heapify=False.
 
     :param heap: Heap list (List of any values)
-    :param i: Index of the current node (Integer, optional)
+    :param i: Index of the root node (Integer, optional)
+    :param heapify: Heapify a copy of the list; otherwise it must already be a min-heap (Boolean, optional)
     :return: Root of the tree or None, if the node is absent (Node, optional)
     """
-    if i >= len(heap):
-        return None
+    if heapify:
+        heap = list(heap)
+        heapq.heapify(heap)
+    else:
+        for j in range(1, len(heap)):
+            if heap[j] < heap[(j - 1) // 2]:
+                raise ValueError(f"The list is not a min-heap: heap[{j}] < heap[{(j - 1) // 2}]")
 
-    heapq.heapify(heap)
+    size = len(heap)
+    if i >= size:
+        return None
 
     root = Node(heap[i])
-    root.left = heap_to_tree(heap, 2 * i + 1)
-    root.right = heap_to_tree(heap, 2 * i + 2)
+    stack = [(i, root)]
+    while stack:
+        j, node = stack.pop()
+        left, right = 2 * j + 1, 2 * j + 2
+        if left < size:
+            node.left = Node(heap[left])
+            stack.append((left, node.left))
+        if right < size:
+            node.right = Node(heap[right])
+            stack.append((right, node.right))
     return root
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+"""
+Tests for Task 1 (python -m unittest)
+"""
+
+import copy
+import unittest
+
+from tasks.task_01 import CompactLinkedList, DoublyLinkedList, LinkedList, Node, merge_sorted_lists
+
+
+def _backward(dll: DoublyLinkedList) -> list:
+    """
+    Values of a doubly linked list read through the prev references
+    """
+    values = []
+    node = dll.tail
+    for _ in range(len(dll)):
+        values.append(node.data)
+        node = node.prev
+    return values
+
+
+class MergeSortedListsTest(unittest.TestCase):
+
+    def test_doubly_linked_lists(self) -> None:
+        dll1 = DoublyLinkedList.from_iterable([1, 4, 4, 9])
+        dll2 = DoublyLinkedList.from_iterable([0, 4, 10])
+        merged = merge_sorted_lists(dll1, dll2)
+        self.assertIsInstance(merged, DoublyLinkedList)
+        self.assertEqual(merged.to_list(), [0, 1, 4, 4, 4, 9, 10])
+        self.assertEqual(_backward(merged), [10, 9, 4, 4, 4, 1, 0])
+        self.assertEqual((len(dll1), len(dll2)), (0, 0))
+
+    def test_doubly_linked_lists_reverse(self) -> None:
+        merged = merge_sorted_lists(
+            DoublyLinkedList.from_iterable([9, 3]), DoublyLinkedList.from_iterable([5, 1]), reverse=True
+        )
+        self.assertEqual(merged.to_list(), [9, 5, 3, 1])
+
+    def test_mixed_types(self) -> None:
+        for ll1, ll2 in (
+                (LinkedList.from_iterable([1]), DoublyLinkedList.from_iterable([2])),
+                (DoublyLinkedList.from_iterable([1]), LinkedList.from_iterable([2])),
+                (LinkedList.from_iterable([1]), CompactLinkedList.from_iterable([2])),
+        ):
+            with self.subTest(types=(type(ll1).__name__, type(ll2).__name__)):
+                with self.assertRaises(TypeError):
+                    merge_sorted_lists(ll1, ll2)
+                self.assertEqual((ll1.to_list(), ll2.to_list()), ([1], [2]))
+
+
+class LinkedListTest(unittest.TestCase):
+
+    def test_insert_after_foreign_node(self) -> None:
+        for indexed in (False, True):
+            with self.subTest(indexed=indexed):
+                ll = LinkedList.from_iterable([1, 2, 3], indexed=indexed)
+                other = LinkedList.from_iterable([7, 8])
+                ll.insert_after(other.head, 5)
+                ll.insert_after(Node(0), 6)
+                self.assertEqual((ll.to_list(), len(ll)), ([1, 2, 3], 3))
+                self.assertEqual((other.to_list(), len(other)), ([7, 8], 2))
+                ll.insert_after(ll.head, 4)
+                self.assertEqual((ll.to_list(), len(ll)), ([1, 4, 2, 3], 4))
+
+    def test_indexed_extend_with_duplicates(self) -> None:
+        ll = LinkedList.from_iterable([1, 2, 1, 2, 1], indexed=True)
+        ll.extend([2, 1])
+        self.assertFalse(ll._stale)
+        self.assertIs(ll.find(1), ll.head)
+        self.assertTrue(ll.delete(2))
+        self.assertEqual(ll.to_list(), [1, 1, 2, 1, 2, 1])
+
+    def test_deepcopy_of_a_list_containing_itself(self) -> None:
+        for list_class in (LinkedList, DoublyLinkedList):
+            with self.subTest(list_class=list_class.__name__):
+                ll = list_class.from_iterable([[1]])
+                ll.append(ll)
+                ll.append([ll])
+                copied = copy.deepcopy(ll)
+                values = copied.to_list()
+                self.assertIs(values[1], copied)
+                self.assertIs(values[2][0], copied)
+                self.assertEqual(values[0], [1])
+                self.assertIsNot(values[0], ll.to_list()[0])
+
+
+class DoublyLinkedListTest(unittest.TestCase):
+
+    def test_foreign_node(self) -> None:
+        dll = DoublyLinkedList.from_iterable([1, 2, 3])
+        other = DoublyLinkedList.from_iterable([7, 8])
+        self.assertIsNone(dll.insert_after(other.head, 5))
+        self.assertIsNone(dll.insert_before(other.head, 5))
+        with self.assertRaises(ValueError):
+            dll.remove(other.head)
+        self.assertEqual((dll.to_list(), len(dll)), ([1, 2, 3], 3))
+        self.assertEqual((other.to_list(), len(other)), ([7, 8], 2))
+
+    def test_removed_node(self) -> None:
+        dll = DoublyLinkedList.from_iterable([1, 2])
+        node = dll.head
+        dll.remove(node)
+        with self.assertRaises(ValueError):
+            dll.remove(node)
+        self.assertIsNone(dll.insert_after(node, 3))
+        self.assertEqual((dll.to_list(), len(dll)), ([2], 1))
+
+    def test_reverse_recursive(self) -> None:
+        dll = DoublyLinkedList.from_iterable([1, 2, 3])
+        dll.reverse_recursive()
+        self.assertEqual(dll.to_list(), [3, 2, 1])
+        self.assertEqual(_backward(dll), [1, 2, 3])
+        dll.remove(dll.head)
+        self.assertEqual(dll.to_list(), [2, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()